@@ -0,0 +1,41 @@
+"""add schedules user_id/date/start_time partial index
+
+Revision ID: 3c1f5a7e9b2d
+Revises: fe8bce9ff145
+Create Date: 2026-01-05 09:12:41.583021
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f5a7e9b2d'
+down_revision: Union[str, None] = 'fe8bce9ff145'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 월/기간 캘린더 조회: user_id + date 범위 + start_time 정렬 (삭제되지 않은 일정만)
+    op.create_index(
+        'ix_schedules_user_id_date_start_time_active',
+        'schedules',
+        ['user_id', 'date', 'start_time'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+    # 배치 중복 실행 체크: job_name + created_at 범위
+    op.create_index(
+        'ix_job_histories_job_name_created_at',
+        'job_histories',
+        ['job_name', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_histories_job_name_created_at', table_name='job_histories')
+    op.drop_index('ix_schedules_user_id_date_start_time_active', table_name='schedules')
@@ -1,12 +1,26 @@
+import json
+import weakref
+from typing import AsyncIterator
 from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi.responses import StreamingResponse
 from app.schemas.ai import AITextRequest, AIParsedSchedule, AIParseResponse
-from app.dependencies import CurrentUserDep, AIServiceDep
+from app.dependencies import CurrentUserIdDep, AIServiceDep, DBSessionDep, AIAdmissionDep
 from app.core.exceptions import AIConnectionError, AIParsingError
 
 from loguru import logger
 
 router = APIRouter(prefix="/ai", tags=["AI"])
 
+def _to_parse_response(result: str | AIParsedSchedule) -> AIParseResponse:
+    """AIService 처리 결과를 API 응답 스키마로 변환"""
+    if isinstance(result, AIParsedSchedule):
+        return AIParseResponse(is_complete=True, data=result, question=None)
+    return AIParseResponse(is_complete=False, data=None, question=result)
+
+def _format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식의 메세지 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 @router.post(
     "/parse",
     response_model=AIParseResponse,
@@ -16,34 +30,100 @@ router = APIRouter(prefix="/ai", tags=["AI"])
 )
 async def parse_text_with_ai(
     request: AITextRequest,
-    user: CurrentUserDep,
-    ai_serivce: AIServiceDep
+    user_id: CurrentUserIdDep,
+    ai_serivce: AIServiceDep,
+    admission: AIAdmissionDep
 ) -> AIParseResponse:
     """
     사용자 텍스트를 AI에게 전달하여 일정을 파싱하고 그 결과를 반환합니다.
     AI가 추가 정보가 필요할 경우 질문을 반환
+    (사용자별 한도 초과 시 429, AI 처리 용량 초과 시 503 + Retry-After)
     """
     logger.info("========= /parse 진입 ===================")
-    try:
-        result = await ai_serivce.process_chat(user.id, request.text)
-        logger.debug(f"Parsing data : {result}")
-        if isinstance(result, AIParsedSchedule):
-            return AIParseResponse(is_complete=True, data=result, question=None)
-        else:
-            return AIParseResponse(is_complete=False, data=None, question=result)
+    async with admission.admit(user_id):
+        try:
+            result = await ai_serivce.process_chat(user_id, request.text)
+            logger.debug(f"Parsing data : {result}")
+            return _to_parse_response(result)
+        
+        except AIConnectionError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"AI 서비스 연결 오류: {e}"
+            )
+        except AIParsingError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"AI 응답 파싱 오류: {e}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"예상치 못한 서버 오류가 발생했습니다.: {e}"
+            )
+
+@router.post(
+    "/parse/stream",
+    summary="AI 응답 스트리밍 (SSE)",
+    description=(
+        "/parse와 동일하게 처리하되, 일반 대화 응답을 생성되는 즉시 Server-Sent Events로 전달합니다.\n\n"
+        "- `token`: 응답 토큰 (`{\"text\": ...}`)\n"
+        "- `done`: 최종 결과 (/parse 응답과 같은 형식)\n"
+        "- `error`: 처리 중 오류 (`{\"detail\": ...}`)"
+    ),
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK
+)
+async def stream_text_with_ai(
+    request: AITextRequest,
+    user_id: CurrentUserIdDep,
+    ai_service: AIServiceDep,
+    db: DBSessionDep,
+    admission: AIAdmissionDep
+) -> StreamingResponse:
+    """
+    사용자 텍스트를 AI에게 전달하고 응답을 토큰 단위로 스트리밍합니다.
+    스트림 본문은 의존성(get_db) 정리 이후에 실행되므로, 일정 변경 등은 스트림이 끝날 때 직접 커밋합니다.
+    (대화 내역은 설정에 따라 스트림 종료 후 BackgroundTasks에서 별도 세션으로 저장)
+    
+    수용 제어는 응답 헤더 전송 전에 확인하여 429/503으로 바로 거절하고,
+    실행 권한은 스트림이 끝날 때(또는 시작 전에 연결이 끊겨 스트림이 정리될 때) 반환합니다.
+    """
+    logger.info("========= /parse/stream 진입 ===================")
+    ticket = await admission.acquire(user_id)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        committed = False
+        try:
+            async for event, payload in ai_service.stream_chat(user_id, request.text):
+                if event == "token":
+                    yield _format_sse("token", {"text": payload})
+                else:
+                    yield _format_sse("done", _to_parse_response(payload).model_dump(mode="json"))
+            await db.commit()
+            committed = True
+        
+        except AIConnectionError as e:
+            await db.rollback()
+            yield _format_sse("error", {"detail": f"AI 서비스 연결 오류: {e}"})
+        except Exception as e:
+            await db.rollback()
+            yield _format_sse("error", {"detail": f"예상치 못한 서버 오류가 발생했습니다.: {e}"})
+        finally:
+            # 클라이언트 연결 끊김(GeneratorExit/CancelledError)으로 중단된 경우에도
+            # 커밋되지 않은 변경은 되돌리고 연결을 반환 (get_db는 이미 정리되어 이 세션을 관리하지 않음)
+            try:
+                if not committed:
+                    await db.rollback()
+                await db.close()
+            finally:
+                ticket.release()
     
-    except AIConnectionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"AI 서비스 연결 오류: {e}"
-        )
-    except AIParsingError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"AI 응답 파싱 오류: {e}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"예상치 못한 서버 오류가 발생했습니다.: {e}"
-        )
\ No newline at end of file
+    stream = event_stream()
+    # 스트림이 한 번도 시작되지 않고 버려져도 실행 권한이 반환되도록 보장
+    weakref.finalize(stream, ticket.release)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -6,7 +6,7 @@ from loguru import logger
 from app.dependencies import AuthServiceDep, CurrentUserDep
 from app.schemas.user import UserResponse, UserCreate
 from app.schemas.auth import AuthLogin
-from app.core.limiter import limiter
+from app.core.limiter import limiter, get_ip_rate_limit_key
 from app.core.exceptions import CredentialException
 from app.config import settings
 
@@ -43,7 +43,8 @@ async def register(
     summary="로그인 (Access/Refresh Token 발급)",
     description="사용자 이메일(username)과 비밀번호로 로그인하여 토큰을 발급받습니다."
 )
-@limiter.limit("5/minute")
+# 로그인 시도는 쿠키(이전 로그인의 Access Token)와 관계없이 IP 기준으로 제한
+@limiter.limit("5/minute", key_func=get_ip_rate_limit_key)
 async def login(
     request: Request, 
     response: Response,
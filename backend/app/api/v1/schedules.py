@@ -1,10 +1,12 @@
 from datetime import date
 from loguru import logger
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Request, Response, status
 
 from app.dependencies import CurrentUserDep, ScheuduleServiceDep
 from app.services.schedule_service import ScheduleService
-from app.schemas.schedule import ScheduleResponse, ScheduleCreate, ScheduleUpdate
+from app.schemas.schedule import (
+    ScheduleResponse, ScheduleRangeResponse, ScheduleCreate, ScheduleUpdate, schedule_rows_to_dicts, dumps_json
+)
 from app.models.user import User
 
 router = APIRouter(
@@ -12,6 +14,19 @@ router = APIRouter(
     tags = ["schedules"],
 )
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록 또는 *)에 ETag가 포함되어 있는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+    
+    return any(_opaque(tag) == _opaque(etag) for tag in if_none_match.split(","))
+
 @router.post(
     "/",
     response_model=ScheduleResponse,
@@ -31,18 +46,53 @@ async def create_schedule(
 @router.get(
     "/",
     response_model=list[ScheduleResponse],
-    summary="사용자 선택한 날짜 표기에 따라 일정 조회"
+    summary="사용자 선택한 날짜 표기에 따라 일정 조회",
+    description="응답에 ETag를 포함하며, If-None-Match가 현재 ETag와 같으면 본문 없이 304 Not Modified를 반환합니다.",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "월 일정이 변경되지 않음"}}
 )
 async def get_schedules(
+    request: Request,
     user: CurrentUserDep,
     service: ScheuduleServiceDep,
-    year: int,
-    month: int
+    year: int = Query(ge=1, le=9998),
+    month: int = Query(ge=1, le=12)
 ) -> list[ScheduleResponse]:
     """현재 사용자의 모든 일정을 조회"""
     logger.info(f"월별 일정 조회 엔드포인트 진입 -->  Year:{year}, Month: {month}")
     
-    return await service.get_schedule_by_month(user, year, month)
+    # 캐시 적중 시 SQL 조회/직렬화 없이 저장된 JSON bytes를 그대로 응답
+    view = await service.get_month_view(user, year, month)
+    headers = {"ETag": view.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), view.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=view.body, media_type="application/json", headers=headers)
+
+@router.get(
+    "/range",
+    response_model=ScheduleRangeResponse,
+    summary="기간 일정 조회",
+    description=(
+        "[from, to) 기간의 일정을 날짜, 시작 시간 순으로 조회합니다. (to는 포함하지 않음)\n\n"
+        "결과가 limit보다 많으면 next_cursor가 반환되며, cursor 파라미터로 다음 페이지를 조회합니다."
+    )
+)
+async def get_schedules_by_range(
+    user: CurrentUserDep,
+    service: ScheuduleServiceDep,
+    from_date: date = Query(alias="from"),
+    to_date: date = Query(alias="to"),
+    limit: int | None = Query(default=None, ge=1),
+    cursor: str | None = None
+) -> ScheduleRangeResponse:
+    """현재 사용자의 기간 일정을 조회"""
+    logger.info(f"기간 일정 조회 엔드포인트 진입 -->  From:{from_date}, To: {to_date}")
+    
+    rows, next_cursor = await service.get_schedules_by_range(user, from_date, to_date, limit, cursor)
+    
+    # Projection 조회 결과를 Pydantic 검증 없이 orjson으로 직렬화 (응답 형식은 ScheduleRangeResponse와 동일)
+    body = dumps_json({"items": schedule_rows_to_dicts(rows), "next_cursor": next_cursor})
+    return Response(content=body, media_type="application/json")
 
 @router.get(
     "/{schedule_id}",
@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
@@ -25,6 +26,122 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_MODEL:str = "jeiary-scheduler"
     
+    # 여러 Ollama 서버를 사용할 때 쉼표로 구분한 목록 (미설정 시 OLLAMA_BASE_URL 하나만 사용)
+    # 예: "http://ollama-1:11434,http://ollama-2:11434"
+    OLLAMA_BASE_URLS: str | None = None
+    # 헬스 체크 주기/타임아웃(초), 0이면 헬스 체크 안 함
+    OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0
+    OLLAMA_HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    # 헬스 체크가 연속으로 이 횟수만큼 실패해야 서버를 제외 (일시적인 지연으로 서버가 빠지지 않도록)
+    OLLAMA_HEALTH_CHECK_FAILURE_THRESHOLD: int = 3
+    # 서버별 서킷 브레이커: 연속 실패 횟수 기준, 다시 시도해 볼 때까지의 시간(초)
+    OLLAMA_CIRCUIT_FAILURE_THRESHOLD: int = 3
+    OLLAMA_CIRCUIT_RESET_SECONDS: float = 30.0
+    # 이 시간(초) 안에 응답이 없으면 다른 서버에도 같은 요청을 보내 먼저 온 응답을 사용 (0이면 사용 안 함, 스트리밍 제외)
+    # LLM 생성은 비용이 크므로 서버 여유가 있을 때만 설정
+    OLLAMA_HEDGE_DELAY_SECONDS: float = 0.0
+    
+    # 모닝 브리핑 배치: 동시에 처리할 최대 사용자 수 (Ollama 병렬 처리 능력에 맞춰 조정)
+    BRIEFING_CONCURRENCY: int = 8
+    # 배치 작업에서 사용자를 나눠 읽을 청크 크기 (Keyset Pagination)
+    BATCH_CHUNK_SIZE: int = 500
+    # 청크의 알림 저장(bulk INSERT) 실패 시 재시도 횟수와 대기 시간(초) - 생성한 브리핑을 버리지 않기 위함
+    BRIEFING_SAVE_MAX_ATTEMPTS: int = 3
+    BRIEFING_SAVE_RETRY_DELAY_SECONDS: float = 1.0
+    # 동일한 일정 구성에 대한 브리핑 캐시 (TTL: 초, 최대 항목 수)
+    BRIEFING_CACHE_TTL_SECONDS: int = 60 * 60 * 12
+    BRIEFING_CACHE_MAX_SIZE: int = 1000
+    
+    # 명백한 잡담은 LLM 라우터를 건너뛰는 규칙 기반 의도 분류 (fast-path)
+    INTENT_FAST_PATH_ENABLED: bool = True
+    INTENT_FAST_PATH_THRESHOLD: float = 0.75
+    
+    # 일반 대화 처리 방식
+    # two_pass: 라우터(LLM) 판단 후 AIAgent(LLM)가 다시 답변 생성
+    # single_pass: 라우터가 만든 답변(GeneralChatTool.response 또는 텍스트 응답)을 그대로 사용
+    AI_CHAT_MODE: Literal["single_pass", "two_pass"] = "two_pass"
+    
+    # Redis(또는 Redis 프로토콜 호환 서버) 주소, 없으면 프로세스 내 캐시 사용 (redis 패키지 필요)
+    REDIS_URL: str | None = None
+    
+    # 사용자별 최근 대화 캐시 (메세지 수, 최대 사용자 수, TTL: 초)
+    CHAT_HISTORY_CACHE_MESSAGES: int = 20
+    CHAT_HISTORY_CACHE_MAX_USERS: int = 10000
+    CHAT_HISTORY_CACHE_TTL_SECONDS: int = 60 * 60
+    # REDIS_URL이 없을 때의 프로세스 내 캐시 TTL(초)
+    # 다른 워커가 처리한 대화는 이 시간 동안 보이지 않으므로 짧게 유지 (멀티 워커 환경에서는 REDIS_URL 설정 권장)
+    CHAT_HISTORY_LOCAL_CACHE_TTL_SECONDS: int = 10
+    
+    # 기간 일정 조회 제한 (최대 조회 일수, 한 페이지 최대/기본 행 수)
+    SCHEDULE_RANGE_MAX_DAYS: int = 366
+    SCHEDULE_RANGE_MAX_LIMIT: int = 1000
+    SCHEDULE_RANGE_DEFAULT_LIMIT: int = 500
+    
+    # 월별 일정 응답(직렬화된 JSON) 캐시 (최대 항목 수, TTL: 초)
+    # 프로세스 내 캐시는 다른 워커의 변경을 알 수 없으므로 적중 시에도 버전(일정 수 + 최종 수정 시각)을 조회하여 확인
+    # REDIS_URL을 설정하면 모든 워커가 캐시를 공유하여 적중 시 쿼리 없이 응답
+    MONTH_VIEW_CACHE_MAX_SIZE: int = 10000
+    MONTH_VIEW_CACHE_TTL_SECONDS: int = 5 * 60
+    
+    # Rate Limit 저장소 (gunicorn 워커 간 카운터 공유)
+    # - 미설정 시 REDIS_URL, 둘 다 없으면 워커별 메모리("memory://") - 워커/인스턴스가 여러 개면 REDIS_URL 필수
+    # - 예: "redis://localhost:6379/1"
+    RATE_LIMIT_STORAGE_URI: str | None = None
+    # 모든 엔드포인트에 적용할 기본 제한 (예: "120/minute"), 로그인 사용자는 사용자 ID, 그 외는 IP 기준
+    RATE_LIMIT_DEFAULT: str | None = None
+    
+    # 검증된 Access Token 캐시 (항목은 토큰의 exp 시점에 만료)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    
+    # Refresh Token 상태(jti) 캐시 (최대 항목 수, TTL: 초)
+    # 프로세스 내 캐시는 다른 워커의 무효화(로그아웃)를 알 수 없으므로 무효화된 토큰만 저장 (유효한 토큰은 매번 DB 확인)
+    # REDIS_URL을 설정하면 모든 워커가 공유하여 유효한 토큰도 DB 조회 없이 판단
+    REFRESH_TOKEN_STATE_CACHE_MAX_SIZE: int = 10000
+    REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS: int = 60
+    
+    # 비밀번호 해시/검증(bcrypt) 전용 스레드 수 - 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+    PASSWORD_HASH_WORKERS: int = 2
+    
+    # 인증 사용자 캐시 (최대 사용자 수, TTL: 초) - 프로세스 내 캐시이므로 다른 워커의 변경은 TTL 이후 반영
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    
+    # LLM 호출 우선순위 스케줄링 (프로세스 단위)
+    # - LLM_MAX_CONCURRENCY: 동시에 Ollama로 보내는 요청 수
+    # - 클래스별 상한: 배치(모닝 브리핑)는 상한을 낮게 두어 실시간 대화용 자리를 남겨둠
+    LLM_MAX_CONCURRENCY: int = 4
+    LLM_INTERACTIVE_MAX_CONCURRENCY: int = 4
+    LLM_BATCH_MAX_CONCURRENCY: int = 2
+    
+    # AI 엔드포인트 수용 제어 (워커 단위)
+    # - AI_MAX_CONCURRENCY: 동시에 LLM을 호출하는 요청 수 (Ollama의 OLLAMA_NUM_PARALLEL / gunicorn 워커 수 기준)
+    # - AI_MAX_QUEUE / AI_QUEUE_TIMEOUT_SECONDS: 자리를 기다릴 수 있는 요청 수와 최대 대기 시간, 초과 시 즉시 503
+    # - AI_USER_RATE_PER_MINUTE / AI_USER_BURST: 사용자별 토큰 버킷 (분당 충전량, 최대 연속 요청 수), 초과 시 429
+    #   AI_USER_RATE_PER_MINUTE를 0으로 두면 사용자별 제한 없음
+    AI_MAX_CONCURRENCY: int = 2
+    AI_MAX_QUEUE: int = 8
+    AI_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    AI_USER_RATE_PER_MINUTE: float = 10.0
+    AI_USER_BURST: int = 5
+    AI_USER_BUCKET_MAX_USERS: int = 10000
+
+    # LLM 호출 재시도 정책: 지수 백오프(Full Jitter), 호출 전체 마감 시간(재시도/대기 포함)
+    LLM_RETRY_MAX_ATTEMPTS: int = 3
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 4.0
+    LLM_CALL_DEADLINE_SECONDS: float = 60.0
+    # 배치(모닝 브리핑) 호출은 대화 요청에 밀려 자리를 오래 기다릴 수 있으므로 위 마감 시간 대신
+    # 자리를 얻은 뒤의 시도 한 번만 이 시간(초)으로 제한 (자리 대기 시간은 포함하지 않음)
+    LLM_BATCH_ATTEMPT_TIMEOUT_SECONDS: float = 60.0
+    # 프로세스 전체 재시도 예산: 요청 수의 RATIO 비율만큼만 재시도 허용 (장애 시 재시도로 부하가 불어나는 것을 방지)
+    # 요청이 적을 때를 위해 초당 MIN_PER_SECOND개씩 충전, 최대 MAX_TOKENS개까지 적립
+    RETRY_BUDGET_RATIO: float = 0.1
+    RETRY_BUDGET_MIN_PER_SECOND: float = 0.2
+    RETRY_BUDGET_MAX_TOKENS: float = 10.0
+
+    # 대화 내역 DB 저장을 응답 전송 이후(BackgroundTasks)로 미룰지 여부
+    CHAT_PERSIST_IN_BACKGROUND: bool = True
+    
     @property
     def DATABASE_URL(self) -> str:
         """비동기 SQLAlchemy 드라이버를 위한 데이터베이스 URL 생성"""
@@ -0,0 +1,208 @@
+'''
+- AI 엔드포인트 수용 제어(Admission Control)
+- LLM 서버가 동시에 처리할 수 있는 만큼만 요청을 들여보내고, 넘치는 요청은 오래 붙잡지 않고 바로 거절
+  1. 사용자별 토큰 버킷: 한 사용자가 용량을 독점하지 못하도록 제한 (초과 시 429)
+  2. 전역 동시 실행 제한(Semaphore): Ollama 병렬 처리 수에 맞춤
+  3. 제한된 대기열 + 대기 시간 제한: 대기열이 가득 찼거나 제한 시간 안에 자리가 나지 않으면 503
+- Retry-After는 관측된 평균 처리 시간으로 계산한 대기열 배출 속도로 추정
+- 워커(프로세스) 단위로 동작하므로 AI_MAX_CONCURRENCY는 워커 수를 고려해 설정
+'''
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from loguru import logger
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.exceptions import AIOverloadedException, AIRateLimitException
+
+class TokenBucket:
+    """capacity개까지 쌓이고 초당 rate개씩 충전되는 토큰 버킷"""
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def take(self) -> float:
+        """토큰 1개를 사용하고 0을 반환, 부족하면 다음 토큰까지 남은 시간(초)을 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def refund(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+class AdmissionTicket:
+    """수용된 요청의 실행 권한, release()는 여러 번 호출해도 한 번만 반영"""
+    __slots__ = ("_controller", "_started_at", "_released")
+
+    def __init__(self, controller: "AdmissionController", started_at: float):
+        self._controller = controller
+        self._started_at = started_at
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller._release(self._started_at)
+
+class AdmissionController:
+    # 평균 처리 시간 지수 이동 평균(EWMA) 가중치
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        user_rate_per_minute: float,
+        user_burst: int,
+        max_users: int = 10000,
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 실행할 수 있는 요청 수
+            max_queue: 자리를 기다릴 수 있는 요청 수
+            queue_timeout: 대기열에서 기다릴 수 있는 최대 시간(초)
+            user_rate_per_minute: 사용자별 분당 토큰 충전량 (0 이하이면 사용자별 제한 없음)
+            user_burst: 사용자별 최대 연속 요청 수 (버킷 크기)
+            max_users: 토큰 버킷을 보관할 최대 사용자 수
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.user_burst = user_burst
+        self.user_rate = max(0.0, user_rate_per_minute / 60)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # 가득 찬 버킷은 새 버킷과 같으므로, 다 충전되는 시간이 지나면 제거해도 무방
+        # 충전량이 0이면 버킷을 만들지 않음 (사용자별 제한 없이 전역 동시 실행/대기열 제한만 적용)
+        self._buckets: TTLCache[int, TokenBucket] | None = None
+        if self.user_rate > 0:
+            self._buckets = TTLCache(maxsize=max_users, ttl=user_burst / self.user_rate)
+        self._avg_service_time: float | None = None
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_rate_limited = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def _take_user_token(self, user_id: int) -> TokenBucket | None:
+        if self._buckets is None:
+            return None
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = TokenBucket(self.user_burst, self.user_rate)
+        wait = bucket.take()
+        self._buckets.set(user_id, bucket)
+        if wait > 0:
+            self.rejected_rate_limited += 1
+            raise AIRateLimitException(retry_after=max(1, math.ceil(wait)))
+        return bucket
+
+    def estimate_retry_after(self) -> int:
+        """
+        대기열이 빠지는 데 걸릴 시간(초) 추정
+        배출 속도(초당 완료 수) = 동시 실행 수 / 평균 처리 시간, 관측값이 없으면 대기 제한 시간 사용
+        """
+        if not self._avg_service_time:
+            return max(1, math.ceil(self.queue_timeout))
+        drain_rate = self.max_concurrency / self._avg_service_time
+        return max(1, math.ceil((self.waiting + 1) / drain_rate))
+
+    def _reject_overloaded(self, bucket: TokenBucket | None) -> AIOverloadedException:
+        # 처리되지 않은 요청은 사용자 한도에서 차감하지 않음
+        if bucket is not None:
+            bucket.refund()
+        return AIOverloadedException(retry_after=self.estimate_retry_after())
+
+    async def acquire(self, user_id: int) -> AdmissionTicket:
+        """
+        실행 권한을 얻을 때까지 대기합니다. (대기열/대기 시간 제한 안에서)
+
+        Raises:
+            AIRateLimitException: 사용자별 한도 초과 (429)
+            AIOverloadedException: 대기열이 가득 찼거나 대기 시간 초과 (503)
+        """
+        bucket = self._take_user_token(user_id)
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected_queue_full += 1
+                logger.warning(f"AI admission rejected (queue full) - running={self.running}, waiting={self.waiting}")
+                raise self._reject_overloaded(bucket)
+
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected_timeout += 1
+                logger.warning(f"AI admission rejected (queue timeout {self.queue_timeout}s) - running={self.running}")
+                raise self._reject_overloaded(bucket)
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.running += 1
+        self.admitted += 1
+        return AdmissionTicket(self, time.monotonic())
+
+    def _release(self, started_at: float) -> None:
+        self.running -= 1
+        self._semaphore.release()
+        duration = time.monotonic() - started_at
+        if self._avg_service_time is None:
+            self._avg_service_time = duration
+        else:
+            self._avg_service_time += self.EWMA_ALPHA * (duration - self._avg_service_time)
+
+    @asynccontextmanager
+    async def admit(self, user_id: int) -> AsyncIterator[AdmissionTicket]:
+        """실행 권한을 얻고, 블록이 끝나면 반환"""
+        ticket = await self.acquire(user_id)
+        try:
+            yield ticket
+        finally:
+            ticket.release()
+
+    def clear_user_buckets(self) -> None:
+        if self._buckets is not None:
+            self._buckets.clear()
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected_rate_limited": self.rejected_rate_limited,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_service_seconds": self._avg_service_time or 0.0,
+        }
+
+_controller: AdmissionController | None = None
+
+def get_ai_admission_controller() -> AdmissionController:
+    """AI 엔드포인트 공용 수용 제어기를 반환 (없으면 생성)"""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(
+            max_concurrency=settings.AI_MAX_CONCURRENCY,
+            max_queue=settings.AI_MAX_QUEUE,
+            queue_timeout=settings.AI_QUEUE_TIMEOUT_SECONDS,
+            user_rate_per_minute=settings.AI_USER_RATE_PER_MINUTE,
+            user_burst=settings.AI_USER_BURST,
+            max_users=settings.AI_USER_BUCKET_MAX_USERS,
+        )
+    return _controller
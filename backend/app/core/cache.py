@@ -0,0 +1,77 @@
+'''
+- 프로세스 내(In-Process) 캐시 유틸리티
+- TTL(만료 시간) + 최대 크기 제한(LRU 방식 제거)을 지원
+- 단일 이벤트 루프 안에서만 사용하므로 별도의 Lock이 필요 없음
+'''
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+class TTLCache(Generic[K, V]):
+    """
+    TTL과 최대 크기를 가진 인메모리 LRU 캐시
+
+    - get: 만료된 항목은 제거 후 None 반환, 조회된 항목은 가장 최근 사용으로 이동
+    - set: 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - hits/misses: 캐시 적중/실패 횟수 (모니터링용)
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: K) -> V | None:
+        """적중/실패 횟수와 LRU 순서에 영향을 주지 않고 조회"""
+        item = self._data.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """ttl을 지정하지 않으면 캐시의 기본 TTL을 사용"""
+        if self.maxsize <= 0:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, key: K) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,268 @@
+'''
+- 사용자별 최근 대화 내역 캐시 (Write-Through)
+- 최근 N개 메세지({"role", "content"})를 오래된 순으로 보관하는 링 버퍼
+- Redis를 사용할 수 있으면 Redis, 아니면 프로세스 내 LRU 캐시 사용
+  (프로세스 내 캐시는 다른 워커가 처리한 대화를 알 수 없으므로 TTL을 몇 초로 짧게 유지)
+- 캐시에 없는 사용자(miss)는 append를 무시하고, 다음 조회 때 DB에서 다시 채움
+- DB에서 다시 채울 때의 경쟁 조건 방지
+  1. 세대(generation): append/무효화마다 바뀌는 번호, 조회 시작 후 바뀌었으면 채우지 않음
+  2. 저장 중(pending): append 후 DB 저장(커밋)이 끝나기 전이면 DB에 아직 없는 대화가 있으므로 채우지 않음
+  3. 저장에 실패(롤백)하면 finish_write(persisted=False)로 캐시에만 남은 대화를 제거
+'''
+import itertools
+import json
+from typing import Protocol
+from loguru import logger
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+class ChatHistoryCache(Protocol):
+    max_messages: int
+    
+    async def get(self, user_id: int) -> list[dict] | None: ...
+    async def fill_generation(self, user_id: int) -> int | None: ...
+    async def set(self, user_id: int, messages: list[dict], generation: int | None = None) -> None: ...
+    async def append(self, user_id: int, messages: list[dict]) -> None: ...
+    async def finish_write(self, user_id: int, persisted: bool) -> None: ...
+    async def invalidate(self, user_id: int) -> None: ...
+    async def clear(self) -> None: ...
+
+# 저장 중 표시의 최대 유지 시간(초) - 저장 완료 처리가 누락되어도 이 시간이 지나면 다시 캐시를 채움
+PENDING_WRITE_TTL_SECONDS = 60
+
+# 세대 번호는 프로세스 전역 일련번호를 사용 (항목이 만료되어도 같은 번호가 다시 나오지 않음)
+_generation_seq = itertools.count(1)
+
+class InMemoryChatHistoryCache:
+    """프로세스 내 LRU 캐시 (워커 간 공유되지 않음)"""
+    def __init__(self, max_messages: int, max_users: int, ttl: float):
+        self.max_messages = max_messages
+        self._cache: TTLCache[int, list[dict]] = TTLCache(maxsize=max_users, ttl=ttl)
+        self._generations: TTLCache[int, int] = TTLCache(
+            maxsize=max_users, ttl=max(ttl, PENDING_WRITE_TTL_SECONDS)
+        )
+        self._pending: TTLCache[int, int] = TTLCache(maxsize=max_users, ttl=PENDING_WRITE_TTL_SECONDS)
+        
+    def _bump_generation(self, user_id: int) -> None:
+        self._generations.set(user_id, next(_generation_seq))
+        
+    async def get(self, user_id: int) -> list[dict] | None:
+        messages = self._cache.get(user_id)
+        return list(messages) if messages is not None else None
+    
+    async def fill_generation(self, user_id: int) -> int | None:
+        """DB 조회 전에 호출, 저장 중인 대화가 있으면 None (채우지 않음)"""
+        if self._pending.peek(user_id):
+            return None
+        return self._generations.peek(user_id) or 0
+    
+    async def set(self, user_id: int, messages: list[dict], generation: int | None = None) -> None:
+        """generation이 주어지면 조회 시작 후 변경(append/무효화/저장 중)이 없을 때만 저장"""
+        if generation is not None and generation != await self.fill_generation(user_id):
+            return
+        self._cache.set(user_id, list(messages[-self.max_messages:]))
+        
+    async def append(self, user_id: int, messages: list[dict]) -> None:
+        """대화를 추가하고 저장 중으로 표시 (저장이 끝나면 finish_write 호출)"""
+        self._bump_generation(user_id)
+        self._pending.set(user_id, (self._pending.peek(user_id) or 0) + 1)
+        current = self._cache.peek(user_id)
+        if current is None:
+            return
+        self._cache.set(user_id, (current + messages)[-self.max_messages:])
+        
+    async def finish_write(self, user_id: int, persisted: bool) -> None:
+        """저장 중 표시를 해제, 저장에 실패했으면 캐시에만 남은 대화를 제거"""
+        pending = (self._pending.peek(user_id) or 0) - 1
+        if pending > 0:
+            self._pending.set(user_id, pending)
+        else:
+            self._pending.delete(user_id)
+        if not persisted:
+            await self.invalidate(user_id)
+        
+    async def invalidate(self, user_id: int) -> None:
+        self._bump_generation(user_id)
+        self._cache.delete(user_id)
+        
+    async def clear(self) -> None:
+        self._cache.clear()
+        self._generations.clear()
+        self._pending.clear()
+
+# 세대를 바꾸고 저장 중으로 표시한 뒤, 키가 있을 때만 메세지를 추가하고 최근 N개만 남김 (원자적 실행)
+# KEYS: 대화, 세대, 저장 중, 세대 일련번호 / ARGV: 메세지, 최대 개수, TTL, 저장 중 TTL
+_APPEND_SCRIPT = """
+redis.call('SET', KEYS[2], redis.call('INCR', KEYS[4]), 'EX', ARGV[3])
+redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+local messages = cjson.decode(current)
+for _, message in ipairs(cjson.decode(ARGV[1])) do
+    table.insert(messages, message)
+end
+while #messages > tonumber(ARGV[2]) do
+    table.remove(messages, 1)
+end
+redis.call('SET', KEYS[1], cjson.encode(messages), 'EX', ARGV[3])
+return 1
+"""
+
+# 저장 중이 아니고 세대가 그대로일 때만 저장
+# KEYS: 대화, 세대, 저장 중 / ARGV: 메세지, 조회 시작 시 세대, TTL
+_SET_IF_UNCHANGED_SCRIPT = """
+local pending = redis.call('GET', KEYS[3])
+if pending and tonumber(pending) > 0 then
+    return 0
+end
+local generation = redis.call('GET', KEYS[2]) or '0'
+if generation ~= ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# 저장 중 표시 해제, 저장에 실패했으면(ARGV[1] == '0') 대화를 지우고 세대를 바꿈
+# KEYS: 대화, 세대, 저장 중, 세대 일련번호 / ARGV: 저장 성공 여부, TTL
+_FINISH_WRITE_SCRIPT = """
+if redis.call('DECR', KEYS[3]) <= 0 then
+    redis.call('DEL', KEYS[3])
+end
+if ARGV[1] == '0' then
+    redis.call('DEL', KEYS[1])
+    redis.call('SET', KEYS[2], redis.call('INCR', KEYS[4]), 'EX', ARGV[2])
+end
+return 1
+"""
+
+# 대화를 지우고 세대를 바꿈
+# KEYS: 대화, 세대, 세대 일련번호 / ARGV: TTL
+_INVALIDATE_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], redis.call('INCR', KEYS[3]), 'EX', ARGV[1])
+return 1
+"""
+
+class RedisChatHistoryCache:
+    """Redis 캐시 (모든 워커가 공유), 오류 시 캐시 미스로 처리"""
+    KEY_PREFIX = "chat_history:"
+    SEQUENCE_KEY = "chat_history:generation_seq"
+    
+    def __init__(self, client, max_messages: int, ttl: int):
+        self.client = client
+        self.max_messages = max_messages
+        self.ttl = ttl
+        
+    def _key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+    
+    def _generation_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}generation:{user_id}"
+    
+    def _pending_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}pending:{user_id}"
+    
+    async def get(self, user_id: int) -> list[dict] | None:
+        try:
+            raw = await self.client.get(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"Chat history cache get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        messages = json.loads(raw)
+        # Lua cjson은 빈 리스트를 {}로 인코딩
+        return messages if isinstance(messages, list) else []
+    
+    async def fill_generation(self, user_id: int) -> int | None:
+        try:
+            generation, pending = await self.client.mget(
+                self._generation_key(user_id), self._pending_key(user_id)
+            )
+        except Exception as e:
+            logger.warning(f"Chat history cache generation lookup failed: {e}")
+            return None
+        if pending is not None and int(pending) > 0:
+            return None
+        return int(generation or 0)
+    
+    async def set(self, user_id: int, messages: list[dict], generation: int | None = None) -> None:
+        payload = json.dumps(messages[-self.max_messages:], ensure_ascii=False)
+        try:
+            if generation is None:
+                await self.client.set(self._key(user_id), payload, ex=self.ttl)
+            else:
+                await self.client.eval(
+                    _SET_IF_UNCHANGED_SCRIPT, 3,
+                    self._key(user_id), self._generation_key(user_id), self._pending_key(user_id),
+                    payload, generation, self.ttl
+                )
+        except Exception as e:
+            logger.warning(f"Chat history cache set failed: {e}")
+            
+    async def append(self, user_id: int, messages: list[dict]) -> None:
+        try:
+            await self.client.eval(
+                _APPEND_SCRIPT, 4,
+                self._key(user_id), self._generation_key(user_id), self._pending_key(user_id), self.SEQUENCE_KEY,
+                json.dumps(messages, ensure_ascii=False), self.max_messages, self.ttl, PENDING_WRITE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Chat history cache append failed: {e}")
+            await self.invalidate(user_id)
+            
+    async def finish_write(self, user_id: int, persisted: bool) -> None:
+        try:
+            await self.client.eval(
+                _FINISH_WRITE_SCRIPT, 4,
+                self._key(user_id), self._generation_key(user_id), self._pending_key(user_id), self.SEQUENCE_KEY,
+                int(persisted), self.ttl
+            )
+        except Exception as e:
+            logger.warning(f"Chat history cache finish_write failed: {e}")
+            
+    async def invalidate(self, user_id: int) -> None:
+        try:
+            await self.client.eval(
+                _INVALIDATE_SCRIPT, 3,
+                self._key(user_id), self._generation_key(user_id), self.SEQUENCE_KEY,
+                self.ttl
+            )
+        except Exception as e:
+            logger.warning(f"Chat history cache invalidate failed: {e}")
+            
+    async def clear(self) -> None:
+        try:
+            async for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}*"):
+                # 세대 일련번호는 유지 (지우면 이미 사용한 세대 번호가 다시 나올 수 있음)
+                if key != self.SEQUENCE_KEY:
+                    await self.client.delete(key)
+        except Exception as e:
+            logger.warning(f"Chat history cache clear failed: {e}")
+
+_cache: ChatHistoryCache | None = None
+
+def get_chat_history_cache() -> ChatHistoryCache:
+    """공용 대화 내역 캐시를 반환 (Redis 우선, 없으면 프로세스 내 캐시)"""
+    global _cache
+    if _cache is None:
+        client = get_redis()
+        if client is not None:
+            _cache = RedisChatHistoryCache(
+                client,
+                max_messages=settings.CHAT_HISTORY_CACHE_MESSAGES,
+                ttl=settings.CHAT_HISTORY_CACHE_TTL_SECONDS
+            )
+        else:
+            _cache = InMemoryChatHistoryCache(
+                max_messages=settings.CHAT_HISTORY_CACHE_MESSAGES,
+                max_users=settings.CHAT_HISTORY_CACHE_MAX_USERS,
+                ttl=settings.CHAT_HISTORY_LOCAL_CACHE_TTL_SECONDS
+            )
+    return _cache
@@ -36,4 +36,26 @@ class AIConnectionError(Exception):
     pass
         
 class AIParsingError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class AIRateLimitException(HTTPException):
+    """
+    사용자별 AI 요청 한도(토큰 버킷)를 초과했을 때 발생하는 예외
+    """
+    def __init__(self, retry_after: int, detail: str = "AI 요청 한도를 초과했습니다. 잠시 후 다시 요청해주세요."):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+class AIOverloadedException(HTTPException):
+    """
+    AI 처리 용량이 가득 차 요청을 받을 수 없을 때 발생하는 예외 (대기열 가득 참, 대기 시간 초과)
+    """
+    def __init__(self, retry_after: int, detail: str = "AI 서비스 요청이 많아 처리할 수 없습니다. 잠시 후 다시 요청해주세요."):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
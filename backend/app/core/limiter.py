@@ -24,8 +24,60 @@ from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-# IP 주소를 기준으로 요청을 식별하는 limiter 인스턴스 생성
-limiter = Limiter(key_func=get_remote_address)
+from app.config import settings
+from app.core.security import verify_token
+
+def get_ip_rate_limit_key(request: Request) -> str:
+    """
+    IP 주소 기준 Rate Limit 카운터 키
+    - 로그인 등 인증 전 엔드포인트용: 쿠키와 관계없이 클라이언트 IP로 제한 (무차별 대입 방지)
+    """
+    return f"ip:{get_remote_address(request)}"
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Rate Limit 카운터 키 (인증 엔드포인트용 기본값)
+    - 유효한 Access Token 쿠키가 있으면 사용자 ID 기준 (같은 NAT/프록시 뒤 사용자끼리 한도를 나눠 쓰지 않도록)
+    - 그 외(비인증 요청)는 IP 주소 기준
+    """
+    token = request.cookies.get("access_token")
+    if token:
+        try:
+            uid = verify_token(token, token_type="access").get("uid")
+        except Exception:
+            uid = None
+        if uid is not None:
+            return f"user:{uid}"
+    return get_ip_rate_limit_key(request)
+
+def _get_storage_uri() -> str:
+    """
+    Rate Limit 저장소 URI (설정값 > REDIS_URL > 워커별 메모리)
+    - REDIS_URL이 있으면 항상 Redis를 사용하여 모든 워커/인스턴스가 같은 카운터를 공유
+      (redis 패키지가 없으면 limiter 생성 시 오류를 내어, 워커별 카운터로 조용히 바뀌지 않도록 함)
+    """
+    return settings.RATE_LIMIT_STORAGE_URI or settings.REDIS_URL or "memory://"
+
+def create_limiter(storage_uri: str | None = None, storage_options: dict | None = None) -> Limiter:
+    """
+    공유 저장소(Redis) 기반 limiter 생성
+    - moving-window: 슬라이딩 윈도우 방식, Redis에서는 요청마다 Lua 스크립트 하나로 원자적으로 확인/기록
+    - headers_enabled: X-RateLimit-Limit/Remaining/Reset, Retry-After 헤더 추가
+    - Redis 장애 시 워커별 메모리 저장소로 대체
+    - storage_options: 저장소 생성 옵션 (예: Redis connection_pool)
+    """
+    return Limiter(
+        key_func=get_rate_limit_key,
+        default_limits=[settings.RATE_LIMIT_DEFAULT] if settings.RATE_LIMIT_DEFAULT else [],
+        storage_uri=storage_uri or _get_storage_uri(),
+        storage_options=storage_options or {},
+        strategy="moving-window",
+        headers_enabled=True,
+        in_memory_fallback_enabled=True,
+        key_prefix="rate_limit",
+    )
+
+limiter = create_limiter()
 
 # 커스텀 에러 핸들러 추가
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
@@ -37,12 +89,12 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         exc: RateLimitExceeded 예외
     
     Returns:
-        JSONResponse: 429 상태 코드와 에러 메시지
+        JSONResponse: 429 상태 코드와 에러 메시지 (제한 헤더와 남은 대기 시간(Retry-After) 포함)
     """
-    return JSONResponse(
+    response = JSONResponse(
         status_code=429,
         content={
             "detail": "호출 횟수를 초과했습니다. 잠시 후 다시 요청해주세요."
         },
-        headers={"Retry-After": "60"}
-    )
\ No newline at end of file
+    )
+    return request.app.state.limiter._inject_headers(response, request.state.view_rate_limit)
@@ -0,0 +1,32 @@
+'''
+- 프로세스(워커) 단위 런타임 지표를 한곳에 모아 반환 (/health/metrics)
+  1. LLM 호출 스케줄러: 우선순위 클래스별 실행/대기 수, 평균/최대 대기 시간
+  2. AI 엔드포인트 수용 제어: 실행/대기 수, 거절(429/503) 횟수, 평균 처리 시간
+  3. 의도 분류기(fast-path): 의도별 결정 횟수
+  4. 비밀번호 해시 스레드 풀: 대기/실행/완료 수, 평균 대기 시간
+  5. 재시도: 프로세스 재시도 예산, 정책별 시도/재시도/예산 소진/마감 초과 횟수
+- gunicorn 워커마다 값이 다르므로 pid를 함께 반환 (수집 쪽에서 워커별로 구분)
+- 집계 값만 포함하고 사용자 정보나 서버 주소는 포함하지 않음
+'''
+import os
+from typing import Any
+
+from app.core.admission import get_ai_admission_controller
+from app.core.retry import retry_budget, retry_stats
+from app.core.security import password_hash_pool
+from app.services.ai_service import intent_classifier
+from app.services.llm_dispatcher import get_llm_dispatcher
+
+def collect_runtime_metrics() -> dict[str, Any]:
+    """현재 프로세스의 런타임 지표"""
+    return {
+        "pid": os.getpid(),
+        "llm_dispatcher": get_llm_dispatcher().stats(),
+        "ai_admission": get_ai_admission_controller().stats(),
+        "intent_classifier": intent_classifier.stats(),
+        "password_hash_pool": password_hash_pool.stats(),
+        "retry": {
+            "budget": retry_budget.stats(),
+            "policies": retry_stats(),
+        },
+    }
@@ -0,0 +1,111 @@
+'''
+- 월별 일정 조회 응답 캐시
+- (user_id, year, month) 단위로 직렬화가 끝난 JSON bytes와 ETag를 함께 보관
+- 일정 생성/수정/삭제 시 ScheduleService가 변경된 월만 무효화
+- Redis를 사용할 수 있으면 Redis(워커 간 공유), 아니면 프로세스 내 LRU 캐시 사용
+  (프로세스 내 캐시는 shared=False: 다른 워커의 변경을 알 수 없으므로 사용하는 쪽에서 적중 시 버전을 확인)
+'''
+from typing import Iterable, NamedTuple, Protocol
+from loguru import logger
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+class MonthView(NamedTuple):
+    etag: str
+    body: bytes
+
+class MonthViewCache(Protocol):
+    # 모든 워커가 같은 캐시를 보는지 여부 (False면 다른 워커의 무효화가 반영되지 않음)
+    shared: bool
+    
+    async def get(self, user_id: int, year: int, month: int) -> MonthView | None: ...
+    async def set(self, user_id: int, year: int, month: int, view: MonthView) -> None: ...
+    async def invalidate(self, user_id: int, months: Iterable[tuple[int, int]]) -> None: ...
+    async def clear(self) -> None: ...
+
+class InMemoryMonthViewCache:
+    """프로세스 내 LRU 캐시 (워커 간 공유되지 않음)"""
+    shared = False
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[tuple[int, int, int], MonthView] = TTLCache(maxsize=maxsize, ttl=ttl)
+        
+    async def get(self, user_id: int, year: int, month: int) -> MonthView | None:
+        return self._cache.get((user_id, year, month))
+    
+    async def set(self, user_id: int, year: int, month: int, view: MonthView) -> None:
+        self._cache.set((user_id, year, month), view)
+        
+    async def invalidate(self, user_id: int, months: Iterable[tuple[int, int]]) -> None:
+        for year, month in months:
+            self._cache.delete((user_id, year, month))
+            
+    async def clear(self) -> None:
+        self._cache.clear()
+
+class RedisMonthViewCache:
+    """Redis 캐시 (모든 워커가 공유), 값은 "ETag\\n본문" 형태로 저장하며 오류 시 캐시 미스로 처리"""
+    KEY_PREFIX = "month_view:"
+    shared = True
+    
+    def __init__(self, client, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        
+    def _key(self, user_id: int, year: int, month: int) -> str:
+        return f"{self.KEY_PREFIX}{user_id}:{year}:{month}"
+    
+    async def get(self, user_id: int, year: int, month: int) -> MonthView | None:
+        try:
+            raw = await self.client.get(self._key(user_id, year, month))
+        except Exception as e:
+            logger.warning(f"Month view cache get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        etag, _, body = raw.partition("\n")
+        return MonthView(etag=etag, body=body.encode("utf-8"))
+    
+    async def set(self, user_id: int, year: int, month: int, view: MonthView) -> None:
+        try:
+            await self.client.set(
+                self._key(user_id, year, month),
+                f"{view.etag}\n{view.body.decode('utf-8')}",
+                ex=self.ttl
+            )
+        except Exception as e:
+            logger.warning(f"Month view cache set failed: {e}")
+            
+    async def invalidate(self, user_id: int, months: Iterable[tuple[int, int]]) -> None:
+        keys = [self._key(user_id, year, month) for year, month in months]
+        if not keys:
+            return
+        try:
+            await self.client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Month view cache invalidate failed: {e}")
+            
+    async def clear(self) -> None:
+        try:
+            async for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}*"):
+                await self.client.delete(key)
+        except Exception as e:
+            logger.warning(f"Month view cache clear failed: {e}")
+
+_cache: MonthViewCache | None = None
+
+def get_month_view_cache() -> MonthViewCache:
+    """공용 월별 일정 응답 캐시를 반환 (Redis 우선, 없으면 프로세스 내 캐시)"""
+    global _cache
+    if _cache is None:
+        client = get_redis()
+        if client is not None:
+            _cache = RedisMonthViewCache(client, ttl=settings.MONTH_VIEW_CACHE_TTL_SECONDS)
+        else:
+            _cache = InMemoryMonthViewCache(
+                maxsize=settings.MONTH_VIEW_CACHE_MAX_SIZE,
+                ttl=settings.MONTH_VIEW_CACHE_TTL_SECONDS
+            )
+    return _cache
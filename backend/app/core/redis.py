@@ -0,0 +1,38 @@
+'''
+- Redis(또는 Redis 프로토콜 호환 서버) 공용 클라이언트
+- redis 패키지는 선택 의존성: REDIS_URL이 없거나 패키지가 설치되지 않았으면 None을 반환하고,
+  사용하는 쪽(캐시 등)은 프로세스 내 구현으로 대체
+'''
+from loguru import logger
+
+from app.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+_client = None
+_warned = False
+
+def get_redis():
+    """공용 Redis 클라이언트를 반환 (사용할 수 없으면 None)"""
+    global _client, _warned
+    if _client is not None or not settings.REDIS_URL:
+        return _client
+    
+    if aioredis is None:
+        if not _warned:
+            logger.warning("REDIS_URL이 설정되었지만 redis 패키지가 설치되어 있지 않아 프로세스 내 저장소를 사용합니다.")
+            _warned = True
+        return None
+    
+    _client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+async def close_redis() -> None:
+    """공용 Redis 클라이언트 정리 (lifespan 종료 시 호출)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
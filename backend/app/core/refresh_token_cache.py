@@ -0,0 +1,107 @@
+'''
+- Refresh Token 상태(jti -> 사용자 ID, 무효화 여부) 캐시
+- 토큰 갱신 시 "이 jti가 유효한가"를 Postgres 조회 없이 판단하기 위해 사용
+- RefreshTokenRepository가 생성/무효화 시점에 함께 기록 (Write-Through), 캐시에 없으면 DB에서 다시 채움
+- Redis를 사용할 수 있으면 Redis(워커 간 공유), 아니면 프로세스 내 LRU 캐시 사용
+  (프로세스 내 캐시는 다른 워커의 무효화를 알 수 없으므로 무효화된 상태만 저장하고, 유효한 토큰은 항상 DB에서 확인)
+'''
+import json
+import time
+from datetime import datetime, timezone
+from typing import NamedTuple, Protocol
+from loguru import logger
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+class RefreshTokenState(NamedTuple):
+    user_id: int
+    is_revoked: bool
+
+def seconds_until(expires_at: datetime) -> float:
+    """만료 시각까지 남은 시간(초), timezone 정보가 없으면 UTC로 간주"""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp() - time.time()
+
+class RefreshTokenStateCache(Protocol):
+    async def get(self, jti: str) -> RefreshTokenState | None: ...
+    async def set(self, jti: str, state: RefreshTokenState, expires_at: datetime) -> None: ...
+    async def clear(self) -> None: ...
+
+class InMemoryRefreshTokenStateCache:
+    """
+    프로세스 내 LRU 캐시 (워커 간 공유되지 않음), 항목은 토큰 만료와 최대 TTL 중 빠른 시점에 제거
+    - 다른 워커에서 로그아웃한 토큰을 유효한 것으로 잘못 판단하지 않도록 무효화된 상태만 저장
+      (무효화는 되돌릴 수 없으므로 캐시된 상태가 틀릴 일이 없음)
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[str, RefreshTokenState] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, jti: str) -> RefreshTokenState | None:
+        return self._cache.get(jti)
+
+    async def set(self, jti: str, state: RefreshTokenState, expires_at: datetime) -> None:
+        ttl = min(self._cache.ttl, seconds_until(expires_at))
+        if state.is_revoked and ttl > 0:
+            self._cache.set(jti, state, ttl=ttl)
+        else:
+            self._cache.delete(jti)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+class RedisRefreshTokenStateCache:
+    """Redis 캐시 (모든 워커가 공유), 토큰 만료 시각에 키가 제거되며 오류 시 캐시 미스로 처리"""
+    KEY_PREFIX = "refresh_token:"
+
+    def __init__(self, client):
+        self.client = client
+
+    def _key(self, jti: str) -> str:
+        return f"{self.KEY_PREFIX}{jti}"
+
+    async def get(self, jti: str) -> RefreshTokenState | None:
+        try:
+            raw = await self.client.get(self._key(jti))
+        except Exception as e:
+            logger.warning(f"Refresh token state cache get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        user_id, is_revoked = json.loads(raw)
+        return RefreshTokenState(user_id=user_id, is_revoked=is_revoked)
+
+    async def set(self, jti: str, state: RefreshTokenState, expires_at: datetime) -> None:
+        ttl = int(seconds_until(expires_at))
+        try:
+            if ttl > 0:
+                await self.client.set(self._key(jti), json.dumps(list(state)), ex=ttl)
+            else:
+                await self.client.delete(self._key(jti))
+        except Exception as e:
+            logger.warning(f"Refresh token state cache set failed: {e}")
+
+    async def clear(self) -> None:
+        try:
+            async for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}*"):
+                await self.client.delete(key)
+        except Exception as e:
+            logger.warning(f"Refresh token state cache clear failed: {e}")
+
+_cache: RefreshTokenStateCache | None = None
+
+def get_refresh_token_state_cache() -> RefreshTokenStateCache:
+    """공용 Refresh Token 상태 캐시를 반환 (Redis 우선, 없으면 프로세스 내 캐시)"""
+    global _cache
+    if _cache is None:
+        client = get_redis()
+        if client is not None:
+            _cache = RedisRefreshTokenStateCache(client)
+        else:
+            _cache = InMemoryRefreshTokenStateCache(
+                maxsize=settings.REFRESH_TOKEN_STATE_CACHE_MAX_SIZE,
+                ttl=settings.REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS
+            )
+    return _cache
@@ -0,0 +1,197 @@
+'''
+- 공용 재시도 정책
+  1. 호출별 마감 시간(deadline): 재시도와 대기 시간을 모두 포함한 전체 시간 제한, 남은 시간이 없으면 재시도하지 않음
+  2. 지수 백오프 + Full Jitter: 대기 시간 = random(0, min(max_delay, base_delay * 2^(시도-1)))
+  3. 재시도 가능한 오류만 재시도 (retry_on으로 판단)
+  4. 프로세스 전체 재시도 예산: 요청 수의 일정 비율(예: 10%)만큼만 추가 재시도를 허용하여 장애 시 부하 증폭 방지
+- 정책 이름별로 시도 횟수, 재시도, 예산 소진, 마감 초과 횟수를 집계
+'''
+import asyncio
+import functools
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from loguru import logger
+
+from app.config import settings
+
+T = TypeVar("T")
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+    - 요청마다 ratio개의 토큰이 쌓이고, 재시도 한 번에 토큰 1개를 사용
+    - 요청이 적을 때도 최소한의 재시도는 가능하도록 초당 min_per_second개씩 충전
+    """
+    def __init__(self, ratio: float, min_per_second: float, max_tokens: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+
+    def record_request(self) -> None:
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def stats(self) -> dict[str, float]:
+        self._refill()
+        return {
+            "tokens": self.tokens,
+            "max_tokens": self.max_tokens,
+            "ratio": self.ratio,
+        }
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Args:
+        name: 지표 집계용 이름
+        retry_on: 재시도 가능한 오류인지 판단하는 함수
+        max_attempts: 최대 시도 횟수 (첫 시도 포함)
+        base_delay: 백오프 기본 대기 시간(초)
+        max_delay: 백오프 최대 대기 시간(초)
+        deadline: 호출 전체 마감 시간(초), None이면 제한 없음
+    """
+    name: str
+    retry_on: Callable[[BaseException], bool]
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 4.0
+    deadline: float | None = None
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (Full Jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+class RetryMetrics:
+    """정책별 재시도 지표"""
+    def __init__(self):
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.budget_exhausted = 0
+        self.deadline_exceeded = 0
+        # 호출이 끝날 때까지 사용한 시도 횟수 분포 {시도 횟수: 호출 수}
+        self.attempts: Counter[int] = Counter()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "budget_exhausted": self.budget_exhausted,
+            "deadline_exceeded": self.deadline_exceeded,
+            "attempts": dict(self.attempts),
+        }
+
+retry_budget = RetryBudget(
+    ratio=settings.RETRY_BUDGET_RATIO,
+    min_per_second=settings.RETRY_BUDGET_MIN_PER_SECOND,
+    max_tokens=settings.RETRY_BUDGET_MAX_TOKENS,
+)
+_metrics: dict[str, RetryMetrics] = {}
+
+def get_retry_metrics(name: str) -> RetryMetrics:
+    if name not in _metrics:
+        _metrics[name] = RetryMetrics()
+    return _metrics[name]
+
+def retry_stats() -> dict[str, dict]:
+    return {name: metrics.stats() for name, metrics in _metrics.items()}
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: RetryBudget | None = None,
+    deadline: float | None = None,
+) -> T:
+    """
+    정책에 따라 func()를 실행하고, 재시도 가능한 오류면 백오프 후 다시 실행합니다.
+
+    Args:
+        func: 실행할 비동기 함수 (인자 없음)
+        policy: 재시도 정책
+        budget: 재시도 예산 (없으면 프로세스 공용 예산)
+        deadline: 이 호출의 마감 시간(초), 없으면 정책의 deadline 사용
+
+    Raises:
+        마지막 시도의 오류, 마감 시간 초과 시 asyncio.TimeoutError
+    """
+    budget = budget or retry_budget
+    metrics = get_retry_metrics(policy.name)
+    deadline = deadline if deadline is not None else policy.deadline
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    metrics.calls += 1
+    budget.record_request()
+    attempt = 0
+    while True:
+        attempt += 1
+        # 마감 시간으로 중단된 것인지는 시계를 다시 읽지 않고 타임아웃 컨텍스트의 만료 여부로 판단
+        # (func 자체가 던진 TimeoutError는 일반 시도 오류로 처리)
+        deadline_timeout = asyncio.timeout(deadline_at - time.monotonic()) if deadline_at is not None else None
+        try:
+            if deadline_timeout is None:
+                result = await func()
+            else:
+                async with deadline_timeout:
+                    result = await func()
+        except Exception as e:
+            if deadline_timeout is not None and deadline_timeout.expired():
+                metrics.deadline_exceeded += 1
+                reason = "deadline exceeded"
+            elif not policy.retry_on(e):
+                reason = "not retryable"
+            elif attempt >= policy.max_attempts:
+                reason = "max attempts reached"
+            else:
+                delay = policy.backoff(attempt)
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    metrics.deadline_exceeded += 1
+                    reason = "no time left before deadline"
+                elif not budget.try_spend():
+                    metrics.budget_exhausted += 1
+                    reason = "retry budget exhausted"
+                else:
+                    metrics.retries += 1
+                    logger.warning(
+                        f"[{policy.name}] attempt {attempt} failed ({type(e).__name__}: {e}), retrying in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+            metrics.failures += 1
+            metrics.attempts[attempt] += 1
+            logger.warning(f"[{policy.name}] giving up after {attempt} attempt(s): {reason}")
+            raise
+
+        metrics.successes += 1
+        metrics.attempts[attempt] += 1
+        return result
+
+def retrying(policy: RetryPolicy, budget: RetryBudget | None = None):
+    """call_with_retry를 적용하는 데코레이터 (비동기 함수/메서드용)"""
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            return await call_with_retry(lambda: func(*args, **kwargs), policy, budget)
+        return wrapper
+    return decorator
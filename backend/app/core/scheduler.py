@@ -2,16 +2,23 @@
 - AsyncIOScheduler 사용 (비동기 지원)
 - 각 Job 함수는 매 실행마다 새로운 DB 세션을 생성하여 독립성 보장
 - AIService는 브리핑 생성 시 채팅 내역이 필요 없으므로 chat_repo=None으로 초기화하여 리소스를 절약
+- 모닝 브리핑은 사용자 청크 단위로 일정을 일괄 조회하고, AI 생성은 병렬 처리 (BRIEFING_CONCURRENCY로 동시 실행 수 제한)
+  다음 청크의 생성을 미리 시작해 두어 청크 경계에서도 동시 실행 자리가 비지 않도록 함 (DB 작업은 청크 순서대로 실행)
 '''
 import os
+import math
+import time
+import asyncio
+from collections import deque
 from datetime import datetime
 from loguru import logger
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, NamedTuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.session import AsyncSessionFactory
 from app.repositories.schedule_repo import ScheduleRepository
 from app.repositories.chat_repo import ChatRepository
@@ -20,8 +27,8 @@ from app.repositories.notification_repo import NotificationRepository
 from app.repositories.job_history_repo import JobHistoryRepository
 
 from app.services.cleanup_service import CleanupService
-from app.services.briefing_service import BriefingService
-from app.services.ai_service import AIService
+from app.services.briefing_service import BriefingOutcome, BriefingService, BriefingStatus
+from app.services.ai_service import AIService, briefing_cache
 
 scheduler = AsyncIOScheduler()
 
@@ -106,27 +113,142 @@ async def _cleanup_logic(session: AsyncSession) -> str:
     
     return f"Schedules: {deleted_schedules}, Chats: {deleted_chats}"
 
+async def _save_briefing_chunk(outcomes: list[BriefingOutcome], ai_service: AIService) -> bool:
+    """
+    생성된 브리핑을 새 세션에서 저장 (실패 시 BRIEFING_SAVE_MAX_ATTEMPTS까지 재시도)
+    - 저장에 실패해도 LLM이 생성한 브리핑은 briefing_cache에 남아 있으므로 재실행 시 LLM을 다시 호출하지 않음
+    """
+    batch_logger = logger.bind(batch=True)
+    attempts = max(1, settings.BRIEFING_SAVE_MAX_ATTEMPTS)
+    for attempt in range(1, attempts + 1):
+        async with AsyncSessionFactory() as session:
+            try:
+                briefing_service = BriefingService(
+                    schedule_repo = ScheduleRepository(session),
+                    notification_repo = NotificationRepository(session),
+                    ai_service = ai_service
+                )
+                await briefing_service.save_daily_briefings(outcomes)
+                await session.commit()
+                return True
+            except Exception as e:
+                await session.rollback()
+                batch_logger.warning(
+                    f"[morning_briefing] Saving chunk of {len(outcomes)} briefings failed "
+                    f"(attempt {attempt}/{attempts}). Error: {e}"
+                )
+        if attempt < attempts:
+            await asyncio.sleep(settings.BRIEFING_SAVE_RETRY_DELAY_SECONDS)
+    
+    batch_logger.error(
+        f"[morning_briefing] Gave up saving briefings for users {[outcome.user_id for outcome in outcomes]}"
+    )
+    return False
+
+class _BriefingChunk(NamedTuple):
+    """AI 생성이 진행 중인 사용자 청크 (task가 None이면 일정 조회 실패)"""
+    user_ids: list[int]
+    started_at: float
+    task: "asyncio.Task[list[BriefingOutcome]] | None"
+
+async def _start_briefing_chunk(user_ids: list[int], ai_service: AIService, semaphore: asyncio.Semaphore) -> _BriefingChunk:
+    """
+    청크 전용 세션에서 오늘 일정을 일괄 조회(쿼리 1회)하고, AI 병렬 생성을 백그라운드 태스크로 시작
+    - 생성은 DB를 사용하지 않으므로 세션은 조회 직후 닫음 (LLM 호출 동안 커넥션을 점유하지 않음)
+    - 조회에 실패하면 태스크 없이 반환 (_finish_briefing_chunk에서 모두 FAILED 처리)
+    """
+    started_at = time.perf_counter()
+    try:
+        async with AsyncSessionFactory() as session:
+            briefing_service = BriefingService(
+                schedule_repo = ScheduleRepository(session),
+                notification_repo = NotificationRepository(session),
+                ai_service = ai_service
+            )
+            schedules_by_user = await briefing_service.load_daily_schedules(user_ids)
+    except Exception as e:
+        logger.bind(batch=True).warning(f"[morning_briefing] Loading schedules for {len(user_ids)} users FAILED. Error: {e}")
+        return _BriefingChunk(user_ids, started_at, None)
+    
+    task = asyncio.create_task(briefing_service.generate_briefings(user_ids, schedules_by_user, semaphore))
+    return _BriefingChunk(user_ids, started_at, task)
+
+async def _finish_briefing_chunk(chunk: _BriefingChunk, ai_service: AIService) -> list[BriefingOutcome]:
+    """
+    청크의 AI 생성이 끝나기를 기다린 뒤, 새 세션에서 알림 bulk INSERT 1회 (실패 시 저장만 재시도)
+    - 사용자별 생성 결과(SUCCESS/FALLBACK/FAILED, 처리 시간)를 반환, 조회/생성/저장에 실패하면 모두 FAILED
+    """
+    try:
+        if chunk.task is None:
+            raise RuntimeError("schedules were not loaded")
+        outcomes = await chunk.task
+    except Exception as e:
+        logger.bind(batch=True).warning(f"[morning_briefing] Chunk of {len(chunk.user_ids)} users FAILED. Error: {e}")
+        elapsed = time.perf_counter() - chunk.started_at
+        return [BriefingOutcome(user_id, BriefingStatus.FAILED, elapsed, None) for user_id in chunk.user_ids]
+    
+    if not await _save_briefing_chunk(outcomes, ai_service):
+        return [outcome._replace(status=BriefingStatus.FAILED) for outcome in outcomes]
+    
+    for outcome in outcomes:
+        logger.debug(f"[morning_briefing] User {outcome.user_id} done in {outcome.latency:.2f}s (status={outcome.status.value})")
+    return outcomes
+
 async def _briefing_logic(session: AsyncSession) -> str:
     """AI 모닝 브리핑 생성 (매일 아침 7시)"""
     user_repo = UserRepository(session)
-    briefing_service = BriefingService(
-        schedule_repo = ScheduleRepository(session),
-        notification_repo = NotificationRepository(session),
-        ai_service = AIService()
-    )
+    # AI 클라이언트는 모든 워커가 공유
+    ai_service = AIService()
     
-    # 모든 사용자 조회
-    users = await user_repo.get_all_users()
-    success_count = 0
-    fail_count = 0
+    # 동시 실행 수 제한
+    concurrency = max(1, settings.BRIEFING_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    # 동시에 생성 중인 청크 수: 현재 청크가 끝나갈 때 다음 청크의 사용자가 자리를 바로 채울 수 있도록
+    # 최소 2개 (청크가 동시 실행 수보다 작으면 자리를 채울 만큼 더), 메모리는 이 청크 수만큼만 사용
+    max_chunks_in_flight = max(2, math.ceil(concurrency / settings.BATCH_CHUNK_SIZE) + 1)
+    started_at = time.perf_counter()
+    cache_hits_before = briefing_cache.hits
+    cache_misses_before = briefing_cache.misses
     
-    for user in users:
-        try:
-            await briefing_service.create_daily_briefing(user.id)
-            success_count += 1
-        except Exception:
-            fail_count += 1
-    return f"Total Users: {len(users)}, Success: {success_count}, Failed: {fail_count}"
+    total_count = 0
+    status_counts = {status: 0 for status in BriefingStatus}
+    total_latency = 0.0
+    max_latency = 0.0
+    
+    def _collect(outcomes: list[BriefingOutcome]) -> None:
+        nonlocal total_count, total_latency, max_latency
+        for outcome in outcomes:
+            total_count += 1
+            status_counts[outcome.status] += 1
+            total_latency += outcome.latency
+            max_latency = max(max_latency, outcome.latency)
+    
+    # 사용자 ID를 청크 단위로 스트리밍하여 메모리 사용량을 일정하게 유지 (청크는 각자 세션을 쓰므로 ID만 조회)
+    # 일정 조회/알림 저장(DB)은 청크 순서대로 하나씩, AI 생성만 여러 청크가 겹쳐서 실행
+    in_flight: deque[_BriefingChunk] = deque()
+    try:
+        async for user_ids in user_repo.iter_user_ids_in_chunks(chunk_size=settings.BATCH_CHUNK_SIZE):
+            in_flight.append(await _start_briefing_chunk(user_ids, ai_service, semaphore))
+            if len(in_flight) >= max_chunks_in_flight:
+                _collect(await _finish_briefing_chunk(in_flight.popleft(), ai_service))
+        while in_flight:
+            _collect(await _finish_briefing_chunk(in_flight.popleft(), ai_service))
+    finally:
+        # 사용자 조회 실패 등으로 중단된 경우 남은 생성 작업 취소
+        for chunk in in_flight:
+            if chunk.task is not None:
+                chunk.task.cancel()
+    elapsed = time.perf_counter() - started_at
+    
+    avg_latency = total_latency / total_count if total_count else 0.0
+    
+    # Fallback: LLM 실패로 일정 목록만 담은 대체 문구를 저장한 사용자 수 (Success에 포함하지 않음)
+    return (
+        f"Total Users: {total_count}, Success: {status_counts[BriefingStatus.SUCCESS]}, "
+        f"Failed: {status_counts[BriefingStatus.FAILED]}, Fallback: {status_counts[BriefingStatus.FALLBACK]}, "
+        f"Avg Latency: {avg_latency:.2f}s, Max Latency: {max_latency:.2f}s, Elapsed: {elapsed:.2f}s, "
+        f"Cache Hits: {briefing_cache.hits - cache_hits_before}, Cache Misses: {briefing_cache.misses - cache_misses_before}"
+    )
 
 # ---------------------------------------------------------------------------
 # 4. Job 진입점 (Entry Point)
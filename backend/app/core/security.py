@@ -1,4 +1,10 @@
 
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
 from passlib.context import CryptContext
 from datetime import datetime, timezone, timedelta
 from jose import jwt
@@ -6,6 +12,7 @@ from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
 from uuid import uuid4
 
 from app.config import settings
+from app.core.cache import TTLCache
 from app.core.exceptions import (
     CredentialException,
     InvalidTokenException,
@@ -51,6 +58,82 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+# ------------------------------------------------------------------------------
+# 비동기 버전: bcrypt는 호출당 수백 ms 동안 CPU를 사용하므로 이벤트 루프에서 직접 호출하면
+# 같은 워커의 다른 요청(일정, 채팅)이 모두 멈춤 -> 크기가 제한된 전용 스레드 풀에서 실행
+# (bcrypt 연산 중에는 GIL이 해제되므로 스레드 풀로 충분)
+# ------------------------------------------------------------------------------
+T = TypeVar("T")
+
+class PasswordHashPool:
+    """
+    비밀번호 해시/검증 전용 스레드 풀 + 대기열 지표
+    - queued: 스레드를 기다리는 작업 수 (대기열 깊이)
+    - running: 실행 중인 작업 수
+    - max_queued: 관측된 최대 대기열 깊이
+    - total_wait_seconds: 대기열에서 기다린 시간의 합
+    """
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+        self.total_wait_seconds = 0.0
+        
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        return self._executor
+    
+    async def run(self, func: Callable[..., T], *args) -> T:
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            
+        def _task() -> T:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_seconds += time.perf_counter() - submitted_at
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+        
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), _task)
+    
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "max_queued": self.max_queued,
+                "avg_wait_seconds": self.total_wait_seconds / self.completed if self.completed else 0.0,
+            }
+    
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_hash_pool = PasswordHashPool(max_workers=settings.PASSWORD_HASH_WORKERS)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 전용 스레드 풀에서 실행 (async 핸들러/서비스에서 사용)"""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash를 전용 스레드 풀에서 실행 (async 핸들러/서비스에서 사용)"""
+    return await password_hash_pool.run(get_password_hash, password)
+
 # ==============================================================================
 # Token Creation & Verification
 # ==============================================================================
@@ -100,6 +183,33 @@ def create_refresh_token(data: dict) -> str:
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM 
     )
 
+# 검증이 끝난 Access Token 캐시: sha256(token) -> payload
+# - 같은 쿠키로 반복 요청할 때 서명(HMAC) 검증과 JSON 파싱을 건너뜀
+# - 항목의 TTL은 토큰의 남은 유효 시간이므로 exp 시점에 자동으로 제거됨
+# - 원문 토큰 대신 digest를 키로 사용
+_access_token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+def _cache_access_token(digest: bytes, payload: dict) -> None:
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+    remaining = exp - time.time()
+    if remaining > 0:
+        _access_token_cache.set(digest, payload, ttl=remaining)
+
+def clear_token_cache() -> None:
+    """검증된 Access Token 캐시를 비웁니다. (테스트, 키 교체 시 사용)"""
+    _access_token_cache.clear()
+
+def token_cache_stats() -> dict:
+    return _access_token_cache.stats()
+
 def verify_token(token: str, token_type: str = "access") -> dict:
     """
     토큰을 검증하고 페이로드를 반환합니다
@@ -116,7 +226,13 @@ def verify_token(token: str, token_type: str = "access") -> dict:
         InvalidTokenException: 토큰 형식이 잘못되었을 때
         CredentialException: 자격 증명 오류 시
     """
-    logger.debug(f"토큰 검즘 시작 : {token} [Type: {token_type}]")
+    # Access Token은 캐시에서 먼저 조회 (캐시된 payload 보호를 위해 복사본 반환)
+    digest = None
+    if token_type == "access":
+        digest = _token_digest(token)
+        cached = _access_token_cache.get(digest)
+        if cached is not None:
+            return dict(cached)
     
     try:
         payload= jwt.decode(
@@ -130,6 +246,8 @@ def verify_token(token: str, token_type: str = "access") -> dict:
             logger.warning(f"잘못된 토큰 타입 - 기대: {token_type}, 실제: {payload_token_type}")
             raise InvalidTokenException(f"잘못된 토큰 타입입니다.: Expected: {token_type}")
         
+        if digest is not None:
+            _cache_access_token(digest, dict(payload))
         return payload
     
     except ExpiredSignatureError:
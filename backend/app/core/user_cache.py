@@ -0,0 +1,35 @@
+'''
+- 인증 사용자(User) 스냅샷 캐시
+- 매 요청마다 get_current_user가 users 테이블을 조회하지 않도록 id 기준으로 컬럼 값을 짧게 캐싱
+- 세션 간에 ORM 객체를 공유하지 않도록 컬럼 값만 저장하고, 조회할 때마다 새 (detached) User 객체를 만들어 반환
+- 사용자 삭제 시 UserRepository가 무효화 (사용자 정보를 수정하는 경로를 추가하면 함께 무효화해야 함)
+'''
+from typing import Any
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.user import User
+
+_user_cache: TTLCache[int, dict[str, Any]] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+def get_cached_user(user_id: int) -> User | None:
+    """캐시된 사용자 스냅샷을 detached User 객체로 반환 (relationship은 로딩되지 않음)"""
+    values = _user_cache.get(user_id)
+    if values is None:
+        return None
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+def cache_user(user: User) -> None:
+    _user_cache.set(user.id, {column.key: getattr(user, column.key) for column in User.__table__.columns})
+    
+def invalidate_user(user_id: int) -> None:
+    _user_cache.delete(user_id)
+    
+def clear_user_cache() -> None:
+    _user_cache.clear()
@@ -0,0 +1,69 @@
+'''
+- 트랜잭션이 끝난 뒤(커밋/롤백) 실행할 비동기 콜백 등록
+- 캐시 무효화처럼 커밋된 데이터를 기준으로 해야 하는 작업에 사용
+  (flush 직후에 무효화하면 커밋 전에 들어온 조회가 이전 데이터로 캐시를 다시 채울 수 있음)
+- SQLAlchemy 세션 이벤트는 동기 함수이므로 콜백은 이벤트 루프의 태스크로 실행
+- 최상위 트랜잭션이 끝날 때 커밋되었으면 after_commit, 아니면(롤백/커밋 없이 close) after_rollback 콜백을 실행
+'''
+import asyncio
+from typing import Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+TransactionCallback = Callable[[], Awaitable[None]]
+
+_COMMIT_CALLBACKS = "after_commit_callbacks"
+_ROLLBACK_CALLBACKS = "after_rollback_callbacks"
+_COMMITTED = "transaction_committed"
+
+# 실행 중인 콜백 태스크 (GC로 사라지지 않도록 참조 유지)
+_tasks: set[asyncio.Task] = set()
+
+def after_commit(session: AsyncSession, callback: TransactionCallback) -> None:
+    """현재 트랜잭션이 커밋된 뒤 callback()을 실행"""
+    session.info.setdefault(_COMMIT_CALLBACKS, []).append(callback)
+
+def after_rollback(session: AsyncSession, callback: TransactionCallback) -> None:
+    """현재 트랜잭션이 커밋되지 않고 끝난 뒤 callback()을 실행"""
+    session.info.setdefault(_ROLLBACK_CALLBACKS, []).append(callback)
+
+async def drain_transaction_callbacks() -> None:
+    """예약된 콜백이 모두 끝날 때까지 대기 (테스트/종료 시 사용)"""
+    while _tasks:
+        await asyncio.gather(*_tasks, return_exceptions=True)
+
+async def _run(callback: TransactionCallback) -> None:
+    try:
+        await callback()
+    except Exception as e:
+        logger.error(f"Transaction callback failed: {e}")
+
+def _schedule(callbacks: list[TransactionCallback]) -> None:
+    if not callbacks:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning(f"No running event loop, {len(callbacks)} transaction callback(s) skipped")
+        return
+    for callback in callbacks:
+        task = loop.create_task(_run(callback))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info[_COMMITTED] = True
+
+@event.listens_for(Session, "after_transaction_end")
+def _run_callbacks(session: Session, transaction: SessionTransaction) -> None:
+    # SAVEPOINT 등 하위 트랜잭션은 무시
+    if transaction.parent is not None:
+        return
+    committed = session.info.pop(_COMMITTED, False)
+    on_commit = session.info.pop(_COMMIT_CALLBACKS, [])
+    on_rollback = session.info.pop(_ROLLBACK_CALLBACKS, [])
+    _schedule(on_commit if committed else on_rollback)
@@ -2,7 +2,7 @@
 # 이를 위한 설정 파일
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import BackgroundTasks, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repo import UserRepository
@@ -14,9 +14,11 @@ from app.services.auth_service import AuthService
 from app.services.schedule_service import ScheduleService
 from app.services.ai_service import AIService
 
+from app.core.admission import AdmissionController, get_ai_admission_controller
 from app.core.exceptions import CredentialException, ExpiredTokenException, InvalidTokenException
 from app.core.security import oauth2_scheme, verify_token
 from app.db.session import get_db
+from app.config import settings
 from app.models.user import User
 from app.schemas.auth import TokenPayload
 
@@ -56,13 +58,8 @@ def get_schedule_service(
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
 ScheuduleServiceDep = Annotated[ScheduleService, Depends(get_schedule_service)]
 
-async def get_current_user(
-    request: Request,
-    user_repo: UserRepoDep,
-) -> User:
-    """
-    HTTPOnly 쿠키에서 JWT Access Token을 검증하고 현재 인증된 사용자 객체를 반환합니다.
-    """
+def _get_access_token_payload(request: Request) -> TokenPayload:
+    """HTTPOnly 쿠키의 JWT Access Token을 검증하고 페이로드를 반환합니다."""
     token = request.cookies.get("access_token")
     
     if not token:
@@ -70,27 +67,68 @@ async def get_current_user(
      
     try:
         payload = verify_token(token, token_type="access")
-        token_data = TokenPayload(**payload)
+        return TokenPayload(**payload)
     
     except (InvalidTokenException, ExpiredTokenException):
         raise CredentialException(detail="토큰 검증에 실패했습니다.")
+
+async def get_current_user(
+    request: Request,
+    user_repo: UserRepoDep,
+) -> User:
+    """
+    HTTPOnly 쿠키에서 JWT Access Token을 검증하고 현재 인증된 사용자 객체를 반환합니다.
+    토큰에 사용자 ID(uid)가 있으면 사용자 캐시를 먼저 확인하고, 캐시 미스일 때만 DB를 조회합니다.
+    """
+    token_data = _get_access_token_payload(request)
     
-    user = await user_repo.get_by_email(email=token_data.sub)
+    if token_data.uid is not None:
+        user = await user_repo.get_cached(token_data.uid)
+    else:
+        # uid 클레임이 없는 이전 형식의 토큰
+        user = await user_repo.get_by_email(email=token_data.sub)
     
     if user is None:
         raise CredentialException(detail="사용자를 찾을 수 없습니다.")
     
     return user
 
+async def get_current_user_id(
+    request: Request,
+    user_repo: UserRepoDep,
+) -> int:
+    """
+    사용자 ID만 필요한 엔드포인트용 인증 의존성
+    토큰의 uid 클레임을 그대로 사용하므로 DB를 조회하지 않습니다. (이전 형식의 토큰만 이메일로 조회)
+    """
+    token_data = _get_access_token_payload(request)
+    if token_data.uid is not None:
+        return token_data.uid
+    
+    user = await user_repo.get_by_email(email=token_data.sub)
+    if user is None:
+        raise CredentialException(detail="사용자를 찾을 수 없습니다.")
+    return user.id
+
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
+CurrentUserIdDep = Annotated[int, Depends(get_current_user_id)]
 
 # AI Service 의존성 주입 함수
 def get_ai_service(
     chat_repo: ChatRepoDep,
     user_repo: UserRepoDep,
-    schedule_service: ScheuduleServiceDep
+    schedule_service: ScheuduleServiceDep,
+    background_tasks: BackgroundTasks
 ) -> AIService:
-    """AIService 인스턴스를 제공합니다."""
-    return AIService(chat_repo=chat_repo, user_repo=user_repo, schedule_service=schedule_service )
-
-AIServiceDep = Annotated[AIService, Depends(get_ai_service)]
\ No newline at end of file
+    """AIService 인스턴스를 제공합니다. (설정에 따라 대화 저장은 응답 전송 이후 실행)"""
+    return AIService(
+        chat_repo=chat_repo,
+        user_repo=user_repo,
+        schedule_service=schedule_service,
+        background_tasks=background_tasks if settings.CHAT_PERSIST_IN_BACKGROUND else None
+    )
+
+AIServiceDep = Annotated[AIService, Depends(get_ai_service)]
+
+# AI 엔드포인트 수용 제어기 (프로세스 공용)
+AIAdmissionDep = Annotated[AdmissionController, Depends(get_ai_admission_controller)]
@@ -10,6 +10,10 @@ from app.api.v1 import schedules as schedules_router
 from app.api.v1 import ai as ai_router
 from app.core.limiter import limiter, rate_limit_handler
 from app.core.scheduler import start_scheduler, shutdown_scheduler
+from app.services.llm_runtime import get_llm_runtime, shutdown_llm_runtime
+from app.core.redis import close_redis
+from app.core.security import password_hash_pool
+from app.core.metrics import collect_runtime_metrics
 
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.errors import RateLimitExceeded
@@ -26,9 +30,14 @@ logger.add(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # LLM 클라이언트/Chain은 프로세스당 한 번만 생성하여 모든 요청이 공유
+    get_llm_runtime().pool.start_health_checks()
     await start_scheduler()
     yield
     shutdown_scheduler()
+    await shutdown_llm_runtime()
+    await close_redis()
+    password_hash_pool.shutdown()
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
@@ -71,3 +80,16 @@ def health_check() -> dict[str, str]:
     서버가 정상적으로 실행 중이면 'status: ok'를 반환합니다.
     """
     return {"status": "ok"}
+
+@app.get(
+    "/health/metrics",
+    status_code=status.HTTP_200_OK,
+    tags=["Health Check"],
+    summary="런타임 지표 조회"
+)
+def runtime_metrics() -> dict:
+    """
+    이 요청을 처리한 워커(pid)의 런타임 지표를 반환합니다.
+    LLM 호출 대기열, AI 요청 수용/거절 횟수, 의도 분류 결과, 비밀번호 해시 대기열, 재시도 예산/횟수를 포함합니다.
+    """
+    return collect_runtime_metrics()
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 class JobHistory(Base):
     """배치 작업 실행 이력을 저장하는 모델"""
     __tablename__ = "job_histories"
+    __table_args__ = (
+        # 작업별 오늘 실행 이력 조회 (job_name + created_at 범위)
+        Index("ix_job_histories_job_name_created_at", "job_name", "created_at"),
+    )
     
     # id SERIAL PRIMARY KEY,
     # job_name VARCHAR(50) NOT NULL, -- 'morning_briefing', 'daily_cleanup'
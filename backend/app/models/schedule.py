@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Date, Time
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Date, Time, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -10,6 +10,15 @@ class Schedule(Base):
     사용자 일정을 저장하는 ORM 모델
     """
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 캘린더 조회(user_id + 날짜 범위, start_time 정렬)용 복합 부분 인덱스 - 삭제되지 않은 일정만 포함
+        Index(
+            "ix_schedules_user_id_date_start_time_active",
+            "user_id", "date", "start_time",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True, comment="일정 고유 ID")
     title = Column(String(255), nullable=False, index=True, comment="일정 제목")
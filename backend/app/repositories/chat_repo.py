@@ -1,7 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 from app.repositories.base import BaseRepository
 from app.models.chat import ChatHistory, ChatRole
+from app.core.chat_history_cache import get_chat_history_cache
+from app.db.hooks import after_commit
 from datetime import datetime
 
 class ChatRepository(BaseRepository[ChatHistory]): # 제네릭 상속
@@ -16,6 +18,25 @@ class ChatRepository(BaseRepository[ChatHistory]): # 제네릭 상속
             content = content
         )
     
+    async def bulk_append(self, user_id: int, messages: list[tuple[ChatRole, str]]) -> int:
+        """
+        한 사용자의 여러 메세지(예: 질문/응답 한 쌍)를 단일 multi-row INSERT로 저장
+        - 생성된 id/created_at을 다시 읽지 않으므로 refresh 없이 1번의 왕복으로 끝남
+        - 같은 INSERT 안의 행은 created_at이 같을 수 있으므로, 순서는 id로 구분
+
+        Returns:
+            int: 저장된 행의 개수
+        """
+        if not messages:
+            return 0
+        
+        rows = [
+            {"user_id": user_id, "role": role.value, "content": content, "is_deleted": False}
+            for role, content in messages
+        ]
+        await self.session.execute(insert(self.model).values(rows))
+        return len(rows)
+    
     async def get_recent_chats(self, user_id: int, limit: int = 20) -> list[ChatHistory]:
         """
         사용자의 최근 대화 내역 조회 (AI 컨텍스트용)
@@ -33,8 +54,13 @@ class ChatRepository(BaseRepository[ChatHistory]): # 제네릭 상속
         return list(result.scalars().all())
     
     async def delete(self, chat: ChatHistory) -> ChatHistory:
-        """소프트 삭제"""
-        return await self.soft_delete(chat)
+        """소프트 삭제 (해당 사용자의 대화 캐시도 무효화)"""
+        deleted = await self.soft_delete(chat)
+        history_cache = get_chat_history_cache()
+        await history_cache.invalidate(chat.user_id)
+        # 커밋 전에 다른 요청이 삭제 전 대화로 캐시를 다시 채웠을 수 있으므로 커밋 후에도 무효화
+        after_commit(self.session, lambda: history_cache.invalidate(chat.user_id))
+        return deleted
     
     async def delete_expired_chat(self, cutoff_date: datetime) -> int:
         """
@@ -49,6 +75,10 @@ class ChatRepository(BaseRepository[ChatHistory]): # 제네릭 상속
         """
         stmt = delete(self.model).where(self.model.created_at < cutoff_date)
         result = await self.session.execute(stmt)
-        return result.rowcount
         
-        
\ No newline at end of file
+        # 여러 사용자의 대화가 한 번에 삭제되므로 캐시 전체를 비움
+        if result.rowcount:
+            history_cache = get_chat_history_cache()
+            await history_cache.clear()
+            after_commit(self.session, history_cache.clear)
+        return result.rowcount
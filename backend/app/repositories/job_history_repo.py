@@ -2,9 +2,9 @@
     로그 저장: 배치 실행 결과를 DB - INSERT
     중복 체크: "오늘 이 작업을 성공했는가?" - SELECT
 '''
-from sqlalchemy import select, and_, extract
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import date
+from datetime import date, datetime, time, timedelta
 
 from app.repositories.base import BaseRepository
 from app.models.job_history import JobHistory
@@ -22,17 +22,21 @@ class JobHistoryRepository(BaseRepository[JobHistory]):
         )
     
     async def exists_successful_job_today(self, job_name: str) -> bool:
-        """오늘 날짜에 해당 작업이 'SUCCESS'로 끝난 기록이 있는지 확인"""
+        """
+        오늘 날짜에 해당 작업이 'SUCCESS'로 끝난 기록이 있는지 확인
+        created_at에 함수를 씌우지 않고 [오늘 0시, 내일 0시) 범위로 비교해 인덱스를 사용할 수 있게 함
+        """
         today = date.today()
+        start = datetime.combine(today, time.min)
+        end = start + timedelta(days=1)
         print(f"오늘 성공적인 작업이 존재합니다: {today}")
         stmt = select(self.model).where(
             and_(
                 self.model.job_name == job_name,
                 self.model.status == "SUCCESS",
-                extract('year', self.model.created_at) == today.year,
-                extract('month', self.model.created_at) == today.month,
-                extract('day', self.model.created_at) == today.day
+                self.model.created_at >= start,
+                self.model.created_at < end
             )
-        )
+        ).limit(1)
         result = await self.session.execute(stmt)
         return result.scalars().first() is not None
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.notification import Notification
@@ -15,4 +16,20 @@ class NotificationRepository(BaseRepository[Notification]):
             is_read = False
         )
     
-    
\ No newline at end of file
+    async def bulk_create(self, notifications: list[dict]) -> int:
+        """
+        알림 여러 건을 단일 INSERT 문으로 저장 (배치 작업용)
+        생성된 객체가 필요 없으므로 flush/refresh 없이 실행합니다.
+
+        Args:
+            notifications (list[dict]): user_id, type, content를 담은 딕셔너리 리스트
+
+        Returns:
+            int: 저장된 알림 개수
+        """
+        if not notifications:
+            return 0
+        
+        rows = [{**notification, "is_read": False} for notification in notifications]
+        await self.session.execute(insert(self.model).values(rows))
+        return len(rows)
@@ -1,29 +1,67 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from app.models.refresh_token import RefreshToken
 from app.repositories.base import BaseRepository
+from app.core.refresh_token_cache import (
+    RefreshTokenState,
+    RefreshTokenStateCache,
+    get_refresh_token_state_cache,
+)
 from datetime import datetime
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, state_cache: RefreshTokenStateCache | None = None):
         super().__init__(RefreshToken, session)
-        
+        self.state_cache = state_cache or get_refresh_token_state_cache()
+
     async def create(self, user_id: int, jti: str, expires_at: datetime) -> RefreshToken:
-        return await super().create(
-            user_id=user_id, 
-            token_id=jti, 
+        token = await super().create(
+            user_id=user_id,
+            token_id=jti,
             expires_at=expires_at
         )
-    
+        await self.state_cache.set(jti, RefreshTokenState(user_id=user_id, is_revoked=False), expires_at)
+        return token
+
     async def get_by_jti(self, jti: str) -> RefreshToken | None:
         result = await self.session.execute(select(self.model).filter(self.model.token_id == jti))
         return result.scalars().first()
-    
+
+    async def get_state(self, jti: str) -> RefreshTokenState | None:
+        """
+        jti의 상태(사용자 ID, 무효화 여부)를 조회합니다.
+        캐시를 먼저 확인하고, 없으면 필요한 컬럼만 DB에서 조회한 뒤 캐시에 채웁니다.
+        """
+        state = await self.state_cache.get(jti)
+        if state is not None:
+            return state
+
+        result = await self.session.execute(
+            select(self.model.user_id, self.model.is_revoked, self.model.expires_at)
+            .where(self.model.token_id == jti)
+        )
+        row = result.first()
+        if row is None:
+            return None
+
+        state = RefreshTokenState(user_id=row.user_id, is_revoked=row.is_revoked)
+        await self.state_cache.set(jti, state, row.expires_at)
+        return state
+
     # 토큰 무효화
     async def revoke(self, jti: str) -> RefreshToken | None:
-        token = await self.get_by_jti(jti)
+        """
+        단일 UPDATE ... RETURNING 으로 토큰을 무효화하고, 변경된 상태를 캐시에 기록합니다.
+        """
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.token_id == jti)
+            .values(is_revoked=True)
+            .returning(self.model)
+        )
+        token = result.scalars().first()
         if token:
-            token.is_revoked = True
-            await self.session.flush()
-            await self.session.refresh(token)
-        return token
\ No newline at end of file
+            await self.state_cache.set(
+                jti, RefreshTokenState(user_id=token.user_id, is_revoked=True), token.expires_at
+            )
+        return token
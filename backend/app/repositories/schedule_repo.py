@@ -1,15 +1,37 @@
 from app.repositories.base import BaseRepository
 from app.models.schedule import Schedule
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
+from app.schemas.schedule import ScheduleCreate, ScheduleUpdate, SCHEDULE_RESPONSE_FIELDS
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy import select, extract, delete, and_
-from datetime import datetime, date
+from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy import Row, Select, select, delete, and_, tuple_, func
+from datetime import datetime, date, time
+
+def month_date_range(year: int, month: int) -> tuple[date, date]:
+    """해당 월의 [1일, 다음 달 1일) 반열린 날짜 구간"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
 
 class ScheduleRepository(BaseRepository[Schedule]):
     def __init__(self, session: AsyncSession):
         super().__init__(Schedule, session)
         
+    def _select_schedules(self, load_user: bool = False) -> Select:
+        """
+        일정 조회용 SELECT 생성 (관계 로딩 전략)
+        - 기본: 일정 컬럼만 조회하고 user 관계는 로딩하지 않음 (접근 시 lazy 쿼리 대신 즉시 예외 발생)
+        - load_user=True: user 관계가 필요한 경우에만 selectinload로 함께 조회 (쿼리 1번 추가)
+        """
+        loader = selectinload(self.model.user) if load_user else raiseload(self.model.user)
+        return select(self.model).options(loader)
+    
+    def _select_schedule_rows(self) -> Select:
+        """
+        읽기 전용 Projection 조회용 SELECT 생성
+        - 응답(ScheduleResponse)에 필요한 컬럼만 조회하고, ORM 객체 생성/Identity Map 등록 없이 Row(튜플)로 반환
+        """
+        return select(*(getattr(self.model, field) for field in SCHEDULE_RESPONSE_FIELDS))
+    
     async def create(self, schedule_data: ScheduleCreate, user_id: int) -> Schedule:
         """새로운 일정을 생성하고 DB에 추가합니다."""
         return await super().create(schedule_data, user_id = user_id)
@@ -18,11 +40,9 @@ class ScheduleRepository(BaseRepository[Schedule]):
         """특정 일정을 소프트 삭제 처리합니다."""
         return await self.soft_delete(schedule)
     
-    async def get_schedule_by_id_and_user_id(self, schedule_id: int, user_id: int) -> Schedule | None:
+    async def get_schedule_by_id_and_user_id(self, schedule_id: int, user_id: int, load_user: bool = False) -> Schedule | None:
         """ID와 사용자 ID로 특정 일정을 조회합니다."""
-        stmt = select(self.model).options(
-            selectinload(self.model.user) # N+1 방지 옵션
-        ).where(
+        stmt = self._select_schedules(load_user).where(
             self.model.id == schedule_id,
             self.model.user_id == user_id,
             self.model.is_deleted == False
@@ -30,25 +50,92 @@ class ScheduleRepository(BaseRepository[Schedule]):
         result = await self.session.execute(stmt)
         return result.scalars().one_or_none()
     
-    async def get_schedules_by_user_and_month(self, user_id: int, year: int, month: int) -> list[Schedule]:
-        """특정 사용자의 특정 월에 해당하는 모든 일정을 조회합니다. (소프트 삭제 제외)"""
-        stmt = select(self.model).options(
-            selectinload(self.model.user)
-        ).where(
+    async def get_schedules_by_user_and_month(self, user_id: int, year: int, month: int, load_user: bool = False) -> list[Schedule]:
+        """
+        특정 사용자의 특정 월에 해당하는 모든 일정을 조회합니다. (소프트 삭제 제외)
+        extract(year/month) 대신 날짜 범위 조건을 사용해 (user_id, date, start_time) 인덱스를 탐색
+        """
+        start, end = month_date_range(year, month)
+        stmt = self._select_schedules(load_user).where(
             self.model.user_id == user_id,
             self.model.is_deleted == False,
-            extract("year", self.model.date) == year,
-            extract("month", self.model.date) == month,
+            self.model.date >= start,
+            self.model.date < end,
         ).order_by(self.model.date.asc(), self.model.start_time.asc())
         
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
-    async def get_schedules_by_user_and_date(self, user_id: int, target_date: date) -> list[Schedule]:
+    async def get_schedule_rows_by_user_and_month(self, user_id: int, year: int, month: int) -> list[Row]:
+        """
+        get_schedules_by_user_and_month의 읽기 전용 Projection 버전 (월별 목록 응답용)
+        ScheduleResponse 필드 순서의 Row 목록을 반환합니다.
+        """
+        start, end = month_date_range(year, month)
+        stmt = self._select_schedule_rows().where(
+            self.model.user_id == user_id,
+            self.model.is_deleted == False,
+            self.model.date >= start,
+            self.model.date < end,
+        ).order_by(self.model.date.asc(), self.model.start_time.asc(), self.model.id.asc())
+        
+        result = await self.session.execute(stmt)
+        return list(result.all())
+    
+    async def get_month_version(self, user_id: int, year: int, month: int) -> tuple[int, datetime | None]:
+        """
+        특정 사용자의 월 일정 버전 정보(일정 수, 최종 수정 시각)를 조회합니다. (ETag 생성용)
+        생성/수정/삭제 시 둘 중 하나는 반드시 바뀌므로, 일정 본문을 읽지 않고 변경 여부를 판단할 수 있음
+        """
+        start, end = month_date_range(year, month)
+        stmt = select(func.count(self.model.id), func.max(self.model.updated_at)).where(
+            self.model.user_id == user_id,
+            self.model.is_deleted == False,
+            self.model.date >= start,
+            self.model.date < end,
+        )
+        result = await self.session.execute(stmt)
+        count, last_updated_at = result.one()
+        return count, last_updated_at
+    
+    async def get_schedule_rows_by_user_and_range(
+        self,
+        user_id: int,
+        start: date,
+        end: date,
+        limit: int,
+        after: tuple[date, time, int] | None = None
+    ) -> list[Row]:
+        """
+        특정 사용자의 [start, end) 기간 일정을 (date, start_time, id) 순으로 조회합니다. (소프트 삭제 제외, Projection)
+        after가 주어지면 해당 위치 다음 행부터 조회 (Keyset 페이지네이션)
+
+        Args:
+            start (date): 시작 날짜 (포함)
+            end (date): 종료 날짜 (미포함)
+            limit (int): 최대 조회 행 수
+            after (tuple[date, time, int] | None): 이전 페이지 마지막 행의 (date, start_time, id)
+        """
+        stmt = self._select_schedule_rows().where(
+            self.model.user_id == user_id,
+            self.model.is_deleted == False,
+            self.model.date >= start,
+            self.model.date < end,
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(self.model.date, self.model.start_time, self.model.id) > tuple_(*after)
+            )
+        stmt = stmt.order_by(
+            self.model.date.asc(), self.model.start_time.asc(), self.model.id.asc()
+        ).limit(limit)
+        
+        result = await self.session.execute(stmt)
+        return list(result.all())
+    
+    async def get_schedules_by_user_and_date(self, user_id: int, target_date: date, load_user: bool = False) -> list[Schedule]:
         """특정 사용자의 특정 날짜 일정을 모두 조회합니다."""
-        stmt = select(self.model).options(
-            selectinload(self.model.user)
-        ).where(
+        stmt = self._select_schedules(load_user).where(
             self.model.user_id == user_id,
             self.model.date == target_date,
             self.model.is_deleted == False,
@@ -57,6 +144,23 @@ class ScheduleRepository(BaseRepository[Schedule]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_schedules_by_users_and_date(self, user_ids: list[int], target_date: date) -> list[Schedule]:
+        """
+        여러 사용자의 특정 날짜 일정을 쿼리 한 번으로 조회합니다. (배치 작업용)
+        user_id, start_time 순으로 정렬되어 있어 서비스 계층에서 그대로 그룹핑할 수 있습니다.
+        """
+        if not user_ids:
+            return []
+        
+        stmt = self._select_schedules().where(
+            self.model.user_id.in_(user_ids),
+            self.model.date == target_date,
+            self.model.is_deleted == False,
+        ).order_by(self.model.user_id.asc(), self.model.start_time.asc())
+        
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+    
     async def update(self, schedule: Schedule, update_data: ScheduleUpdate) -> Schedule:
         """특정 일정을 수정합니다."""
         update_dict = update_data.model_dump(exclude_unset=True)
@@ -1,8 +1,10 @@
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
+from app.core.user_cache import get_cached_user, cache_user, invalidate_user
 from app.repositories.base import BaseRepository
 
 class UserRepository(BaseRepository[User]):
@@ -13,12 +15,64 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(select(self.model).filter(self.model.email== email))
         return result.scalars().first()
     
+    async def get_cached(self, user_id: int) -> User | None:
+        """
+        ID로 사용자를 조회합니다. (인증용, 캐시 우선)
+        캐시 적중 시 DB 조회 없이 detached 스냅샷을 반환하므로 relationship 접근은 불가
+        """
+        user = get_cached_user(user_id)
+        if user is not None:
+            return user
+        
+        user = await self.get(user_id)
+        if user is not None:
+            cache_user(user)
+        return user
+    
+    async def delete(self, user: User) -> None:
+        """사용자를 삭제하고 캐시를 무효화합니다."""
+        await super().delete(user)
+        invalidate_user(user.id)
+    
     async def get_all_users(self) -> list[User]:
         result = await self.session.execute(select(self.model))
         return list(result.scalars().all())
     
+    async def iter_user_ids_in_chunks(self, chunk_size: int = 500) -> AsyncIterator[list[int]]:
+        """
+        배치 작업용 사용자 ID 스트리밍 조회 (users.id 기준 Keyset Pagination)
+        - OFFSET 없이 마지막 id 이후만 조회하므로 페이지가 뒤로 갈수록 느려지지 않음
+        - 서버 사이드 커서(stream_scalars)로 청크 단위만 메모리에 올림
+        - 배치 작업은 ID만 사용하므로 id 컬럼만 조회 (User 객체/비밀번호 해시를 Identity Map에 올리지 않음)
+
+        Args:
+            chunk_size (int): 한 번에 가져올 사용자 수
+
+        Yields:
+            list[int]: 오름차순으로 정렬된 사용자 ID 청크
+        """
+        last_id = 0
+        while True:
+            stmt = (
+                select(self.model.id)
+                .where(self.model.id > last_id)
+                .order_by(self.model.id.asc())
+                .limit(chunk_size)
+            )
+            result = await self.session.stream_scalars(stmt)
+            chunk = [user_id async for user_id in result]
+            
+            if not chunk:
+                break
+            
+            yield chunk
+            
+            if len(chunk) < chunk_size:
+                break
+            last_id = chunk[-1]
+    
     async def create(self, user_create: UserCreate) -> User:
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = await get_password_hash_async(user_create.password)
         user_data= user_create.model_dump(exclude={"password"})
         
         return await super().create(user_data, password_hash=hashed_password)
\ No newline at end of file
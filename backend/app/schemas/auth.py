@@ -16,6 +16,8 @@ class TokenPayload(BaseModel):
     """
     JWT 토큰의 페이로드(내용)를 검증하기 위한 스키마입니다.
     'sub' 클레임에 사용자 이메일이 포함되어야 합니다.
+    'uid' 클레임(사용자 ID)은 DB 조회 없이 사용자를 식별하기 위해 사용합니다. (이전에 발급된 토큰에는 없음)
     """
     sub: EmailStr = Field(...)
-    type: str = Field(...)
\ No newline at end of file
+    type: str = Field(...)
+    uid: int | None = None
\ No newline at end of file
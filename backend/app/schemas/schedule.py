@@ -1,5 +1,8 @@
+import orjson
+from typing import Any, Sequence
 from datetime import date as DateType, time as TimeType, datetime
 from pydantic import BaseModel, ConfigDict, field_validator
+from sqlalchemy import Row
 
 class ScheduleBase(BaseModel):
     """일정의 기본 필드를 정의하는 스키마"""
@@ -46,6 +49,31 @@ class ScheduleResponse(ScheduleBase):
     model_config = ConfigDict(
         from_attributes=True
     )
+
+# Projection 조회 컬럼 순서 (= ScheduleResponse 필드 순서, JSON 키 순서도 동일하게 유지)
+SCHEDULE_RESPONSE_FIELDS: tuple[str, ...] = tuple(ScheduleResponse.model_fields)
+
+def schedule_rows_to_dicts(rows: Sequence[Row]) -> list[dict[str, Any]]:
+    """
+    Projection 조회 결과(Row)를 ScheduleResponse와 같은 구조의 dict로 변환
+    - 검증(validator)은 생략하지만 값을 바꾸는 정규화(제목 앞뒤 공백 제거)는 ScheduleResponse와 같게 적용
+    - ScheduleBase에 값을 바꾸는 validator를 추가하면 여기에도 반영해야 함
+    """
+    items = []
+    for row in rows:
+        item = row._asdict()
+        item["title"] = item["title"].strip()
+        items.append(item)
+    return items
+
+def dumps_json(data: Any) -> bytes:
+    """orjson 직렬화 (UTC datetime은 Pydantic과 같게 'Z'로 표기)"""
+    return orjson.dumps(data, option=orjson.OPT_UTC_Z)
+
+class ScheduleRangeResponse(BaseModel):
+    """기간 일정 조회 응답 (Keyset 페이지네이션)"""
+    items: list[ScheduleResponse]
+    next_cursor: str | None = None
     
 
 # 토막 상식
@@ -1,39 +1,76 @@
+from typing import AsyncIterator, Any
 from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
 
 from app.config import settings
 from app.services.memory_service import MemoryService
+from app.services.llm_dispatcher import LLMDispatcher, LLMPriority, get_llm_dispatcher
+from app.services.ollama_pool import OllamaPool
+
+def build_agent_chain(base_url: str | None = None):
+    """
+    일반 대화용 LCEL Chain을 생성합니다. (Prompt -> LLM -> String Output)
+    생성 비용(HTTP 클라이언트 등)이 있으므로 애플리케이션 시작 시 한 번만 만들어 공유합니다. (LLMRuntime)
+    """
+    # LLM 초기화(Ollama)
+    llm = ChatOllama(
+        model = settings.OLLAMA_MODEL,
+        base_url = base_url or settings.OLLAMA_BASE_URL,
+        temperature = 0.7
+    )
+    
+    # 프롬프트 템플릿 설정
+    # system: 역할 부여
+    # history: 이전 대화 내역 삽입 위치 (MessagesPlaceholder 사용)
+    # input: 현재 사용자 입력
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "당신은 사용자의 일정을 관리하고 돕는 친절하고 유능한 AI 비서 'Jeiary'입니다. 한국어로 자연스럽게 대답하세요."),
+        MessagesPlaceholder(variable_name="history"),
+        ("human", "{input}")
+    ])
+    
+    return prompt | llm | StrOutputParser()
 
 class AIAgent:
-    def __init__(self, memory_serivce: MemoryService):
+    def __init__(
+        self,
+        memory_serivce: MemoryService,
+        chain: Runnable | None = None,
+        dispatcher: LLMDispatcher | None = None,
+        pool: OllamaPool | None = None
+    ):
         """
         AIAgent 초기화
         
         Args:
             memory_service: 대화 내역 관리를 위한 서비스
+            chain: 공유 LCEL Chain (pool과 chain이 모두 없으면 새로 생성)
+            dispatcher: LLM 호출 스케줄러 (없으면 공용 스케줄러)
+            pool: Ollama 서버 풀 (있으면 서버별 대화 Chain을 사용하여 서버를 골라 호출)
         """
         self.memory_service = memory_serivce
-        
-        # LLM 초기화(Ollama)
-        self.llm = ChatOllama(
-            model = settings.OLLAMA_MODEL,
-            base_url = settings.OLLAMA_BASE_URL,
-            temperature = 0.7
-        )
-        
-        # 프롬프트 템플릿 설정
-        # system: 역할 부여
-        # history: 이전 대화 내역 삽입 위치 (MessagesPlaceholder 사용)
-        # input: 현재 사용자 입력
-        self.prompt = ChatPromptTemplate.from_messages([
-            ("system", "당신은 사용자의 일정을 관리하고 돕는 친절하고 유능한 AI 비서 'Jeiary'입니다. 한국어로 자연스럽게 대답하세요."),
-            MessagesPlaceholder(variable_name="history"),
-            ("human", "{input}")
-        ])
-        
-        # LCEL Chain 구성: Prompt -> LLM -> String Output
-        self.chain = self.prompt | self.llm | StrOutputParser()
+        self.pool = pool
+        self.chain = chain if chain is not None or pool is not None else build_agent_chain()
+        self.dispatcher = dispatcher or get_llm_dispatcher()
+    
+    async def _invoke(self, inputs: dict) -> str:
+        if self.pool is not None:
+            return await self.pool.run(lambda backend: backend.agent_chain.ainvoke(inputs))
+        return await self.chain.ainvoke(inputs)
+    
+    def _stream(self, inputs: dict) -> AsyncIterator[Any]:
+        if self.pool is not None:
+            return self.pool.stream(lambda backend: backend.agent_chain.astream(inputs))
+        return self.chain.astream(inputs)
+    
+    async def load_history(self, user_id: int) -> list:
+        """이전 대화 내역 로드 (LangChain Memory 객체 -> 메세지 리스트)"""
+        memory = await self.memory_service.get_memory(user_id)
+        # load_memory_variables는 dict 반환 ( e.g. {'history': [...]})
+        memory_vars = await memory.aload_memory_variables({})
+        return memory_vars.get("history", [])
     
     async def run(self, user_id: int, message: str) -> str:
         """
@@ -46,18 +83,16 @@ class AIAgent:
         Returns:
             str: AI 응답 메세지
         """
-        # 1. 이전 대화 내역 로드 (LangChain Memory 객체 -> 메세지 리스트)
-        memory = await self.memory_service.get_memory(user_id)
-        # load_memory_variables는 dict 반환 ( e.g. {'history': [...]})
-        memory_vars = await memory.aload_memory_variables({})
-        history = memory_vars.get("history", [])
+        # 1. 이전 대화 내역 로드
+        history = await self.load_history(user_id)
         
         # 2. Chain 실행
-        # history와 input을 프롬프트에 주입
-        response_text = await self.chain.ainvoke({
-            "history": history,
-            "input": message
-        })
+        # history와 input을 프롬프트에 주입 (실시간 대화 우선순위로 실행)
+        async with self.dispatcher.slot(LLMPriority.INTERACTIVE):
+            response_text = await self._invoke({
+                "history": history,
+                "input": message
+            })
         
         # 3. 대화 내역 저장
         # 사용자의 입력과 AI의 응답을 DB에 저장
@@ -66,4 +101,34 @@ class AIAgent:
             inputs = {"input": message},
             outputs = {"output": response_text}
         )
-        return response_text
\ No newline at end of file
+        return response_text
+    
+    async def stream(self, user_id: int, message: str) -> AsyncIterator[str]:
+        """
+        사용자 메세지를 처리하고 AI 응답을 토큰 단위로 스트리밍합니다.
+        스트림이 끝나면 전체 응답을 합쳐 대화 내역에 저장합니다.
+
+        Args:
+            user_id (int): 사용자 ID
+            message (str): 사용자 입력 메세지
+
+        Yields:
+            str: 생성되는 응답 토큰(청크)
+        """
+        history = await self.load_history(user_id)
+        
+        # 스트림이 끝날 때까지 자리를 점유 (생성이 계속되는 동안 Ollama 용량을 사용하므로)
+        chunks: list[str] = []
+        async with self.dispatcher.slot(LLMPriority.INTERACTIVE):
+            async for chunk in self._stream({
+                "history": history,
+                "input": message
+            }):
+                chunks.append(chunk)
+                yield chunk
+        
+        await self.memory_service.save_context(
+            user_id = user_id,
+            inputs = {"input": message},
+            outputs = {"output": "".join(chunks)}
+        )
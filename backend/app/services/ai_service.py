@@ -1,10 +1,15 @@
-import ollama
+import json
+import asyncio
+import hashlib
+from typing import AsyncIterator, NamedTuple
 from loguru import logger
 from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_fixed
+from fastapi import BackgroundTasks
 
 from app.config import settings
 from app.core.exceptions import AIConnectionError
+from app.core.cache import TTLCache
+from app.core.retry import RetryPolicy, call_with_retry
 from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
 from app.schemas.ai import AIParsedSchedule
 from app.repositories.user_repo import UserRepository
@@ -15,36 +20,125 @@ from app.services.schedule_service import ScheduleService
 from app.services.memory_service import MemoryService
 from app.services.ai_agent import AIAgent
 from app.services.ai_router import AIRouter
+from app.services.intent_classifier import IntentClassifier
+from app.services.llm_runtime import get_llm_runtime
+from app.services.llm_dispatcher import LLMPriority, get_llm_dispatcher
+from app.services.ollama_pool import is_backend_failure
+
+# 브리핑 프롬프트를 수정하면 버전을 올려 기존 캐시를 무효화
+BRIEFING_PROMPT_VERSION = "v1"
+
+# 일정 구성(제목, 시작/종료 시간)이 같으면 브리핑도 같으므로 프로세스 전역으로 캐싱
+briefing_cache: TTLCache[str, str] = TTLCache(
+    maxsize=settings.BRIEFING_CACHE_MAX_SIZE,
+    ttl=settings.BRIEFING_CACHE_TTL_SECONDS
+)
+# LLM 라우터 앞단의 규칙 기반 의도 분류기 (결정 횟수를 프로세스 단위로 집계)
+intent_classifier = IntentClassifier(threshold=settings.INTENT_FAST_PATH_THRESHOLD)
+
+def is_retryable_llm_error(exc: BaseException) -> bool:
+    """서버 장애(연결 실패, 타임아웃, 5xx) 또는 사용 가능한 서버가 없는 경우만 재시도 (요청 자체의 오류는 재시도해도 같은 결과)"""
+    return isinstance(exc, AIConnectionError) or is_backend_failure(exc)
+
+llm_retry_policy = RetryPolicy(
+    name="llm_chat",
+    retry_on=is_retryable_llm_error,
+    max_attempts=settings.LLM_RETRY_MAX_ATTEMPTS,
+    base_delay=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+    max_delay=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+    deadline=settings.LLM_CALL_DEADLINE_SECONDS,
+)
+# 배치 호출용: 자리 대기 시간이 마감에 포함되지 않도록 전체 마감 시간 없이 시도별 타임아웃만 사용
+llm_batch_retry_policy = RetryPolicy(
+    name="llm_chat_batch",
+    retry_on=is_retryable_llm_error,
+    max_attempts=settings.LLM_RETRY_MAX_ATTEMPTS,
+    base_delay=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+    max_delay=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+)
+
+class BriefingResult(NamedTuple):
+    """브리핑 문구와 LLM 실패로 대체 문구(일정 목록)를 사용했는지 여부"""
+    content: str
+    used_fallback: bool = False
+
+# 같은 일정 구성에 대한 동시 요청은 LLM을 한 번만 호출하도록 진행 중인 작업을 공유
+_pending_briefings: dict[str, "asyncio.Future[BriefingResult]"] = {}
+
+def _normalize_briefing_schedules(schedules: list[Schedule]) -> list[tuple[str, str, str]]:
+    """브리핑에 쓰이는 필드만 (시작, 종료, 제목) 순으로 정렬하여 추출"""
+    return sorted(
+        (s.start_time.strftime('%H:%M'), s.end_time.strftime('%H:%M'), s.title.strip())
+        for s in schedules
+    )
+
+def make_briefing_cache_key(schedules: list[Schedule]) -> str:
+    """정규화된 일정 목록 + 프롬프트 버전의 해시를 캐시 키로 사용"""
+    raw = json.dumps([BRIEFING_PROMPT_VERSION, _normalize_briefing_schedules(schedules)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 class AIService:
     
-    def __init__(self, chat_repo: ChatRepository = None, schedule_service: ScheduleService = None, user_repo: UserRepository = None):
+    def __init__(
+        self,
+        chat_repo: ChatRepository = None,
+        schedule_service: ScheduleService = None,
+        user_repo: UserRepository = None,
+        background_tasks: BackgroundTasks = None
+    ):
         """
         AIService 초기화
+        LLM 서버 풀(클라이언트, Chain)은 애플리케이션 공용(LLMRuntime)을 사용하고, 요청 단위 리소스(Repository)만 보관
+        background_tasks가 주어지면 대화 내역 저장을 응답 전송 이후로 미룸
         """
-        self.client = ollama.AsyncClient(host=settings.OLLAMA_BASE_URL)
+        runtime = get_llm_runtime()
+        self.pool = runtime.pool
+        self.dispatcher = get_llm_dispatcher()
         self.chat_repo = chat_repo
         self.schedule_service = schedule_service
         self.user_repo = user_repo
         
         # chat_repo가 있을 때만 에이전트 기능을 활성화
         if self.chat_repo:
-            self.memory_service = MemoryService(self.chat_repo)
-            self.ai_agent = AIAgent(self.memory_service)
-            self.ai_router = AIRouter()
+            self.memory_service = MemoryService(self.chat_repo, background_tasks=background_tasks)
+            self.ai_agent = AIAgent(self.memory_service, dispatcher=self.dispatcher, pool=self.pool)
+            self.ai_router = AIRouter(dispatcher=self.dispatcher, pool=self.pool)
         else:
             self.ai_agent = None
             self.ai_router = None
         
-    @retry(
-        stop=stop_after_attempt(3), # 최대 3번 재시도
-        wait=wait_fixed(2) # 재시도 사이 2초 대기
-    )
-    async def _send_chat_request(self, model: str, messages: list) -> dict:
+    async def _send_chat_request(
+        self,
+        model: str,
+        messages: list,
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> dict:
         """
         Ollam 서버에 실제 chat 요청을 보내는 내부 메서드
+        LLM 호출 스케줄러의 자리를 얻은 뒤 서버 풀에서 고른 서버로 요청 (재시도 대기 중에는 자리를 점유하지 않음)
+        - INTERACTIVE: llm_retry_policy를 따름 (마감 시간은 사용자가 기다리는 자리 대기 시간도 포함)
+        - BATCH: llm_batch_retry_policy를 따름 (자리 대기 시간은 제한하지 않고, 자리를 얻은 뒤의 시도만 제한)
         """
-        return await self.client.chat(model=model, messages=messages)
+        if priority is LLMPriority.BATCH:
+            return await call_with_retry(
+                lambda: self._chat_in_slot(model, messages, priority, timeout=settings.LLM_BATCH_ATTEMPT_TIMEOUT_SECONDS),
+                llm_batch_retry_policy,
+            )
+        return await call_with_retry(lambda: self._chat_in_slot(model, messages, priority), llm_retry_policy)
+    
+    async def _chat_in_slot(
+        self,
+        model: str,
+        messages: list,
+        priority: LLMPriority,
+        timeout: float | None = None
+    ) -> dict:
+        """자리를 얻은 뒤 요청 한 번 실행 (timeout은 자리를 얻은 시점부터 적용)"""
+        async with self.dispatcher.slot(priority):
+            return await asyncio.wait_for(
+                self.pool.run(lambda backend: backend.client.chat(model=model, messages=messages)),
+                timeout=timeout
+            )
     
     async def _find_schedule(self, user: User, keyword: str | None, date_str: str | None) -> Schedule | None:
         """
@@ -82,147 +176,279 @@ class AIService:
             return daily_schedules[0] if len(daily_schedules) == 1 else None
         return None
     
+    async def _route(self, user_id: int, message: str):
+        """
+        사용자 메세지의 의도를 파악합니다.
+        명백한 잡담이면 LLM 라우터를 건너뛰고 None을 반환합니다. (AIAgent가 바로 처리)
+        single-pass 모드에서는 라우터가 바로 답변할 수 있도록 이전 대화 내역을 함께 전달합니다.
+        """
+        if settings.INTENT_FAST_PATH_ENABLED:
+            decision = intent_classifier.classify(message)
+            if not decision.needs_llm_router:
+                logger.debug(f"Router skipped by fast-path (confidence={decision.confidence:.2f})")
+                return None
+        
+        history = None
+        if settings.AI_CHAT_MODE == "single_pass":
+            history = await self.ai_agent.load_history(user_id)
+        
+        return await self.ai_router.route_request(message, history=history)
+    
+    def _extract_direct_reply(self, route_result) -> str | None:
+        """
+        [single-pass] 라우터 결과에서 사용자에게 바로 전달할 답변을 추출합니다.
+        GeneralChatTool의 response 인자 또는 도구 없이 반환된 텍스트 응답을 사용합니다.
+        """
+        if route_result is None:
+            return None
+        
+        tool_calls = getattr(route_result, 'tool_calls', [])
+        if tool_calls:
+            if tool_calls[0]["name"] != "GeneralChatTool":
+                return None
+            reply = tool_calls[0]["args"].get("response")
+        else:
+            reply = getattr(route_result, 'content', None)
+        
+        if isinstance(reply, str) and reply.strip():
+            return reply.strip()
+        return None
+    
+    async def _reply_general_chat(self, user_id: int, message: str, route_result) -> str | None:
+        """
+        [single-pass] 라우터 답변을 대화 내역에 저장하고 반환합니다.
+        사용할 답변이 없거나 two-pass 모드면 None을 반환하여 AIAgent가 처리하도록 합니다.
+        """
+        if settings.AI_CHAT_MODE != "single_pass":
+            return None
+        
+        reply = self._extract_direct_reply(route_result)
+        if reply is None:
+            return None
+        
+        await self.memory_service.save_context(
+            user_id = user_id,
+            inputs = {"input": message},
+            outputs = {"output": reply}
+        )
+        return reply
+    
+    async def _dispatch_tool_call(self, user_id: int, route_result) -> str | AIParsedSchedule | None:
+        """
+        라우터 결과에서 일정 관리 도구 호출을 찾아 실행합니다.
+        일반 대화(GeneralChatTool)이거나 도구 호출이 없으면 None을 반환하여 AIAgent가 처리하도록 합니다.
+        """
+        # LangChain AIMessage 객체에서 tool_calls 속성 접근
+        tool_calls = getattr(route_result, 'tool_calls', [])
+        logger.debug(f"tool_calls: {tool_calls}")
+        
+        if not tool_calls:
+            return None
+        
+        # 첫 번째 도구만 처리 (복잡도 관리)
+        tool_call = tool_calls[0]
+        tool_name = tool_call["name"]
+        args = tool_call["args"]
+        
+        logger.debug(f"Tool Call Detected: {tool_name} | Args: {args}")
+        
+        # [최적화] 일반 대화가 아니라면 User 객체를 미리 조회하여 재사용
+        if tool_name != "GeneralChatTool":
+            if not self.user_repo or not self.schedule_service:
+                return "일정 관리 서비스를 사용할 수 없는 상태입니다."
+            
+            user = await self.user_repo.get_cached(user_id)
+            if not user:
+                return "사용자 정보를 찾을 수 없습니다."
+            
+            # [Case A] 일정 생성 요청
+            if tool_name == "CreateScheduleTool":
+                try:
+                    date_str = args.get("date")
+                    start_time_str = args.get("start_time")
+                    end_time_str = args.get("end_time")
+                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+                    start_time_obj = datetime.strptime(start_time_str, "%H:%M").time()
+                    end_time_obj = datetime.strptime(end_time_str, "%H:%M").time()
+                    
+                    schedule_data = ScheduleCreate(
+                        title = args.get("title"),
+                        date = date_obj,
+                        start_time = start_time_obj,
+                        end_time = end_time_obj,
+                        content = args.get("content")
+                    )
+                    
+                    # DB 즉시 저장 (user 객체 재사용)
+                    new_schedule = await self.schedule_service.create_schedule(schedule_data, user)
+                    logger.info(f"AI Auto-Save: Schedule {new_schedule.id} created.")
+                    
+                    return AIParsedSchedule(
+                        title = new_schedule.title,
+                        date = new_schedule.date,
+                        start_time = new_schedule.start_time,
+                        end_time = new_schedule.end_time,
+                        content = new_schedule.content
+                    )
+                    
+                except ValueError as ve:
+                    logger.error(f"Date/Time Parsing Error: {ve}")
+                    return "날짜 또는 시간 형식이 올바르지 않습니다. (YYYY-MM-DD, HH:MM)"
+                
+                except Exception as e:
+                    logger.error(f"Schedule Creation Failed: {e}")
+                    return f"일정 생성 중 오류가 발생했습니다: {str(e)}"
+                
+            # [Case B] 일정 수정 요청
+            elif tool_name == "UpdateScheduleTool":
+                try:
+                    target = await self._find_schedule(
+                        user,
+                        args.get("search_keyword"),
+                        args.get("date")
+                    )
+                    
+                    if not target:
+                        return "수정할 일정을 찾을 수 없습니다. (날짜와 키워드를 정확히 말씀해 주세요)"
+                    
+                    # 업데이트 데이터 구성
+                    update_data = ScheduleUpdate()
+                    if args.get("title"): update_data.title = args.get("title")
+                    if args.get("content"): update_data.content = args.get("content")
+                    if args.get("date"): update_data.date = datetime.strptime(args.get("date"), "%Y-%m-%d").date()
+                    if args.get("start_time"): update_data.start_time = datetime.strptime(args.get("start_time"), "%H:%M").time()
+                    if args.get("end_time"): update_data.end_time = datetime.strptime(args.get("end_time"), "%H:%M").time()
+                    
+                    updated_schedule = await self.schedule_service.update_schedule(target.id, update_data, user)
+                    return f"일정이 수정되었습니다: {updated_schedule.title}"
+                
+                except Exception as e:
+                    logger.error(f"Schedule Update Failed: {e}")
+                    return f"일정 수정 중 오류가 발생했습니다: {str(e)}"
+                
+            # [Case C] 일정 삭제 요청
+            elif tool_name == "DeleteScheduleTool":
+                try:
+                    target = await self._find_schedule(
+                        user,
+                        args.get("search_keyword"),
+                        args.get("date")
+                    )
+                    
+                    if not target:
+                        return "삭제할 일정을 찾을 수 없습니다."
+                    
+                    await self.schedule_service.delete_schedule(target.id, user)
+                    return f"일정이 삭제되었습니다: {target.title}"
+                
+                except Exception as e:
+                    logger.error(f"Schedule Delete Failed: {e}")
+                    return f"일정 삭제 중 오류가 발생했습니다: {str(e)}"
+        
+        # [Case D] 일반 대화 (GeneralChatTool) 또는 알 수 없는 도구
+        return None
+    
     async def process_chat(self, user_id: int, message: str) -> str | AIParsedSchedule:
         """
         사용자의 채팅 메세지를 처리하고 응답을 생성합니다.
-        1. 라우터로 의도 파악
+        1. 라우터로 의도 파악 (명백한 잡담은 규칙 기반 분류로 라우터 생략)
         2. 도구(tool) 호출 시 해당 기능 실행
-        3. 일반 대화 시 AIAgent 실행
+        3. 일반 대화 시 single-pass 모드면 라우터 답변을 사용, 아니면 AIAgent 실행
         """
         if not self.ai_agent or not self.ai_router:
             raise AIConnectionError("AI 기능이 활성화되지 않았습니다. (ChatRepository 필요)")
         try:
             # 1. 라우팅 (의도 파악)
-            route_result = await self.ai_router.route_request(message)
-            
-            # LangChain AIMessage 객체에서 tool_calls 속성 접근
-            tool_calls = getattr(route_result, 'tool_calls', [])
-            logger.debug(f"tool_calls: {tool_calls}")
+            route_result = await self._route(user_id, message)
             
             # 2. 도구 실행 로직
-            if tool_calls:
-                # 첫 번째 도구만 처리 (복잡도 관리)
-                tool_call = tool_calls[0]
-                tool_name = tool_call["name"]
-                args = tool_call["args"]
-                
-                logger.debug(f"Tool Call Detected: {tool_name} | Args: {args}")
-                # [최적화] 일반 대화가 아니라면 User 객체를 미리 조회하여 재사용
-                if tool_name != "GeneralChatTool":
-                    if not self.user_repo or not self.schedule_service:
-                        return "일정 관리 서비스를 사용할 수 없는 상태입니다."
-                    
-                    user = await self.user_repo.get(user_id)
-                    if not user:
-                        return "사용자 정보를 찾을 수 없습니다."
-                    
-                    # [Case A] 일정 생성 요청
-                    if tool_name == "CreateScheduleTool":
-                        try:
-                            date_str = args.get("date")
-                            start_time_str = args.get("start_time")
-                            end_time_str = args.get("end_time")
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                            start_time_obj = datetime.strptime(start_time_str, "%H:%M").time()
-                            end_time_obj = datetime.strptime(end_time_str, "%H:%M").time()
-                            
-                            schedule_data = ScheduleCreate(
-                                title = args.get("title"),
-                                date = date_obj,
-                                start_time = start_time_obj,
-                                end_time = end_time_obj,
-                                content = args.get("content")
-                            )
-                            
-                            # DB 즉시 저장 (user 객체 재사용)
-                            new_schedule = await self.schedule_service.create_schedule(schedule_data, user)
-                            logger.info(f"AI Auto-Save: Schedule {new_schedule.id} created.")
-                            
-                            return AIParsedSchedule(
-                                title = new_schedule.title,
-                                date = new_schedule.date,
-                                start_time = new_schedule.start_time,
-                                end_time = new_schedule.end_time,
-                                content = new_schedule.content
-                            )
-                            
-                        except ValueError as ve:
-                            logger.error(f"Date/Time Parsing Error: {ve}")
-                            return "날짜 또는 시간 형식이 올바르지 않습니다. (YYYY-MM-DD, HH:MM)"
-                        
-                        except Exception as e:
-                            logger.error(f"Schedule Creation Failed: {e}")
-                            return f"일정 생성 중 오류가 발생했습니다: {str(e)}"
-                        
-                    # [Case B] 일정 수정 요청
-                    elif tool_name == "UpdateScheduleTool":
-                        try:
-                            target = await self._find_schedule(
-                                user,
-                                args.get("search_keyword"),
-                                args.get("date")
-                            )
-                            
-                            if not target:
-                                return "수정할 일정을 찾을 수 없습니다. (날짜와 키워드를 정확히 말씀해 주세요)"
-                            
-                            # 업데이트 데이터 구성
-                            update_data = ScheduleUpdate()
-                            if args.get("title"): update_data.title = args.get("title")
-                            if args.get("content"): update_data.content = args.get("content")
-                            if args.get("date"): update_data.date = datetime.strptime(args.get("date"), "%Y-%m-%d").date()
-                            if args.get("start_time"): update_data.start_time = datetime.strptime(args.get("start_time"), "%H:%M").time()
-                            if args.get("end_time"): update_data.end_time = datetime.strptime(args.get("end_time"), "%H:%M").time()
-                            
-                            updated_schedule = await self.schedule_service.update_schedule(target.id, update_data, user)
-                            return f"일정이 수정되었습니다: {updated_schedule.title}"
-                        
-                        except Exception as e:
-                            logger.error(f"Schedule Update Failed: {e}")
-                            return f"일정 수정 중 오류가 발생했습니다: {str(e)}"
-                        
-                    # [Case C] 일정 삭제 요청
-                    elif tool_name == "DeleteScheduleTool":
-                        try:
-                            target = await self._find_schedule(
-                                user,
-                                args.get("search_keyword"),
-                                args.get("date")
-                            )
-                            
-                            if not target:
-                                return "삭제할 일정을 찾을 수 없습니다."
-                            
-                            await self.schedule_service.delete_schedule(target.id, user)
-                            return f"일정이 삭제되었습니다: {target.title}"
-                        
-                        except Exception as e:
-                            logger.error(f"Schedule Delete Failed: {e}")
-                            return f"일정 삭제 중 오류가 발생했습니다: {str(e)}"
-                        
-                # [Case D] 일반 대화 (GeneralChatTool)
-                elif tool_name == "GeneralChatTool":
-                    return await self.ai_agent.run(user_id, message)
+            tool_result = await self._dispatch_tool_call(user_id, route_result)
+            if tool_result is not None:
+                return tool_result
+            
+            # 3. [single-pass] 라우터가 만든 답변을 그대로 사용
+            reply = await self._reply_general_chat(user_id, message, route_result)
+            if reply is not None:
+                return reply
                 
-            # 3. 도구가 없거나 매칭되지 않으면 일반 대화로 처리
+            # 4. 도구가 없거나 일반 대화면 AIAgent로 처리
             return await self.ai_agent.run(user_id, message)
         
         except Exception as e:
             logger.error(f"AI Chat Error: {e}")
             raise AIConnectionError(f"대화 처리 중 오류가 발생했습니다: {e}")
+    
+    async def stream_chat(self, user_id: int, message: str) -> AsyncIterator[tuple[str, str | AIParsedSchedule]]:
+        """
+        process_chat의 스트리밍 버전입니다.
+        일반 대화는 AIAgent의 응답 토큰을 생성되는 즉시 전달하고,
+        도구 호출은 실행 결과를 한 번에 전달합니다.
+
+        Yields:
+            tuple[str, str | AIParsedSchedule]:
+                ("token", 응답 토큰) - 일반 대화 응답 조각
+                ("done", 최종 결과) - 마지막에 한 번 (전체 응답 문자열 또는 생성된 일정)
+        """
+        if not self.ai_agent or not self.ai_router:
+            raise AIConnectionError("AI 기능이 활성화되지 않았습니다. (ChatRepository 필요)")
+        try:
+            route_result = await self._route(user_id, message)
+            
+            tool_result = await self._dispatch_tool_call(user_id, route_result)
+            if tool_result is not None:
+                yield "done", tool_result
+                return
+            
+            reply = await self._reply_general_chat(user_id, message, route_result)
+            if reply is not None:
+                yield "token", reply
+                yield "done", reply
+                return
+            
+            chunks: list[str] = []
+            async for token in self.ai_agent.stream(user_id, message):
+                chunks.append(token)
+                yield "token", token
+            yield "done", "".join(chunks)
         
-    async def generate_briefing(self, schedules: list[Schedule]) -> str:
+        except Exception as e:
+            logger.error(f"AI Chat Stream Error: {e}")
+            raise AIConnectionError(f"대화 처리 중 오류가 발생했습니다: {e}")
+        
+    async def generate_briefing(self, schedules: list[Schedule]) -> BriefingResult:
         """
         사용자의 일정 리스트를 바탕으로 AI 요약 브리핑을 생성합니다.
+        같은 일정 구성의 브리핑이 캐시에 있으면 LLM을 호출하지 않고 반환합니다.
+        LLM 호출에 실패하면 예외 대신 대체 문구를 used_fallback=True로 반환합니다.
         """
         if not schedules:
-            return "오늘은 예정된 일정이 없습니다. 편안한 하루 보내세요."
+            return BriefingResult("오늘은 예정된 일정이 없습니다. 편안한 하루 보내세요.")
+        
+        cache_key = make_briefing_cache_key(schedules)
+        cached = briefing_cache.get(cache_key)
+        if cached is not None:
+            return BriefingResult(cached)
         
+        # 같은 일정 구성을 이미 생성 중이면 그 결과를 기다림
+        pending = _pending_briefings.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        task = asyncio.ensure_future(self._create_briefing(schedules, cache_key))
+        _pending_briefings[cache_key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            _pending_briefings.pop(cache_key, None)
+    
+    async def _create_briefing(self, schedules: list[Schedule], cache_key: str) -> BriefingResult:
+        """
+        LLM으로 브리핑을 생성하고, 성공한 결과만 캐시에 저장합니다.
+        """
         # 일정 데이터를 텍스트로 변환
         schedule_texts = []
-        for s in schedules:
-            time_str = f"{s.start_time.strftime('%H:%M')} ~ {s.end_time.strftime('%H:%M')}"
-            schedule_texts.append(f"- {s.title} ({time_str})")
+        for start_time, end_time, title in _normalize_briefing_schedules(schedules):
+            schedule_texts.append(f"- {title} ({start_time} ~ {end_time})")
             
         schedule_context = "\n".join(schedule_texts)
         
@@ -242,12 +468,16 @@ class AIService:
         """
         
         try:
+            # 배치 작업이므로 실시간 대화가 쓰지 않는 남는 자리에서 실행
             response = await self._send_chat_request(
                 model = settings.OLLAMA_MODEL,
-                messages = [{"role": "user", "content": prompt}]
+                messages = [{"role": "user", "content": prompt}],
+                priority = LLMPriority.BATCH
             )
-            return response["message"]["content"]
+            content = response["message"]["content"]
+            briefing_cache.set(cache_key, content)
+            return BriefingResult(content)
         
         except Exception as e:
             logger.error(f"Failed to generate briefing: {e}")
-            return f"오늘 총 {len(schedules)}개의 일정이 있습니다.\n{schedule_context}"
\ No newline at end of file
+            return BriefingResult(f"오늘 총 {len(schedules)}개의 일정이 있습니다.\n{schedule_context}", used_fallback=True)
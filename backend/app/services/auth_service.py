@@ -86,10 +86,10 @@ class AuthService:
             # Timing Attack 방지
             if not user:
                 logger.warning(f"로그인 실패 - 존재하지 않는 이메일: {form_data.email}")
-                security.verify_password(form_data.password, dummy_hash)
+                await security.verify_password_async(form_data.password, dummy_hash)
                 raise CredentialException(detail="이메일 또는 비밀번호가 올바르지 않습니다.")
             
-            if not security.verify_password(form_data.password, user.password_hash):
+            if not await security.verify_password_async(form_data.password, user.password_hash):
                 logger.warning(
                     f"로그인 실패 - 잘못된 비밀번호, "
                     f"사용자ID: {user.id}, 이메일: {user.email}"
@@ -99,7 +99,7 @@ class AuthService:
             logger.debug(f"토큰 생성 시작 - 사용자ID: {user.id}")
             
             # Access Token 생성
-            access_token = security.create_access_token(data={"sub": user.email})
+            access_token = security.create_access_token(data={"sub": user.email, "uid": user.id})
                 
             # Refresh Token 생성 및 저장
             refresh_token = security.create_refresh_token(data={"sub": user.email}) 
@@ -163,8 +163,8 @@ class AuthService:
             
             logger.debug(f"토큰 검증 완료 - JTI: {jti}, Email: {email}")
             
-            # DB에 저장된 Refresh Token 정보와 대조 (탈튀 여부 확인)
-            stored_token = await self.refresh_token_repo.get_by_jti(jti)
+            # 저장된 Refresh Token 상태와 대조 (탈튀 여부 확인, 상태 캐시 우선)
+            stored_token = await self.refresh_token_repo.get_state(jti)
             
             if not stored_token:
                 logger.error(
@@ -181,16 +181,16 @@ class AuthService:
                 # TODO. revoke_all_by_user 구현 시 적용
                 raise CredentialException(detail="보안 위협 감지로 모든 세션이 종료되었습니다.")
             
-            # 사용자 정보 확인
-            user = await self.user_repo.get_by_email(email)
-            if not user:
+            # 사용자 정보 확인 (토큰 소유자 ID로 사용자 캐시 조회)
+            user = await self.user_repo.get_cached(stored_token.user_id)
+            if not user or user.email != email:
                 logger.warning(
                     f"존재하지 않는 사용자로 토큰 갱신 시도 - "
                     f"Email: {email}, JTI: {jti}"
                 )
                 raise CredentialException(detail="사용자를 찾을 수 없습니다.")
             
-            new_access_token = security.create_access_token(data={"sub": user.email})
+            new_access_token = security.create_access_token(data={"sub": user.email, "uid": user.id})
             logger.info(
                 f"Access Token 갱신 성공 - UserID: {user.id}, Email: {user.email}"
             )
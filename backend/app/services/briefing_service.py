@@ -1,9 +1,27 @@
+import time
+import asyncio
+from collections import defaultdict
+from enum import Enum
+from typing import NamedTuple
 from loguru import logger
 from datetime import date
 
 from app.repositories.schedule_repo import ScheduleRepository
 from app.repositories.notification_repo import NotificationRepository
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, BriefingResult
+from app.models.schedule import Schedule
+
+class BriefingStatus(str, Enum):
+    SUCCESS = "success"    # 브리핑 생성 (LLM 응답 또는 일정 없음 안내)
+    FALLBACK = "fallback"  # LLM 실패로 대체 문구(일정 목록) 사용
+    FAILED = "failed"      # 생성 실패 (알림 저장 안 함)
+
+class BriefingOutcome(NamedTuple):
+    """사용자별 브리핑 생성 결과"""
+    user_id: int
+    status: BriefingStatus
+    latency: float
+    content: str | None
 
 class BriefingService:
     def __init__(
@@ -15,26 +33,99 @@ class BriefingService:
         self.schedule_repo = schedule_repo
         self.notification_repo = notification_repo
         self.ai_service = ai_service
-    
+
+    async def _build_briefing_content(self, schedules: list[Schedule]) -> BriefingResult:
+        """일정 유무에 따라 브리핑 문구를 생성합니다."""
+        if not schedules:
+            return BriefingResult("오늘을 예정된 일정이 없습니다. 편안한 하루 보내세요!")
+        return await self.ai_service.generate_briefing(schedules)
+
     async def create_daily_briefing(self, user_id: int) -> None:
         """
         사용자의 오늘 일정을 조회하여 AI 요약 브리핑을 생성하고 저장합니다.
         """
         today = date.today()
-        
+
         # 오늘 일정 조회
         schedules = await self.schedule_repo.get_schedules_by_user_and_date(user_id, today)
-        
+
         # AI 브리핑 생성
-        if not schedules:
-            briefing_content = "오늘을 예정된 일정이 없습니다. 편안한 하루 보내세요!"
-        else:
-            briefing_content = await self.ai_service.generate_briefing(schedules)
-            
+        briefing = await self._build_briefing_content(schedules)
+
         # 알림 저장
         await self.notification_repo.create(
             user_id=user_id,
             type="morning_briefing",
-            content=briefing_content
+            content=briefing.content
         )
-        logger.info(f"Briefing created for user {user_id}")
\ No newline at end of file
+        logger.info(f"Briefing created for user {user_id}")
+
+    async def generate_daily_briefings(
+        self,
+        user_ids: list[int],
+        semaphore: asyncio.Semaphore | None = None
+    ) -> list[BriefingOutcome]:
+        """
+        여러 사용자의 오늘 브리핑을 한 번에 생성합니다. (배치 작업용, 저장은 save_daily_briefings)
+        - 일정 조회: load_daily_schedules (쿼리 1번)
+        - AI 생성: generate_briefings (사용자별 병렬 실행, semaphore로 동시 실행 수 제한)
+
+        Args:
+            user_ids (list[int]): 브리핑을 생성할 사용자 ID 목록
+            semaphore (asyncio.Semaphore | None): AI 호출 동시 실행 제한 (없으면 제한 없음)
+
+        Returns:
+            list[BriefingOutcome]: 사용자별 생성 결과, user_ids와 같은 순서
+        """
+        schedules_by_user = await self.load_daily_schedules(user_ids)
+        return await self.generate_briefings(user_ids, schedules_by_user, semaphore)
+
+    async def load_daily_schedules(self, user_ids: list[int]) -> dict[int, list[Schedule]]:
+        """여러 사용자의 오늘 일정을 쿼리 1번으로 조회하여 user_id별로 그룹핑합니다."""
+        schedules_by_user: dict[int, list[Schedule]] = defaultdict(list)
+        for schedule in await self.schedule_repo.get_schedules_by_users_and_date(user_ids, date.today()):
+            schedules_by_user[schedule.user_id].append(schedule)
+        return schedules_by_user
+
+    async def generate_briefings(
+        self,
+        user_ids: list[int],
+        schedules_by_user: dict[int, list[Schedule]],
+        semaphore: asyncio.Semaphore | None = None
+    ) -> list[BriefingOutcome]:
+        """
+        미리 조회한 일정으로 사용자별 브리핑을 병렬 생성합니다. (DB를 사용하지 않으므로 세션이 닫힌 뒤에도 실행 가능)
+
+        Returns:
+            list[BriefingOutcome]: 사용자별 생성 결과, user_ids와 같은 순서
+        """
+        semaphore = semaphore or asyncio.Semaphore(max(1, len(user_ids)))
+
+        async def _generate(user_id: int) -> BriefingOutcome:
+            async with semaphore:
+                started_at = time.perf_counter()
+                try:
+                    briefing = await self._build_briefing_content(schedules_by_user.get(user_id, []))
+                except Exception as e:
+                    logger.warning(f"Briefing generation failed for user {user_id}: {e}")
+                    return BriefingOutcome(user_id, BriefingStatus.FAILED, time.perf_counter() - started_at, None)
+                status = BriefingStatus.FALLBACK if briefing.used_fallback else BriefingStatus.SUCCESS
+                return BriefingOutcome(user_id, status, time.perf_counter() - started_at, briefing.content)
+
+        return list(await asyncio.gather(*(_generate(user_id) for user_id in user_ids)))
+
+    async def save_daily_briefings(self, outcomes: list[BriefingOutcome]) -> int:
+        """
+        생성된 브리핑(대체 문구 포함)을 단일 bulk INSERT로 저장합니다.
+
+        Returns:
+            int: 저장된 알림 개수
+        """
+        notifications = [
+            {"user_id": outcome.user_id, "type": "morning_briefing", "content": outcome.content}
+            for outcome in outcomes
+            if outcome.status != BriefingStatus.FAILED
+        ]
+        saved = await self.notification_repo.bulk_create(notifications)
+        logger.info(f"Briefings created for {saved}/{len(outcomes)} users")
+        return saved
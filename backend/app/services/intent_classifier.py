@@ -0,0 +1,133 @@
+'''
+- AIRouter(LLM) 앞단에서 동작하는 규칙 기반 의도 분류기
+- 인사/감사 같은 명백한 잡담은 LLM 라우팅 없이 바로 AIAgent로 보냄
+- 일정 관련 단어(동사, 명사, 시간 표현)가 있거나 애매한 문장은 기존처럼 LLM 라우터로 보냄
+  (잘못 잡담으로 분류하면 일정 요청이 무시되므로, 확실할 때만 fast-path를 사용)
+'''
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from loguru import logger
+
+# 일정 생성/수정/삭제를 나타내는 동사 어간
+SCHEDULE_VERBS = (
+    "추가", "잡아", "잡자", "등록", "만들어", "넣어", "예약",
+    "바꿔", "변경", "수정", "미뤄", "옮겨", "당겨", "연기",
+    "취소", "삭제", "지워", "빼줘",
+)
+
+# 일정 관련 명사
+SCHEDULE_NOUNS = (
+    "일정", "약속", "회의", "미팅", "스케줄", "캘린더", "달력",
+)
+
+# 날짜/시간 표현
+TIME_WORDS = (
+    "오늘", "내일", "모레", "어제", "이번주", "다음주", "주말", "요일",
+    "오전", "오후", "아침", "점심", "저녁", "새벽", "밤",
+)
+TIME_PATTERN = re.compile(r"\d+\s*(시|분|월|일)|\d{1,2}:\d{2}")
+
+# 잡담 문장 사전 (공백/문장부호 제거 후 비교)
+SMALL_TALK_PHRASES = (
+    "안녕", "안녕하세요", "하이", "반가워", "반갑습니다", "좋은아침",
+    "고마워", "고맙습니다", "감사해", "감사합니다", "땡큐", "수고했어", "수고하셨습니다",
+    "잘자", "잘가", "또봐",
+    "심심해", "뭐해", "잘지냈어", "너는누구야", "사랑해",
+    "ㅎㅎ", "ㅋㅋ", "ㅠㅠ", "hi", "hello", "thanks", "thankyou",
+)
+
+# 확인/동의 표현: 직전 질문("이 일정으로 등록할까요?")에 대한 답일 수 있으므로
+# 잡담으로 처리하지 않고 대화 내역과 함께 LLM 라우터로 보냄
+CONFIRMATION_PHRASES = (
+    "응", "어", "네", "넵", "예", "그래", "좋아", "좋아요", "알겠어", "알겠습니다",
+    "오케이", "ok", "okay", "yes", "아니", "아니요", "싫어",
+)
+
+# n-gram 판단을 적용할 최대 길이 (긴 문장은 LLM에 맡김)
+MAX_SMALL_TALK_LENGTH = 20
+
+_PUNCTUATION = re.compile(r"[\s\.\,\!\?\~\^\-…·'\"]+")
+
+def _normalize(text: str) -> str:
+    """소문자 변환 후 공백과 문장부호 제거"""
+    return _PUNCTUATION.sub("", text.lower())
+
+def _char_ngrams(text: str, n: int = 2) -> set[str]:
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+@dataclass(frozen=True)
+class IntentDecision:
+    """
+    분류 결과
+    - intent: "small_talk" | "schedule" | "ambiguous"
+    - confidence: 판단 신뢰도 (0.0 ~ 1.0)
+    """
+    intent: str
+    confidence: float
+
+    @property
+    def needs_llm_router(self) -> bool:
+        return self.intent != "small_talk"
+
+class IntentClassifier:
+    def __init__(self, threshold: float = 0.75):
+        """
+        Args:
+            threshold: n-gram 유사도로 잡담을 판단할 때 필요한 최소 신뢰도
+        """
+        self.threshold = threshold
+        self._small_talk_phrases = set(SMALL_TALK_PHRASES)
+        self._confirmation_phrases = set(CONFIRMATION_PHRASES)
+        self._small_talk_ngrams = set().union(*(_char_ngrams(p) for p in SMALL_TALK_PHRASES))
+        self._schedule_ngrams = set().union(
+            *(_char_ngrams(w) for w in SCHEDULE_VERBS + SCHEDULE_NOUNS + TIME_WORDS)
+        )
+        self.counts: Counter[str] = Counter()
+
+    def classify(self, message: str) -> IntentDecision:
+        """사용자 메세지의 의도를 분류하고 결정 횟수를 집계합니다."""
+        decision = self._classify(message)
+        self.counts[decision.intent] += 1
+        logger.debug(f"Intent fast-path: {decision.intent} (confidence={decision.confidence:.2f})")
+        return decision
+
+    def _classify(self, message: str) -> IntentDecision:
+        normalized = _normalize(message)
+        if not normalized:
+            return IntentDecision("ambiguous", 0.0)
+
+        # 1. 잡담 사전과 정확히 일치
+        if normalized in self._small_talk_phrases:
+            return IntentDecision("small_talk", 1.0)
+
+        # 확인/동의 표현은 이전 대화에 따라 의미가 달라지므로 LLM 라우터로
+        if normalized in self._confirmation_phrases:
+            return IntentDecision("ambiguous", 0.0)
+
+        # 2. 일정 관련 단어나 시간 표현이 있으면 LLM 라우터로
+        if (
+            any(word in normalized for word in SCHEDULE_VERBS + SCHEDULE_NOUNS + TIME_WORDS)
+            or TIME_PATTERN.search(message)
+        ):
+            return IntentDecision("schedule", 1.0)
+
+        # 3. 짧은 문장은 문자 bigram이 잡담 사전과 얼마나 겹치는지로 판단
+        if len(normalized) > MAX_SMALL_TALK_LENGTH:
+            return IntentDecision("ambiguous", 0.0)
+
+        grams = _char_ngrams(normalized)
+        small_talk_score = len(grams & self._small_talk_ngrams) / len(grams)
+        schedule_score = len(grams & self._schedule_ngrams) / len(grams)
+        confidence = small_talk_score * (1 - schedule_score)
+
+        if confidence >= self.threshold:
+            return IntentDecision("small_talk", confidence)
+        return IntentDecision("ambiguous", confidence)
+
+    def stats(self) -> dict[str, int]:
+        """의도별 결정 횟수"""
+        return dict(self.counts)
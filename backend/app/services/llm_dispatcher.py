@@ -0,0 +1,141 @@
+'''
+- 우선순위 기반 LLM 호출 스케줄러 (프로세스 단위)
+- 실시간 대화(AIRouter, AIAgent)와 배치 작업(모닝 브리핑)이 같은 Ollama 서버를 나눠 쓰므로,
+  모든 LLM 호출은 자리(slot)를 얻은 뒤에 실행
+  1. 전체 동시 실행 수 제한: Ollama로 동시에 보내는 요청 수
+  2. 클래스별 동시 실행 상한: 배치는 상한을 낮게 두어 대화용 자리를 항상 남겨둠
+  3. 자리가 나면 대화(interactive) 대기 요청을 먼저 깨우고, 배치(batch)는 남는 자리만 채움
+- 클래스별 대기 시간(큐 대기) 지표를 집계
+'''
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator
+
+from app.config import settings
+
+class LLMPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+# 자리가 났을 때 깨우는 순서
+_PRIORITY_ORDER = (LLMPriority.INTERACTIVE, LLMPriority.BATCH)
+
+class _PriorityClass:
+    """클래스별 상태와 대기 시간 지표"""
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.running = 0
+        self.waiters: deque[tuple[asyncio.Future, float]] = deque()
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "running": self.running,
+            "waiting": len(self.waiters),
+            "admitted": self.admitted,
+            "avg_wait_seconds": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait_seconds": self.max_wait,
+        }
+
+class LLMDispatcher:
+    def __init__(self, max_concurrency: int, class_limits: dict[LLMPriority, int]):
+        """
+        Args:
+            max_concurrency: 전체 동시 실행 수
+            class_limits: 우선순위 클래스별 동시 실행 상한
+        """
+        self.max_concurrency = max_concurrency
+        self.running = 0
+        self._classes = {
+            priority: _PriorityClass(class_limits.get(priority, max_concurrency))
+            for priority in _PRIORITY_ORDER
+        }
+
+    def _can_start(self, priority: LLMPriority) -> bool:
+        state = self._classes[priority]
+        return self.running < self.max_concurrency and state.running < state.max_concurrency
+
+    def _has_waiters_before(self, priority: LLMPriority) -> bool:
+        """같거나 더 높은 우선순위에 (지금 시작할 수 있는) 대기 요청이 있는지"""
+        for other in _PRIORITY_ORDER:
+            if self._classes[other].waiters and (other == priority or self._can_start(other)):
+                return True
+            if other == priority:
+                return False
+        return False
+
+    def _start(self, priority: LLMPriority, waited: float) -> None:
+        state = self._classes[priority]
+        self.running += 1
+        state.running += 1
+        state.admitted += 1
+        state.total_wait += waited
+        state.max_wait = max(state.max_wait, waited)
+
+    def _wake_waiters(self) -> None:
+        """빈 자리를 우선순위 순서대로 대기 요청에 배정"""
+        for priority in _PRIORITY_ORDER:
+            state = self._classes[priority]
+            while state.waiters and self._can_start(priority):
+                future, enqueued_at = state.waiters.popleft()
+                if future.done():
+                    continue
+                self._start(priority, time.monotonic() - enqueued_at)
+                future.set_result(None)
+
+    async def acquire(self, priority: LLMPriority) -> None:
+        """우선순위 클래스의 자리를 얻을 때까지 대기"""
+        if self._can_start(priority) and not self._has_waiters_before(priority):
+            self._start(priority, 0.0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        state = self._classes[priority]
+        waiter = (future, time.monotonic())
+        state.waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 배정받은 직후 취소된 경우 -> 자리를 반환
+                self.release(priority)
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+            raise
+
+    def release(self, priority: LLMPriority) -> None:
+        self.running -= 1
+        self._classes[priority].running -= 1
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority) -> AsyncIterator[None]:
+        """자리를 얻고, 블록이 끝나면 반환"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {priority.value: state.stats() for priority, state in self._classes.items()}
+
+_dispatcher: LLMDispatcher | None = None
+
+def get_llm_dispatcher() -> LLMDispatcher:
+    """공용 LLM 호출 스케줄러를 반환 (없으면 생성)"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = LLMDispatcher(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            class_limits={
+                LLMPriority.INTERACTIVE: settings.LLM_INTERACTIVE_MAX_CONCURRENCY,
+                LLMPriority.BATCH: settings.LLM_BATCH_MAX_CONCURRENCY,
+            },
+        )
+    return _dispatcher
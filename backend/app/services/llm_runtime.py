@@ -0,0 +1,56 @@
+'''
+- 애플리케이션 전역(프로세스 단위)에서 공유하는 LLM 리소스
+- Ollama 서버별 HTTP 클라이언트(커넥션 풀), 도구 스키마가 바인딩된 라우터 Chain, 일반 대화 Chain을
+  lifespan 시작 시 한 번만 만들어 OllamaPool로 묶고, 요청마다 생성되는 서비스는 이를 참조만 함
+- lifespan을 거치지 않는 환경(배치, 테스트)에서는 처음 사용할 때 생성 (헬스 체크 없이 모든 서버를 정상으로 간주)
+'''
+import ollama
+from loguru import logger
+
+from app.config import settings
+from app.services.ai_agent import build_agent_chain
+from app.services.ai_router import build_router_chain
+from app.services.ollama_pool import OllamaBackend, OllamaPool, get_ollama_base_urls
+
+def build_ollama_backend(url: str) -> OllamaBackend:
+    """Ollama 서버 하나에 대한 클라이언트(브리핑 등 직접 호출용)와 AIRouter / AIAgent용 LCEL Chain 생성"""
+    return OllamaBackend(
+        url=url,
+        client=ollama.AsyncClient(host=url),
+        router_chain=build_router_chain(base_url=url),
+        agent_chain=build_agent_chain(base_url=url),
+    )
+
+class LLMRuntime:
+    def __init__(self):
+        self.pool = OllamaPool(
+            [build_ollama_backend(url) for url in get_ollama_base_urls()],
+            failure_threshold=settings.OLLAMA_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.OLLAMA_CIRCUIT_RESET_SECONDS,
+            hedge_delay=settings.OLLAMA_HEDGE_DELAY_SECONDS,
+            health_check_interval=settings.OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS,
+            health_check_timeout=settings.OLLAMA_HEALTH_CHECK_TIMEOUT_SECONDS,
+            health_check_failure_threshold=settings.OLLAMA_HEALTH_CHECK_FAILURE_THRESHOLD,
+        )
+        
+    async def aclose(self) -> None:
+        """헬스 체크 중지 및 Ollama 클라이언트의 HTTP 커넥션 풀 정리"""
+        await self.pool.aclose()
+
+_runtime: LLMRuntime | None = None
+
+def get_llm_runtime() -> LLMRuntime:
+    """공유 LLMRuntime을 반환 (없으면 생성)"""
+    global _runtime
+    if _runtime is None:
+        _runtime = LLMRuntime()
+        logger.info("LLM runtime initialized.")
+    return _runtime
+
+async def shutdown_llm_runtime() -> None:
+    """공유 LLMRuntime 정리 (lifespan 종료 시 호출)"""
+    global _runtime
+    if _runtime is not None:
+        await _runtime.aclose()
+        _runtime = None
+        logger.info("LLM runtime shutdown.")
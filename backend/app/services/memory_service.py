@@ -1,15 +1,70 @@
+from fastapi import BackgroundTasks
+from loguru import logger
 from langchain.memory import ConversationBufferWindowMemory
 from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from app.repositories.chat_repo import ChatRepository
 from app.models.chat import ChatRole
+from app.core.chat_history_cache import ChatHistoryCache, get_chat_history_cache
+from app.db.session import AsyncSessionFactory
+from app.db.hooks import after_commit, after_rollback
+
+async def persist_chat_messages(user_id: int, messages: list[tuple[ChatRole, str]]) -> None:
+    """
+    응답 전송 후(BackgroundTasks) 대화를 저장
+    - 요청 세션은 이미 닫혔으므로 별도 세션을 열어 커밋
+    - 커밋 후 캐시의 저장 중 표시를 해제, 실패하면 캐시에만 남은 대화를 제거
+    """
+    history_cache = get_chat_history_cache()
+    try:
+        async with AsyncSessionFactory() as session:
+            await ChatRepository(session).bulk_append(user_id, messages)
+            await session.commit()
+    except Exception as e:
+        logger.error(f"Failed to persist chat for user {user_id}: {e}")
+        await history_cache.finish_write(user_id, persisted=False)
+        return
+    await history_cache.finish_write(user_id, persisted=True)
 
 class MemoryService:
     """
     LangChain의 Memory 컴포넌트와 Jeiary의 ChatRepository를 연결하는 서비스
+    - 최근 대화는 사용자별 캐시에서 읽고, 캐시 미스일 때만 DB를 조회
     """
-    def __init__(self, chat_repo: ChatRepository):
+    def __init__(
+        self,
+        chat_repo: ChatRepository,
+        history_cache: ChatHistoryCache | None = None,
+        background_tasks: BackgroundTasks | None = None
+    ):
+        """
+        Args:
+            background_tasks: 주어지면 대화 저장을 응답 전송 이후로 미룸 (없으면 요청 트랜잭션 안에서 저장)
+        """
         self.chat_repo = chat_repo
+        self.history_cache = history_cache or get_chat_history_cache()
+        self.background_tasks = background_tasks
+        
+    async def _get_recent_messages(self, user_id: int, limit: int) -> list[dict]:
+        """
+        최근 대화 메세지({"role", "content"})를 오래된 순으로 반환
+        - 캐시 용량보다 많은 대화를 요청하면 캐시를 거치지 않고 DB에서 조회
+        - DB 조회 중에 대화가 추가되었거나 아직 커밋되지 않은 대화가 있으면 캐시를 채우지 않음
+        """
+        capacity = self.history_cache.max_messages
+        if limit <= capacity:
+            cached = await self.history_cache.get(user_id)
+            if cached is not None:
+                return cached[-limit:]
+        
+        generation = await self.history_cache.fill_generation(user_id)
+        recent_chats = await self.chat_repo.get_recent_chats(user_id, limit=max(limit, capacity))
+        sorted_chats = sorted(recent_chats, key=lambda x: (x.created_at, x.id))
+        messages = [{"role": chat.role, "content": chat.content} for chat in sorted_chats]
+        
+        if generation is not None:
+            await self.history_cache.set(user_id, messages, generation=generation)
+        return messages[-limit:]
         
     async def get_memory(self, user_id: int, k: int = 10) -> ConversationBufferWindowMemory:
         """
@@ -22,19 +77,17 @@ class MemoryService:
         Returns:
             ConversationBufferMemory: 초기화된 메모리 객체
         """    
-        recent_chats = await self.chat_repo.get_recent_chats(user_id, limit=k*2)
-        
-        sorted_chats = sorted(recent_chats, key=lambda x: x.created_at)
+        recent_messages = await self._get_recent_messages(user_id, limit=k*2)
         
-        # 변환: DB 모델 -> LangChain 메세지 객체
+        # 변환: 대화 메세지 -> LangChain 메세지 객체
         history = ChatMessageHistory()
-        for chat in sorted_chats:
-            if chat.role == ChatRole.USER:
-                history.add_message(HumanMessage(content=chat.content))
-            elif chat.role == ChatRole.ASSISTANT:
-                history.add_message(AIMessage(content=chat.content))
-            elif chat.role == ChatRole.SYSTEM:
-                history.add_message(SystemMessage(content=chat.content))
+        for message in recent_messages:
+            if message["role"] == ChatRole.USER:
+                history.add_message(HumanMessage(content=message["content"]))
+            elif message["role"] == ChatRole.ASSISTANT:
+                history.add_message(AIMessage(content=message["content"]))
+            elif message["role"] == ChatRole.SYSTEM:
+                history.add_message(SystemMessage(content=message["content"]))
                 
         # 메모리 객체 생성
         # return_messages=True : 문자열이 아닌 메세지 객체 리스트로 반환
@@ -46,7 +99,7 @@ class MemoryService:
         
     async def save_context(self, user_id: int, inputs: dict[str, str], outputs: dict[str, str]) -> None:
         """
-        LangChain 체인 실행 후 발생한 대화를 DB에 저장
+        LangChain 체인 실행 후 발생한 대화를 캐시에 추가하고 DB에 한 번의 INSERT로 저장 (Write-Through)
         
         Args:
             user_id: 사용자 ID
@@ -58,8 +111,26 @@ class MemoryService:
         
         ai_msg = outputs.get("output") or outputs.get("text") or outputs.get("response")
         
+        new_messages: list[tuple[ChatRole, str]] = []
         if user_msg:
-            await self.chat_repo.create(user_id=user_id, role=ChatRole.USER, content=user_msg)
+            new_messages.append((ChatRole.USER, user_msg))
         
         if ai_msg:
-            await self.chat_repo.create(user_id=user_id, role=ChatRole.ASSISTANT, content=ai_msg)
\ No newline at end of file
+            new_messages.append((ChatRole.ASSISTANT, ai_msg))
+            
+        if not new_messages:
+            return
+        
+        await self.history_cache.append(
+            user_id, [{"role": role.value, "content": content} for role, content in new_messages]
+        )
+        
+        if self.background_tasks is not None:
+            self.background_tasks.add_task(persist_chat_messages, user_id, new_messages)
+            return
+        
+        # 요청 트랜잭션 안에서 저장: 커밋/롤백 이후에 캐시의 저장 중 표시를 해제 (롤백이면 캐시에서도 제거)
+        session = self.chat_repo.session
+        after_commit(session, lambda: self.history_cache.finish_write(user_id, persisted=True))
+        after_rollback(session, lambda: self.history_cache.finish_write(user_id, persisted=False))
+        await self.chat_repo.bulk_append(user_id, new_messages)
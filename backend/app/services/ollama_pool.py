@@ -0,0 +1,336 @@
+'''
+- 여러 Ollama 서버를 묶어 사용하는 백엔드 풀
+  1. 헬스 체크: 주기적으로 각 서버의 /api/tags를 호출하여 연속으로 여러 번 응답하지 않은 서버는 제외
+     (모든 서버가 제외되면 fail-open: 가장 오래 전에 실패한 서버로 요청을 보내 봄)
+  2. 라우팅: 진행 중인 요청 수(outstanding)가 가장 적은 서버로 전송
+  3. 서킷 브레이커: 연속 실패가 기준을 넘으면 일정 시간 제외, 이후 요청 하나로 복구 여부 확인(half-open)
+  4. 재시도/헤징: 실패하면 다른 서버로 다시 요청하고, 설정 시 응답이 늦으면 다른 서버에 같은 요청을 보내 먼저 온 응답 사용
+- 서버별 Ollama 클라이언트와 LCEL Chain은 LLMRuntime이 만들어 OllamaBackend에 담아 전달
+'''
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+import httpx
+import ollama
+from loguru import logger
+
+from app.config import settings
+from app.core.exceptions import AIConnectionError
+
+T = TypeVar("T")
+
+def get_ollama_base_urls() -> list[str]:
+    """설정된 Ollama 서버 목록 (OLLAMA_BASE_URLS가 없으면 OLLAMA_BASE_URL 하나)"""
+    if settings.OLLAMA_BASE_URLS:
+        urls = [url.strip().rstrip("/") for url in settings.OLLAMA_BASE_URLS.split(",") if url.strip()]
+        if urls:
+            return urls
+    return [settings.OLLAMA_BASE_URL]
+
+def is_backend_failure(exc: BaseException) -> bool:
+    """서버 장애로 볼 수 있는 오류인지 (연결 실패, 타임아웃, 5xx) - 요청 자체의 오류(4xx 등)는 다른 서버로 재시도하지 않음"""
+    if isinstance(exc, ollama.ResponseError):
+        return exc.status_code >= 500
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, ConnectionError, asyncio.TimeoutError, OSError))
+
+class OllamaBackend:
+    """Ollama 서버 하나와 그 서버용 클라이언트/Chain, 라우팅 및 서킷 상태"""
+    def __init__(self, url: str, client, router_chain=None, agent_chain=None):
+        self.url = url
+        self.client = client
+        self.router_chain = router_chain
+        self.agent_chain = agent_chain
+        self.healthy = True
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.consecutive_probe_failures = 0
+        self.last_failure_at = 0.0
+        self.opened_at: float | None = None
+        self.probing = False
+
+    def __repr__(self) -> str:
+        return f"<OllamaBackend {self.url}>"
+
+class OllamaPool:
+    def __init__(
+        self,
+        backends: list[OllamaBackend],
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        hedge_delay: float = 0.0,
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 2.0,
+        health_check_failure_threshold: int = 3,
+    ):
+        """
+        Args:
+            backends: Ollama 서버 목록
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            reset_timeout: 서킷이 열린 뒤 다시 시도해 볼 때까지의 시간(초)
+            hedge_delay: 이 시간(초) 안에 응답이 없으면 다른 서버에도 요청 (0이면 헤징 안 함)
+            health_check_interval: 헬스 체크 주기(초)
+            health_check_timeout: 헬스 체크 요청 타임아웃(초)
+            health_check_failure_threshold: 서버를 제외하는 헬스 체크 연속 실패 횟수
+        """
+        if not backends:
+            raise ValueError("OllamaPool에는 최소 하나의 서버가 필요합니다.")
+        self.backends = backends
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_delay = hedge_delay
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.health_check_failure_threshold = health_check_failure_threshold
+        self.hedged = 0
+        self._health_task: asyncio.Task | None = None
+
+    # --------------------------------------------------------------------------
+    # 서킷 브레이커
+    # --------------------------------------------------------------------------
+    def _is_available(self, backend: OllamaBackend, now: float) -> bool:
+        return backend.healthy and self._circuit_allows(backend, now)
+
+    def _circuit_allows(self, backend: OllamaBackend, now: float) -> bool:
+        if backend.opened_at is None:
+            return True
+        # half-open: 대기 시간이 지나면 요청 하나만 통과시켜 복구 여부 확인
+        return now - backend.opened_at >= self.reset_timeout and not backend.probing
+
+    def _record_success(self, backend: OllamaBackend) -> None:
+        if backend.opened_at is not None:
+            logger.info(f"Ollama backend recovered: {backend.url}")
+        backend.consecutive_failures = 0
+        backend.opened_at = None
+        backend.probing = False
+
+    def _record_failure(self, backend: OllamaBackend, exc: BaseException) -> None:
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        backend.last_failure_at = time.monotonic()
+        if backend.probing or backend.consecutive_failures >= self.failure_threshold:
+            if backend.opened_at is None or backend.probing:
+                logger.warning(f"Ollama backend circuit opened: {backend.url} ({type(exc).__name__}: {exc})")
+            backend.opened_at = time.monotonic()
+        backend.probing = False
+
+    # --------------------------------------------------------------------------
+    # 라우팅
+    # --------------------------------------------------------------------------
+    def _pick(self, exclude: list[OllamaBackend]) -> OllamaBackend | None:
+        """
+        사용 가능한 서버 중 진행 중인 요청이 가장 적은 서버 (같으면 처리한 요청이 적은 서버)
+        모든 서버가 헬스 체크에서 제외된 경우에는 헬스 체크를 무시하고 가장 오래 전에 실패한 서버를 선택 (fail-open)
+        - 헬스 체크만 실패하는 경우(/api/tags 지연 등)에 모든 LLM 요청이 바로 실패하지 않도록 하기 위함
+        - 서킷 브레이커는 그대로 적용되므로 실제 요청도 실패하는 서버에는 계속 보내지 않음
+        동시에 고르는 요청끼리 몰리지 않도록 고르는 시점에 진행 중인 요청 수를 늘림 (요청이 끝나면 호출한 쪽에서 감소)
+        """
+        now = time.monotonic()
+        candidates = [b for b in self.backends if b not in exclude and self._is_available(b, now)]
+        if candidates:
+            backend = min(candidates, key=lambda b: (b.outstanding, b.requests))
+        elif not any(b.healthy for b in self.backends):
+            candidates = [b for b in self.backends if b not in exclude and self._circuit_allows(b, now)]
+            if not candidates:
+                return None
+            backend = min(candidates, key=lambda b: (b.last_failure_at, b.consecutive_probe_failures, b.outstanding))
+        else:
+            return None
+        if backend.opened_at is not None:
+            backend.probing = True
+        backend.outstanding += 1
+        backend.requests += 1
+        return backend
+
+    async def _attempt(self, backend: OllamaBackend, call: Callable[[OllamaBackend], Awaitable[T]]) -> T:
+        try:
+            result = await call(backend)
+        except Exception as e:
+            if is_backend_failure(e):
+                self._record_failure(backend, e)
+            else:
+                self._record_success(backend)
+            raise
+        self._record_success(backend)
+        return result
+
+    def _start_attempt(self, call, tried: list[OllamaBackend], pending: set[asyncio.Task]) -> bool:
+        backend = self._pick(tried)
+        if backend is None:
+            return False
+        tried.append(backend)
+        task = asyncio.ensure_future(self._attempt(backend, call))
+        
+        def _done(task: asyncio.Task) -> None:
+            # 시작 전에 취소된 경우에도 항상 호출되므로 여기서 진행 중인 요청 수를 감소
+            backend.outstanding -= 1
+            if task.cancelled():
+                # 헤징에서 진 요청: 서버 장애가 아니므로 기록하지 않음
+                backend.probing = False
+        
+        task.add_done_callback(_done)
+        pending.add(task)
+        return True
+
+    async def run(self, call: Callable[[OllamaBackend], Awaitable[T]]) -> T:
+        """
+        서버를 골라 call(backend)를 실행합니다.
+        서버 장애로 실패하면 아직 시도하지 않은 다른 서버로 다시 요청하고,
+        hedge_delay 안에 응답이 없으면 다른 서버에도 같은 요청을 보내 먼저 성공한 응답을 사용합니다.
+
+        Raises:
+            AIConnectionError: 사용할 수 있는 서버가 없거나 모든 서버에서 실패한 경우
+        """
+        tried: list[OllamaBackend] = []
+        pending: set[asyncio.Task] = set()
+        last_error: BaseException | None = None
+        try:
+            while True:
+                if not pending and not self._start_attempt(call, tried, pending):
+                    break
+
+                can_hedge = self.hedge_delay > 0 and self._has_candidate(tried)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if self._start_attempt(call, tried, pending):
+                        self.hedged += 1
+                        logger.debug(f"Hedged LLM request to {tried[-1].url}")
+                    continue
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not is_backend_failure(error):
+                        raise error
+                    last_error = error
+                    logger.warning(f"Ollama request failed, trying another backend: {type(error).__name__}: {error}")
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise AIConnectionError(f"사용 가능한 LLM 서버가 없습니다. (마지막 오류: {last_error})")
+
+    async def stream(self, call: Callable[[OllamaBackend], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        스트리밍 버전의 run (헤징 없음)
+        첫 조각을 받기 전에 실패한 경우에만 다른 서버로 다시 요청합니다. (이미 전달한 조각은 되돌릴 수 없으므로)
+        """
+        tried: list[OllamaBackend] = []
+        last_error: BaseException | None = None
+        while (backend := self._pick(tried)) is not None:
+            tried.append(backend)
+            started = False
+            try:
+                async for item in call(backend):
+                    started = True
+                    yield item
+            except (GeneratorExit, asyncio.CancelledError):
+                # 소비자가 스트림을 중단한 경우: 서버 장애가 아니므로 기록하지 않음
+                backend.probing = False
+                raise
+            except Exception as e:
+                if not is_backend_failure(e):
+                    self._record_success(backend)
+                    raise
+                self._record_failure(backend, e)
+                if started:
+                    raise
+                last_error = e
+                logger.warning(f"Ollama stream failed before first chunk, trying another backend: {e}")
+                continue
+            else:
+                self._record_success(backend)
+                return
+            finally:
+                backend.outstanding -= 1
+
+        raise AIConnectionError(f"사용 가능한 LLM 서버가 없습니다. (마지막 오류: {last_error})")
+
+    def _has_candidate(self, exclude: list[OllamaBackend]) -> bool:
+        now = time.monotonic()
+        return any(b not in exclude and self._is_available(b, now) for b in self.backends)
+
+    # --------------------------------------------------------------------------
+    # 헬스 체크
+    # --------------------------------------------------------------------------
+    async def check_health(self) -> None:
+        """
+        모든 서버의 /api/tags를 호출하여 healthy 상태를 갱신
+        - 한 번 성공하면 바로 정상으로 복귀, 연속으로 health_check_failure_threshold번 실패해야 제외
+        """
+        checked_at = time.monotonic()
+        was_all_unhealthy = not any(b.healthy for b in self.backends)
+        async with httpx.AsyncClient(timeout=self.health_check_timeout) as client:
+            async def _probe(backend: OllamaBackend) -> None:
+                try:
+                    response = await client.get(f"{backend.url}/api/tags")
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    backend.consecutive_probe_failures = 0
+                    healthy = True
+                else:
+                    backend.consecutive_probe_failures += 1
+                    # 같은 회차의 실패는 같은 시각으로 기록 (fail-open 시 연속 실패 횟수로 비교)
+                    backend.last_failure_at = checked_at
+                    healthy = backend.healthy and backend.consecutive_probe_failures < self.health_check_failure_threshold
+                if healthy != backend.healthy:
+                    logger.warning(f"Ollama backend {backend.url} is now {'healthy' if healthy else 'unhealthy'}")
+                backend.healthy = healthy
+
+            await asyncio.gather(*(_probe(backend) for backend in self.backends))
+
+        if not was_all_unhealthy and not any(b.healthy for b in self.backends):
+            logger.warning("All Ollama backends are unhealthy, routing to the least recently failed backend")
+
+    async def _health_loop(self) -> None:
+        while True:
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Ollama health check failed: {e}")
+            await asyncio.sleep(self.health_check_interval)
+
+    def start_health_checks(self) -> None:
+        """주기적 헬스 체크 시작 (lifespan 시작 시 호출, 시작하지 않으면 모든 서버를 정상으로 간주)"""
+        if self._health_task is None and self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def aclose(self) -> None:
+        """헬스 체크 중지 및 서버별 HTTP 커넥션 풀 정리"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        for backend in self.backends:
+            http_client = getattr(backend.client, "_client", None)
+            if http_client is not None:
+                await http_client.aclose()
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "url": b.url,
+                "healthy": b.healthy,
+                "available": self._is_available(b, now),
+                "outstanding": b.outstanding,
+                "requests": b.requests,
+                "failures": b.failures,
+                "circuit_open": b.opened_at is not None,
+            }
+            for b in self.backends
+        ]
@@ -1,15 +1,46 @@
+import json
+import base64
+import hashlib
 from loguru import logger
+from datetime import date, time
 # from typing import List ->  Python 3.8 및 이전 버전의 방식
 
 from fastapi import HTTPException, status
+from sqlalchemy import Row
+from app.config import settings
+from app.core.month_view_cache import MonthView, MonthViewCache, get_month_view_cache
+from app.db.hooks import after_commit
 from app.repositories.schedule_repo import ScheduleRepository
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
+from app.schemas.schedule import ScheduleCreate, ScheduleUpdate, schedule_rows_to_dicts, dumps_json
 from app.models.schedule import Schedule
 from app.models.user import User
 
+def encode_range_cursor(schedule: Schedule | Row) -> str:
+    """마지막 행의 (date, start_time, id)를 불투명한 커서 문자열로 변환"""
+    raw = json.dumps([schedule.date.isoformat(), schedule.start_time.isoformat(), schedule.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_range_cursor(cursor: str) -> tuple[date, time, int]:
+    """커서 문자열을 (date, start_time, id)로 복원 (형식이 잘못되면 ValueError)"""
+    try:
+        day, start_time, schedule_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return date.fromisoformat(day), time.fromisoformat(start_time), int(schedule_id)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
 class ScheduleService:
-    def __init__(self, schedule_repo: ScheduleRepository):
+    def __init__(self, schedule_repo: ScheduleRepository, month_view_cache: MonthViewCache | None = None):
         self.schedule_repo = schedule_repo
+        self.month_view_cache = month_view_cache or get_month_view_cache()
+        
+    async def _invalidate_month_views(self, user_id: int, *dates: date) -> None:
+        """
+        변경된 일정 날짜가 속한 월의 응답 캐시만 무효화
+        커밋 전에 들어온 조회가 변경 전 응답으로 캐시를 다시 채울 수 있으므로 커밋 후에도 한 번 더 무효화
+        """
+        months = {(d.year, d.month) for d in dates}
+        await self.month_view_cache.invalidate(user_id, months)
+        after_commit(self.schedule_repo.session, lambda: self.month_view_cache.invalidate(user_id, months))
         
     async def create_schedule(self, schedule_data: ScheduleCreate, user: User) -> Schedule:
         """
@@ -24,7 +55,9 @@ class ScheduleService:
         """
         logger.debug(f"일정 생성 서비스 진입")
         logger.debug(f"{schedule_data.model_dump}")
-        return await self.schedule_repo.create(schedule_data, user.id)
+        schedule = await self.schedule_repo.create(schedule_data, user.id)
+        await self._invalidate_month_views(user.id, schedule_data.date)
+        return schedule
     
     async def get_schedule_by_id(self, schedule_id: int, user: User) -> Schedule:
         """
@@ -75,6 +108,102 @@ class ScheduleService:
         
         return await self.schedule_repo.get_schedules_by_user_and_month(user.id, year, month)
     
+    async def get_month_view(self, user: User, year: int, month: int) -> MonthView:
+        """
+        월별 일정 목록을 직렬화된 JSON bytes와 ETag로 반환합니다.
+        캐시 적중 시 목록 조회와 직렬화를 생략하고,
+        캐시 미스 시에도 ORM 객체/Pydantic 모델 대신 Projection 조회 결과를 orjson으로 한 번에 직렬화합니다.
+        
+        프로세스 내 캐시는 다른 워커의 변경(무효화)을 알 수 없으므로,
+        적중하더라도 버전 조회(일정 수 + 최종 수정 시각)로 ETag가 그대로인지 확인한 뒤 사용합니다.
+
+        Returns:
+            MonthView: (ETag, JSON 본문 bytes)
+        """
+        view = await self.month_view_cache.get(user.id, year, month)
+        if view is not None and self.month_view_cache.shared:
+            return view
+        
+        etag = await self.get_month_etag(user, year, month)
+        if view is not None and view.etag == etag:
+            return view
+        
+        rows = await self.schedule_repo.get_schedule_rows_by_user_and_month(user.id, year, month)
+        view = MonthView(etag=etag, body=dumps_json(schedule_rows_to_dicts(rows)))
+        
+        await self.month_view_cache.set(user.id, year, month, view)
+        return view
+    
+    async def get_month_etag(self, user: User, year: int, month: int) -> str:
+        """
+        월 일정 목록의 ETag를 생성합니다.
+        일정 수와 최종 수정 시각만 집계하므로, 목록 조회/직렬화 없이 변경 여부를 판단할 수 있습니다.
+
+        Returns:
+            str: 약한 ETag (예: W/"3f2a...")
+        """
+        count, last_updated_at = await self.schedule_repo.get_month_version(user.id, year, month)
+        raw = f"{user.id}:{year}:{month}:{count}:{last_updated_at.isoformat() if last_updated_at else ''}"
+        return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+    
+    async def get_schedules_by_range(
+        self,
+        user: User,
+        start: date,
+        end: date,
+        limit: int | None = None,
+        cursor: str | None = None
+    ) -> tuple[list[Row], str | None]:
+        """
+        특정 사용자의 [start, end) 기간 일정을 조회합니다. (월 경계를 넘는 주간/일정 목록 화면용)
+
+        Args:
+            user (User): 현재 인증된 사용자
+            start (date): 시작 날짜 (포함)
+            end (date): 종료 날짜 (미포함)
+            limit (int | None): 한 페이지 최대 행 수 (없으면 기본값, 최대 SCHEDULE_RANGE_MAX_LIMIT)
+            cursor (str | None): 이전 응답의 next_cursor
+
+        Returns:
+            tuple[list[Row], str | None]: 일정 목록(Projection Row)과 다음 페이지 커서 (마지막 페이지면 None)
+            
+        Raises:
+            HTTPException: 400 Bad Request (기간이나 커서가 잘못된 경우)
+        """
+        logger.debug("기간 일정 조회 서비스 진입")
+        logger.debug(f"user:{user.email}, start:{start}, end:{end}, limit:{limit}, cursor:{cursor}")
+        
+        if start >= end:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = "종료 날짜는 시작 날짜보다 늦어야 합니다.",
+            )
+        if (end - start).days > settings.SCHEDULE_RANGE_MAX_DAYS:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = f"조회 기간은 최대 {settings.SCHEDULE_RANGE_MAX_DAYS}일입니다.",
+            )
+        
+        try:
+            after = decode_range_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = "잘못된 커서입니다.",
+            )
+        
+        limit = min(limit or settings.SCHEDULE_RANGE_DEFAULT_LIMIT, settings.SCHEDULE_RANGE_MAX_LIMIT)
+        
+        # 다음 페이지 존재 여부를 알기 위해 1개 더 조회
+        schedules = await self.schedule_repo.get_schedule_rows_by_user_and_range(
+            user.id, start, end, limit=limit + 1, after=after
+        )
+        if len(schedules) <= limit:
+            return schedules, None
+        
+        schedules = schedules[:limit]
+        return schedules, encode_range_cursor(schedules[-1])
+    
     async def update_schedule(self, schedule_id: int, schedule_data: ScheduleUpdate, user: User) -> Schedule:
         """
         기존 일정을 수정합니다. 수정 전 소유권을 반드시 확인합니다.
@@ -93,11 +222,17 @@ class ScheduleService:
         # 소유권 검증 및 일정 객체 확보 (실패 시 404)
         schedule = await self.get_schedule_by_id(schedule_id, user)
         
+        old_date = schedule.date
+        
         # 소유권이 확인되면 Repository에 수정을 위임
-        return await self.schedule_repo.update(
+        updated_schedule = await self.schedule_repo.update(
             schedule, schedule_data
         )
         
+        # 날짜가 바뀌면 이전 월과 새 월 모두 무효화
+        await self._invalidate_month_views(user.id, old_date, schedule_data.date or old_date)
+        return updated_schedule
+        
     async def delete_schedule(self, schedule_id: int, user: User) -> Schedule:
         """
         일정을 소프트 삭제합니다. 삭제 전 소유권을 반드시 확인합니다.
@@ -116,4 +251,6 @@ class ScheduleService:
         schedule = await self.get_schedule_by_id(schedule_id, user)
         
         # 소유권이 확인되면 Repository에 삭제를 위임
-        return await self.schedule_repo.delete(schedule)
\ No newline at end of file
+        deleted_schedule = await self.schedule_repo.delete(schedule)
+        await self._invalidate_month_views(user.id, schedule.date)
+        return deleted_schedule
\ No newline at end of file
@@ -2,7 +2,9 @@ import pytest
 import sys
 import os
 from typing import AsyncGenerator
+from contextlib import contextmanager
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
@@ -19,6 +21,13 @@ from app.models.user import User
 from app.main import app
 from app.db.session import get_db
 from app.core.limiter import limiter
+from app.core.admission import get_ai_admission_controller
+from app.core.chat_history_cache import get_chat_history_cache
+from app.core.month_view_cache import get_month_view_cache
+from app.core.user_cache import clear_user_cache
+from app.core.security import clear_token_cache
+from app.core.refresh_token_cache import get_refresh_token_state_cache
+from app.services.ai_service import BriefingResult
 
 from httpx import AsyncClient
 from unittest.mock import AsyncMock # 비동기 응답을 흉내
@@ -45,8 +54,46 @@ def reset_rate_limiter(monkeypatch):
     각 테스트 실행 전에 Rate Limiter의 상태를 초기화
     """
     limiter._storage.reset()
+    get_ai_admission_controller().clear_user_buckets()
     yield
 
+@pytest.fixture(autouse=True)
+async def reset_response_caches():
+    """
+    사용자/대화/월별 일정 응답/토큰 캐시가 테스트 간에 공유되지 않도록 초기화 (테스트마다 같은 id가 재사용됨)
+    """
+    clear_user_cache()
+    clear_token_cache()
+    await get_refresh_token_state_cache().clear()
+    await get_chat_history_cache().clear()
+    await get_month_view_cache().clear()
+    yield
+
+@pytest.fixture
+def count_queries():
+    """
+    with 블록 안에서 DB로 전송된 SQL 문을 기록하는 Fixture. (쿼리 수 예산 검증용)
+
+    사용 예:
+        with count_queries() as statements:
+            await client.get(...)
+        assert len(statements) == 2
+    """
+    @contextmanager
+    def _count_queries():
+        statements: list[str] = []
+        
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+            
+        event.listen(engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    
+    return _count_queries
+
 @pytest.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -123,5 +170,5 @@ def mock_ai_service():
     미리 정의된 가짜 응답을 반환하도록 설정
     """
     mock = AsyncMock()
-    mock.generate_briefing.return_value = "오늘은 맑은 아침입니다. 예정된 일정은 없습니다."
+    mock.generate_briefing.return_value = BriefingResult("오늘은 맑은 아침입니다. 예정된 일정은 없습니다.")
     return mock
\ No newline at end of file
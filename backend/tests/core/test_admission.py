@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+
+from app.core.admission import AdmissionController
+from app.core.exceptions import AIOverloadedException, AIRateLimitException
+
+def _controller(**overrides) -> AdmissionController:
+    options = dict(
+        max_concurrency=1,
+        max_queue=1,
+        queue_timeout=0.2,
+        user_rate_per_minute=60,
+        user_burst=100,
+    )
+    options.update(overrides)
+    return AdmissionController(**options)
+
+@pytest.mark.asyncio
+async def test_user_token_bucket_rejects_with_retry_after():
+    """사용자별 버킷 크기만큼 연속 요청을 허용하고, 초과 시 다음 토큰까지 남은 시간을 Retry-After로 반환해야 한다."""
+    controller = _controller(max_concurrency=10, user_rate_per_minute=6, user_burst=2)
+    
+    for _ in range(2):
+        async with controller.admit(user_id=1):
+            pass
+    
+    with pytest.raises(AIRateLimitException) as exc_info:
+        await controller.acquire(user_id=1)
+    assert exc_info.value.status_code == 429
+    assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 10
+    
+    # 다른 사용자의 한도에는 영향 없음
+    async with controller.admit(user_id=2):
+        pass
+    assert controller.stats()["rejected_rate_limited"] == 1
+
+@pytest.mark.asyncio
+async def test_zero_user_rate_disables_user_limit():
+    """사용자별 충전량이 0이면 사용자별 제한 없이 전역 동시 실행 제한만 적용해야 한다."""
+    controller = _controller(max_concurrency=1, max_queue=0, user_rate_per_minute=0, user_burst=1)
+    
+    for _ in range(5):
+        async with controller.admit(user_id=1):
+            pass
+    assert controller.stats()["admitted"] == 5
+    assert controller.stats()["rejected_rate_limited"] == 0
+    
+    # 전역 제한은 그대로 적용
+    async with controller.admit(user_id=1):
+        with pytest.raises(AIOverloadedException):
+            await controller.acquire(user_id=1)
+    controller.clear_user_buckets()
+
+@pytest.mark.asyncio
+async def test_queue_full_and_timeout_are_rejected_with_503():
+    """
+    실행 중인 요청이 자리를 모두 차지하면
+    - 대기열 크기만큼만 기다리고, 대기열이 가득 차면 즉시 503
+    - 대기 시간 안에 자리가 나지 않으면 503
+    """
+    controller = _controller()
+    ticket = await controller.acquire(user_id=1)
+    
+    waiter = asyncio.create_task(controller.acquire(user_id=2))
+    await asyncio.sleep(0)
+    assert controller.stats()["waiting"] == 1
+    
+    with pytest.raises(AIOverloadedException) as exc_info:
+        await controller.acquire(user_id=3)
+    assert exc_info.value.status_code == 503
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+    
+    with pytest.raises(AIOverloadedException):
+        await waiter
+    
+    stats = controller.stats()
+    assert stats["rejected_queue_full"] == 1
+    assert stats["rejected_timeout"] == 1
+    assert stats["waiting"] == 0
+    
+    ticket.release()
+    ticket.release()  # 중복 반환은 무시
+    assert controller.stats()["running"] == 0
+
+@pytest.mark.asyncio
+async def test_waiter_admitted_when_slot_released():
+    """실행 중인 요청이 끝나면 대기 중인 요청이 순서대로 실행 권한을 얻어야 한다."""
+    controller = _controller(queue_timeout=5)
+    ticket = await controller.acquire(user_id=1)
+    
+    waiter = asyncio.create_task(controller.acquire(user_id=2))
+    await asyncio.sleep(0)
+    ticket.release()
+    
+    second = await asyncio.wait_for(waiter, timeout=1)
+    assert controller.stats()["running"] == 1
+    second.release()
+    assert controller.stats()["admitted"] == 2
+
+@pytest.mark.asyncio
+async def test_retry_after_follows_observed_drain_rate():
+    """Retry-After는 관측된 평균 처리 시간과 대기 중인 요청 수로 계산해야 한다."""
+    controller = _controller(max_concurrency=2, max_queue=10, queue_timeout=30)
+    assert controller.estimate_retry_after() == 30
+    
+    controller._avg_service_time = 4.0
+    controller.waiting = 3
+    # 배출 속도 = 2 / 4초 = 초당 0.5건 -> (3 + 1) / 0.5 = 8초
+    assert controller.estimate_retry_after() == 8
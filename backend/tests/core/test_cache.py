@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+def test_cache_get_and_set():
+    """
+    저장한 값은 조회되고, 없는 키는 None을 반환하며 적중/실패 횟수가 집계되어야 한다.
+    """
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    
+def test_cache_expires_after_ttl():
+    """
+    TTL이 지난 항목은 조회되지 않고 캐시에서 제거되어야 한다.
+    """
+    cache = TTLCache(maxsize=10, ttl=60)
+    
+    with patch("app.core.cache.time.monotonic", return_value=1000.0):
+        cache.set("a", 1)
+    
+    with patch("app.core.cache.time.monotonic", return_value=1059.0):
+        assert cache.get("a") == 1
+        
+    with patch("app.core.cache.time.monotonic", return_value=1061.0):
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        
+def test_cache_evicts_least_recently_used():
+    """
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거되어야 한다.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # a를 최근 사용으로 갱신
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
@@ -0,0 +1,78 @@
+import pytest
+
+from app.core.chat_history_cache import InMemoryChatHistoryCache
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_keeps_last_messages():
+    """최근 max_messages개의 메세지만 유지하는지 테스트"""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=10, ttl=60)
+    
+    await cache.set(1, [{"role": "user", "content": "1"}, {"role": "assistant", "content": "2"}])
+    await cache.append(1, [{"role": "user", "content": "3"}, {"role": "assistant", "content": "4"}])
+    
+    messages = await cache.get(1)
+    assert [m["content"] for m in messages] == ["2", "3", "4"]
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_append_on_miss_is_ignored():
+    """캐시에 없는 사용자에게 추가하면 무시되어야 한다 (다음 조회 때 DB에서 채움)"""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=10, ttl=60)
+    
+    await cache.append(1, [{"role": "user", "content": "hello"}])
+    
+    assert await cache.get(1) is None
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_invalidate_and_lru():
+    """무효화 및 최대 사용자 수 초과 시 LRU 제거 테스트"""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=2, ttl=60)
+    
+    await cache.set(1, [])
+    await cache.set(2, [])
+    await cache.invalidate(1)
+    assert await cache.get(1) is None
+    
+    await cache.set(3, [])
+    await cache.set(4, [])
+    assert await cache.get(2) is None
+    assert await cache.get(3) == []
+
+@pytest.mark.asyncio
+async def test_fill_is_skipped_when_history_changed_during_read():
+    """DB 조회 중에 대화가 추가/무효화되면 조회 결과로 캐시를 채우지 않아야 한다."""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=10, ttl=60)
+    
+    generation = await cache.fill_generation(1)
+    await cache.invalidate(1)
+    await cache.set(1, [{"role": "user", "content": "stale"}], generation=generation)
+    assert await cache.get(1) is None
+    
+    generation = await cache.fill_generation(1)
+    await cache.set(1, [{"role": "user", "content": "fresh"}], generation=generation)
+    assert [m["content"] for m in await cache.get(1)] == ["fresh"]
+
+@pytest.mark.asyncio
+async def test_fill_waits_until_pending_write_is_persisted():
+    """append 후 DB 저장이 끝나기 전에는 DB 조회 결과(새 대화 누락)로 캐시를 채우지 않아야 한다."""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=10, ttl=60)
+    
+    await cache.append(1, [{"role": "user", "content": "new"}])
+    assert await cache.fill_generation(1) is None
+    
+    await cache.finish_write(1, persisted=True)
+    generation = await cache.fill_generation(1)
+    assert generation is not None
+    await cache.set(1, [{"role": "user", "content": "new"}], generation=generation)
+    assert [m["content"] for m in await cache.get(1)] == ["new"]
+
+@pytest.mark.asyncio
+async def test_failed_write_removes_cached_turn():
+    """저장에 실패(롤백)하면 캐시에만 추가된 대화를 제거해야 한다."""
+    cache = InMemoryChatHistoryCache(max_messages=3, max_users=10, ttl=60)
+    await cache.set(1, [{"role": "user", "content": "old"}])
+    
+    await cache.append(1, [{"role": "user", "content": "uncommitted"}])
+    await cache.finish_write(1, persisted=False)
+    
+    assert await cache.get(1) is None
+    assert await cache.fill_generation(1) is not None
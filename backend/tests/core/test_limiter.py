@@ -0,0 +1,123 @@
+import pytest
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+from limits.storage import MemoryStorage
+from slowapi.errors import RateLimitExceeded
+from starlette.requests import Request
+
+from app.core.limiter import create_limiter, get_ip_rate_limit_key, get_rate_limit_key, rate_limit_handler
+from app.core.security import create_access_token
+
+class SharedMemoryStorage(MemoryStorage):
+    """
+    같은 URI로 만든 인스턴스끼리 카운터를 공유하는 테스트용 저장소 (여러 워커가 같은 Redis를 쓰는 상황의 대역)
+    """
+    STORAGE_SCHEME = ["shared-memory"]
+    _servers: dict[str, MemoryStorage] = {}
+
+    def __init__(self, uri: str | None = None, **options):
+        super().__init__(uri, **options)
+        server = self._servers.setdefault(uri, MemoryStorage())
+        self.storage, self.locks, self.expirations, self.events = (
+            server.storage, server.locks, server.expirations, server.events
+        )
+
+def _make_app(storage_uri: str, storage_options: dict | None = None) -> FastAPI:
+    """limiter를 각자 생성하는 앱 인스턴스 (gunicorn 워커/서버 1개에 해당)"""
+    limiter = create_limiter(storage_uri, storage_options)
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
+
+    @app.get("/limited")
+    @limiter.limit("3/minute")
+    async def limited(request: Request, response: Response):
+        return {"ok": True}
+
+    return app
+
+def _make_request(cookies: dict[str, str] | None = None) -> Request:
+    headers = []
+    if cookies:
+        cookie_header = "; ".join(f"{key}={value}" for key, value in cookies.items())
+        headers.append((b"cookie", cookie_header.encode()))
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": headers,
+        "client": ("10.0.0.1", 12345),
+    })
+
+def test_rate_limit_key_uses_user_id_for_authenticated_requests():
+    """유효한 Access Token 쿠키가 있으면 사용자 ID, 없거나 유효하지 않으면 IP 주소로 카운터를 구분해야 한다."""
+    token = create_access_token({"sub": "test@example.com", "uid": 7})
+    
+    assert get_rate_limit_key(_make_request({"access_token": token})) == "user:7"
+    assert get_rate_limit_key(_make_request()) == "ip:10.0.0.1"
+    assert get_rate_limit_key(_make_request({"access_token": "invalid.token.value"})) == "ip:10.0.0.1"
+
+def test_ip_rate_limit_key_ignores_access_token():
+    """로그인 등 인증 전 엔드포인트의 키는 Access Token 쿠키가 있어도 IP 주소 기준이어야 한다."""
+    token = create_access_token({"sub": "test@example.com", "uid": 7})
+    
+    assert get_ip_rate_limit_key(_make_request({"access_token": token})) == "ip:10.0.0.1"
+
+def test_rate_limit_key_falls_back_to_ip_for_tokens_without_uid():
+    """사용자 ID가 없는 이전 형식의 토큰은 IP 주소 기준으로 제한해야 한다."""
+    token = create_access_token({"sub": "test@example.com"})
+    
+    assert get_rate_limit_key(_make_request({"access_token": token})) == "ip:10.0.0.1"
+
+async def _assert_shared_moving_window(app_a: FastAPI, app_b: FastAPI) -> None:
+    """두 인스턴스에 번갈아 요청하여 한도(3/minute)가 합산되는지 확인"""
+    worker_a = AsyncClient(transport=ASGITransport(app=app_a), base_url="http://test")
+    worker_b = AsyncClient(transport=ASGITransport(app=app_b), base_url="http://test")
+
+    async with worker_a, worker_b:
+        statuses = [
+            (await worker_a.get("/limited")).status_code,
+            (await worker_b.get("/limited")).status_code,
+            (await worker_a.get("/limited")).status_code,
+        ]
+        assert statuses == [200, 200, 200]
+
+        blocked = await worker_b.get("/limited")
+        assert blocked.status_code == 429
+        assert blocked.headers["X-RateLimit-Remaining"] == "0"
+        assert "Retry-After" in blocked.headers
+        assert (await worker_a.get("/limited")).status_code == 429
+
+@pytest.mark.asyncio
+async def test_moving_window_is_shared_across_instances():
+    """
+    같은 저장소를 쓰는 두 인스턴스는 하나의 슬라이딩 윈도우를 공유해야 한다.
+    (인스턴스마다 카운터가 따로 있으면 한도가 인스턴스 수만큼 늘어남)
+    """
+    uri = "shared-memory://cross-instance"
+    await _assert_shared_moving_window(_make_app(uri), _make_app(uri))
+
+@pytest.mark.asyncio
+async def test_moving_window_is_shared_across_instances_on_redis():
+    """
+    redis:// 저장소(moving-window Lua 스크립트)를 쓰는 두 인스턴스도 하나의 슬라이딩 윈도우를 공유해야 한다.
+    (fakeredis의 Lua 지원이 없으면 건너뜀)
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    import redis
+
+    server = fakeredis.FakeServer()
+
+    def _redis_app() -> FastAPI:
+        # 인스턴스마다 별도의 커넥션 풀, 같은 (가짜) Redis 서버
+        pool = redis.ConnectionPool(connection_class=fakeredis.FakeConnection, server=server)
+        return _make_app("redis://rate-limit.test:6379/0", {"connection_pool": pool})
+
+    await _assert_shared_moving_window(_redis_app(), _redis_app())
+
+    # moving-window는 키마다 요청 시각 목록(LIST)으로 기록
+    client = fakeredis.FakeRedis(server=server)
+    keys = client.keys("*rate_limit*")
+    assert keys
+    assert all(client.type(key) == b"list" for key in keys)
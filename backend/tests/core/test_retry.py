@@ -0,0 +1,136 @@
+import asyncio
+import time
+import pytest
+
+from app.core import retry as retry_module
+from app.core.retry import RetryBudget, RetryPolicy, call_with_retry, get_retry_metrics
+from app.core.exceptions import AIConnectionError
+from app.services.ai_service import is_retryable_llm_error
+
+class Flaky:
+    """처음 failures번은 error를 던지고 이후에는 "ok"를 반환하는 호출"""
+    def __init__(self, failures: int, error: Exception | None = None):
+        self.failures = failures
+        self.error = error or ConnectionError("backend down")
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+def _policy(name: str, **overrides) -> RetryPolicy:
+    options = dict(
+        name=name,
+        retry_on=lambda e: isinstance(e, ConnectionError),
+        max_attempts=3,
+        base_delay=0.01,
+        max_delay=0.05,
+    )
+    options.update(overrides)
+    return RetryPolicy(**options)
+
+def _budget(**overrides) -> RetryBudget:
+    options = dict(ratio=0.1, min_per_second=0.0, max_tokens=10)
+    options.update(overrides)
+    return RetryBudget(**options)
+
+@pytest.mark.asyncio
+async def test_retries_retryable_error_and_records_attempts():
+    """재시도 가능한 오류는 max_attempts 안에서 재시도하고, 시도 횟수 분포를 기록해야 한다."""
+    func = Flaky(failures=2)
+
+    assert await call_with_retry(func, _policy("test_success"), budget=_budget()) == "ok"
+
+    stats = get_retry_metrics("test_success").stats()
+    assert func.calls == 3
+    assert stats["retries"] == 2
+    assert stats["successes"] == 1
+    assert stats["attempts"] == {3: 1}
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_is_raised_immediately():
+    """요청 자체의 오류(재시도해도 같은 결과)는 재시도하지 않아야 한다."""
+    func = Flaky(failures=5, error=ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        await call_with_retry(func, _policy("test_not_retryable"), budget=_budget())
+
+    assert func.calls == 1
+    assert get_retry_metrics("test_not_retryable").stats()["attempts"] == {1: 1}
+
+@pytest.mark.asyncio
+async def test_backoff_is_exponential_with_jitter_and_capped(mocker):
+    """대기 시간은 random(0, min(max_delay, base_delay * 2^(시도-1)))이어야 한다."""
+    policy = _policy("test_backoff", base_delay=1.0, max_delay=3.0)
+    uniform = mocker.patch.object(retry_module.random, "uniform", side_effect=lambda low, high: high)
+
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 3.0, 3.0]
+    assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_the_whole_call(mocker):
+    """
+    마감 시간이 지나면 진행 중인 시도를 중단하고 TimeoutError를 던져야 하며,
+    다음 대기가 마감 시간을 넘기면 재시도하지 않아야 한다.
+    """
+    async def hang():
+        await asyncio.sleep(10)
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        await call_with_retry(hang, _policy("test_deadline", deadline=0.1), budget=_budget())
+    assert time.monotonic() - started < 1
+    assert get_retry_metrics("test_deadline").stats()["deadline_exceeded"] == 1
+
+    # jitter 없이 항상 최대 대기 시간(5초)을 사용 -> 마감 시간(0.5초)을 넘기므로 재시도하지 않음
+    mocker.patch.object(retry_module.random, "uniform", side_effect=lambda low, high: high)
+    func = Flaky(failures=1)
+    policy = _policy("test_deadline_backoff", base_delay=5.0, max_delay=5.0, deadline=0.5)
+    started = time.monotonic()
+    with pytest.raises(ConnectionError):
+        await call_with_retry(func, policy, budget=_budget())
+    assert func.calls == 1
+    assert time.monotonic() - started <= 0.5
+    assert get_retry_metrics("test_deadline_backoff").stats()["deadline_exceeded"] == 1
+
+@pytest.mark.asyncio
+async def test_timeout_raised_by_call_is_not_counted_as_deadline():
+    """호출 자체가 던진 TimeoutError는 마감 초과가 아니라 재시도 가능한 시도 오류로 처리해야 한다."""
+    func = Flaky(failures=1, error=asyncio.TimeoutError())
+    policy = _policy("test_call_timeout", retry_on=lambda e: isinstance(e, TimeoutError), deadline=5.0)
+
+    assert await call_with_retry(func, policy, budget=_budget()) == "ok"
+
+    stats = get_retry_metrics("test_call_timeout").stats()
+    assert func.calls == 2
+    assert stats["retries"] == 1
+    assert stats["deadline_exceeded"] == 0
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_retry_amplification():
+    """장애 중에는 요청 수의 ratio 비율만큼만 재시도해야 한다. (예산이 바닥나면 바로 실패)"""
+    budget = _budget(ratio=0.1, max_tokens=10)
+    budget.tokens = 0
+    policy = _policy("test_budget", max_attempts=5, base_delay=0)
+
+    total_calls = 0
+    for _ in range(50):
+        func = Flaky(failures=100)
+        with pytest.raises(ConnectionError):
+            await call_with_retry(func, policy, budget=budget)
+        total_calls += func.calls
+
+    stats = get_retry_metrics("test_budget").stats()
+    # 요청 50개 * 0.1 = 재시도 5번까지
+    assert stats["retries"] <= 5
+    assert total_calls <= 55
+    assert stats["budget_exhausted"] >= 45
+
+def test_llm_errors_retry_only_on_backend_failures():
+    """LLM 호출은 서버 장애나 사용 가능한 서버가 없는 경우만 재시도해야 한다."""
+    assert is_retryable_llm_error(ConnectionError())
+    assert is_retryable_llm_error(asyncio.TimeoutError())
+    assert is_retryable_llm_error(AIConnectionError("no backend"))
+    assert not is_retryable_llm_error(ValueError("bad request"))
@@ -1,11 +1,19 @@
+import asyncio
+import time
 import pytest
 from datetime import datetime, timedelta, timezone
 from jose import jwt
+from app.core import cache as cache_module
+from app.core import security
 from app.core.security import (
     verify_password,
     get_password_hash,
+    get_password_hash_async,
+    verify_password_async,
+    password_hash_pool,
     create_access_token,
     create_refresh_token,
+    clear_token_cache,
     verify_token
 )
 
@@ -104,4 +112,105 @@ def test_verify_invalid_token_format():
     invalid_token = "this.is.not.a.valid.token"
     
     with pytest.raises(InvalidTokenException):
-        verify_token(invalid_token)
\ No newline at end of file
+        verify_token(invalid_token)
+
+@pytest.mark.asyncio
+async def test_password_hashing_async_runs_on_pool():
+    """
+    비동기 해시/검증 헬퍼 테스트
+    - 동기 버전과 같은 결과를 반환해야 한다.
+    - 여러 요청이 동시에 들어오면 전용 스레드 풀 대기열 지표가 갱신되어야 한다.
+    """
+    completed_before = password_hash_pool.stats()["completed"]
+
+    password = "testpassword123@"
+    hashed_password = await get_password_hash_async(password)
+    assert verify_password(password, hashed_password) is True
+
+    results = await asyncio.gather(
+        *(verify_password_async(password, hashed_password) for _ in range(password_hash_pool.max_workers + 2)),
+        verify_password_async("wrongpassword123@", hashed_password),
+    )
+    assert results[:-1] == [True] * (password_hash_pool.max_workers + 2)
+    assert results[-1] is False
+
+    stats = password_hash_pool.stats()
+    assert stats["completed"] - completed_before == password_hash_pool.max_workers + 4
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["max_queued"] > password_hash_pool.max_workers
+
+def test_verify_access_token_uses_cache_until_exp(monkeypatch):
+    """
+    검증된 Access Token 캐시 테스트
+    - 두 번째 검증부터는 jwt.decode를 호출하지 않아야 한다.
+    - 캐시 항목은 토큰의 exp 시점에 만료되어 다시 전체 검증을 거쳐야 한다.
+    - Refresh Token은 캐시하지 않는다.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(seconds=30)
+    token = jwt.encode(
+        {"sub": "test@example.com", "exp": expire, "type": "access"},
+        settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM,
+    )
+
+    decode_calls = []
+    original_decode = security.jwt.decode
+    def _counting_decode(*args, **kwargs):
+        decode_calls.append(1)
+        return original_decode(*args, **kwargs)
+    monkeypatch.setattr(security.jwt, "decode", _counting_decode)
+
+    first = verify_token(token)
+    first["sub"] = "mutated"
+    second = verify_token(token)
+    assert second["sub"] == "test@example.com"
+    assert len(decode_calls) == 1
+
+    # exp 이후에는 캐시에서 제거되어 다시 jwt.decode로 검증
+    now = time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 31)
+    verify_token(token)
+    assert len(decode_calls) == 2
+
+    cache_size = security.token_cache_stats()["size"]
+    refresh_token = create_refresh_token({"sub": "test@example.com"})
+    verify_token(refresh_token, "refresh")
+    assert security.token_cache_stats()["size"] == cache_size
+
+def test_verify_token_cache_hit_skips_decode(monkeypatch):
+    """캐시를 비운 뒤 같은 Access Token을 두 번 검증하면 jwt.decode는 한 번만 호출되어야 한다."""
+    token = create_access_token({"sub": "test@example.com", "uid": 1})
+    clear_token_cache()
+
+    decode_calls = []
+    original_decode = security.jwt.decode
+    def _counting_decode(*args, **kwargs):
+        decode_calls.append(1)
+        return original_decode(*args, **kwargs)
+    monkeypatch.setattr(security.jwt, "decode", _counting_decode)
+
+    assert verify_token(token) == verify_token(token)
+    assert len(decode_calls) == 1
+
+@pytest.mark.benchmark
+def test_verify_token_cache_benchmark():
+    """
+    Access Token 검증 처리량 비교 (cold: 매번 전체 검증 / warm: 캐시 적중)
+    warm 경로가 cold 경로보다 처리량이 충분히 높아야 한다.
+    """
+    rounds = 2000
+    token = create_access_token({"sub": "test@example.com", "uid": 1})
+
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        clear_token_cache()
+        verify_token(token)
+    cold = time.perf_counter() - started_at
+
+    verify_token(token)
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        verify_token(token)
+    warm = time.perf_counter() - started_at
+
+    assert warm * 3 < cold
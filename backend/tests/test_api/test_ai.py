@@ -5,7 +5,7 @@ from httpx import AsyncClient
 from unittest.mock import AsyncMock
 
 from app.main import app
-from app.dependencies import get_current_user, get_ai_service
+from app.dependencies import get_current_user, get_current_user_id, get_ai_service
 from app.models.user import User
 from app.services.ai_service import AIService
 from app.schemas.ai import AIParsedSchedule, AIParseResponse
@@ -34,6 +34,7 @@ async def override_dependencies(mock_ai_service: AsyncMock):
         return mock_ai_service
     
     app.dependency_overrides[get_current_user] = override_get_current_user
+    app.dependency_overrides[get_current_user_id] = lambda: TEST_USER.id
     app.dependency_overrides[get_ai_service] = override_get_ai_service
     yield
     app.dependency_overrides.clear()
@@ -74,6 +75,7 @@ async def test_parse_text_with_ai_authenticated_question(client: AsyncClient, mo
 async def test_parse_text_with_ai_authenticated(client: AsyncClient):
     """인증되지 않는 사용자가 /ai/parse 엔드포인트에 접근하는 경우를 테스트"""
     app.dependency_overrides[get_current_user] = lambda: (_ for _ in ()).throw(CredentialException("Token required"))
+    app.dependency_overrides[get_current_user_id] = lambda: (_ for _ in ()).throw(CredentialException("Token required"))
     
     response = await client.post("/api/v1/ai/parse", json={"text": "아무 텍스트"})
     
@@ -99,4 +101,83 @@ async def test_parse_text_with_ai_authenticated_parsing_error(client: AsyncClien
     response = await client.post("/api/v1/ai/parse", json={"text": "아무 텍스트"})
     
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert "AI 응답 파싱 오류: AI 응답 포맷 오류" in response.json()["detail"]
\ No newline at end of file
+    assert "AI 응답 파싱 오류: AI 응답 포맷 오류" in response.json()["detail"]    
+async def test_stream_text_with_ai_general_chat(client: AsyncClient, mock_ai_service: AsyncMock):
+    """일반 대화 응답이 SSE token 이벤트로 전달되고, 마지막에 done 이벤트가 오는지 테스트"""
+    async def fake_stream_chat(user_id: int, message: str):
+        yield "token", "안녕"
+        yield "token", "하세요"
+        yield "done", "안녕하세요"
+    
+    mock_ai_service.stream_chat = fake_stream_chat
+    
+    response = await client.post("/api/v1/ai/parse/stream", json={"text": "안녕"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0] == 'event: token\ndata: {"text": "안녕"}'
+    assert events[1] == 'event: token\ndata: {"text": "하세요"}'
+    assert events[2].startswith("event: done")
+    assert '"question": "안녕하세요"' in events[2]
+    
+async def test_stream_text_with_ai_connection_error(client: AsyncClient, mock_ai_service: AsyncMock):
+    """스트리밍 중 AI 연결 오류가 발생하면 error 이벤트를 전달하는지 테스트"""
+    async def fake_stream_chat(user_id: int, message: str):
+        raise AIConnectionError("Ollama 서버 연결 실패")
+        yield
+    
+    mock_ai_service.stream_chat = fake_stream_chat
+    
+    response = await client.post("/api/v1/ai/parse/stream", json={"text": "안녕"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text.startswith("event: error")
+    assert "AI 서비스 연결 오류: Ollama 서버 연결 실패" in response.text
+
+async def test_stream_text_with_ai_rolls_back_on_disconnect(mock_ai_service: AsyncMock):
+    """클라이언트가 스트림 도중 연결을 끊으면 커밋하지 않고 롤백 후 세션을 닫아야 한다."""
+    from app.api.v1.ai import stream_text_with_ai
+    from app.core.admission import get_ai_admission_controller
+    from app.schemas.ai import AITextRequest
+    
+    async def fake_stream_chat(user_id: int, message: str):
+        yield "token", "안녕"
+        yield "token", "하세요"
+        yield "done", "안녕하세요"
+    
+    mock_ai_service.stream_chat = fake_stream_chat
+    db = AsyncMock()
+    admission = get_ai_admission_controller()
+    running_before = admission.running
+    
+    response = await stream_text_with_ai(AITextRequest(text="안녕"), TEST_USER.id, mock_ai_service, db, admission)
+    stream = response.body_iterator
+    assert (await stream.__anext__()).startswith("event: token")
+    await stream.aclose()
+    
+    db.commit.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+    db.close.assert_awaited_once()
+    assert admission.running == running_before
+
+async def test_parse_text_with_ai_rate_limited_per_user(client: AsyncClient, mock_ai_service: AsyncMock):
+    """사용자별 AI 요청 한도를 넘으면 AI를 호출하지 않고 429와 Retry-After를 반환하는지 테스트"""
+    from app.core.admission import AdmissionController
+    from app.dependencies import get_ai_admission_controller
+    
+    controller = AdmissionController(
+        max_concurrency=1, max_queue=0, queue_timeout=1, user_rate_per_minute=1, user_burst=1
+    )
+    app.dependency_overrides[get_ai_admission_controller] = lambda: controller
+    mock_ai_service.process_chat.return_value = "무엇을 도와드릴까요?"
+    
+    first = await client.post("/api/v1/ai/parse", json={"text": "안녕"})
+    assert first.status_code == status.HTTP_200_OK
+    
+    second = await client.post("/api/v1/ai/parse", json={"text": "안녕"})
+    assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(second.headers["retry-after"]) > 0
+    assert mock_ai_service.process_chat.await_count == 1
+    assert controller.stats()["running"] == 0
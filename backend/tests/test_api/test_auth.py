@@ -261,4 +261,46 @@ async def test_get_current_user_user_not_found(client: AsyncClient):
     response = await client.get("/api/v1/auth/me")
     
     assert response.status_code == 401
-    assert response.json()["detail"] == "사용자를 찾을 수 없습니다."
\ No newline at end of file
+    assert response.json()["detail"] == "사용자를 찾을 수 없습니다."
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_user_cache(client: AsyncClient, db_session, authenticated_user_cookie: dict[str, str], test_user: User, count_queries):
+    """Access Token에 사용자 ID가 포함되고, 두 번째 요청부터는 DB 조회 없이 사용자 캐시를 사용하는 경우"""
+    payload = security.verify_token(authenticated_user_cookie["access_token"], token_type="access")
+    assert payload["uid"] == test_user.id
+    
+    # 테스트 클라이언트는 하나의 세션을 공유하므로 Identity Map을 비워 실제 요청과 같은 조건으로 만듦
+    db_session.expunge_all()
+    
+    with count_queries() as first:
+        response = await client.get("/api/v1/auth/me", cookies=authenticated_user_cookie)
+    assert response.status_code == 200
+    assert len(first) == 1
+    
+    with count_queries() as second:
+        response = await client.get("/api/v1/auth/me", cookies=authenticated_user_cookie)
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
+    assert len(second) == 0
+
+@pytest.mark.asyncio
+async def test_login_rate_limit_headers(client: AsyncClient, test_user: User):
+    """
+    로그인 응답에 Rate Limit 헤더가 포함되고, 초과 시 남은 대기 시간이 Retry-After로 전달되는 경우
+    (첫 로그인으로 받은 Access Token 쿠키를 보내도 같은 IP 기준 한도로 계산)
+    """
+    login_data = {"username": test_user.email, "password": "testpassword123@"}
+    
+    response = await client.post("/api/v1/auth/login", data=login_data)
+    assert response.status_code == 200
+    assert response.headers["x-ratelimit-limit"] == "5"
+    assert response.headers["x-ratelimit-remaining"] == "4"
+    cookies = {"access_token": response.cookies["access_token"]}
+    
+    for _ in range(4):
+        await client.post("/api/v1/auth/login", data=login_data, cookies=cookies)
+    
+    response = await client.post("/api/v1/auth/login", data=login_data, cookies=cookies)
+    assert response.status_code == 429
+    assert response.headers["x-ratelimit-remaining"] == "0"
+    assert 0 < int(response.headers["retry-after"]) <= 60
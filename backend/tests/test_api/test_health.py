@@ -0,0 +1,42 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.admission import get_ai_admission_controller
+from app.services.ai_service import intent_classifier
+from app.services.llm_dispatcher import LLMPriority, get_llm_dispatcher
+
+@pytest.mark.asyncio
+async def test_health_check(client: AsyncClient):
+    """서버가 실행 중이면 status: ok를 반환해야 한다."""
+    response = await client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+@pytest.mark.asyncio
+async def test_runtime_metrics_expose_component_stats(client: AsyncClient):
+    """
+    /health/metrics는 LLM 스케줄러, 수용 제어, 의도 분류기, 비밀번호 해시 풀, 재시도 지표를 한 번에 반환하고,
+    각 구성 요소의 변화가 응답에 반영되어야 한다.
+    """
+    before = (await client.get("/health/metrics")).json()
+    
+    dispatcher = get_llm_dispatcher()
+    async with dispatcher.slot(LLMPriority.BATCH):
+        pass
+    async with get_ai_admission_controller().admit(user_id=1):
+        pass
+    intent_classifier.classify("안녕")
+    
+    response = await client.get("/health/metrics")
+    assert response.status_code == 200
+    metrics = response.json()
+    
+    assert isinstance(metrics["pid"], int)
+    assert metrics["llm_dispatcher"]["batch"]["admitted"] == before["llm_dispatcher"]["batch"]["admitted"] + 1
+    assert metrics["ai_admission"]["admitted"] == before["ai_admission"]["admitted"] + 1
+    assert "rejected_queue_full" in metrics["ai_admission"]
+    assert sum(metrics["intent_classifier"].values()) == sum(before["intent_classifier"].values()) + 1
+    assert {"queued", "running", "completed"} <= set(metrics["password_hash_pool"])
+    assert {"tokens", "max_tokens", "ratio"} <= set(metrics["retry"]["budget"])
+    assert isinstance(metrics["retry"]["policies"], dict)
@@ -276,4 +276,121 @@ async def test_delete_schedule_not_found(client: AsyncClient, authenticated_user
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
-#===========================================================================================
\ No newline at end of file
+#===========================================================================================
+#========================= 기간 일정 조회 테스트 ==================================================
+@pytest.mark.asyncio
+async def test_get_schedules_by_range_across_months(client: AsyncClient, authenticated_user_cookie: dict[str, str]):
+    """월 경계를 넘는 주간 조회를 한 번의 요청으로 처리하는 경우 (to는 미포함)"""
+    await client.post("/api/v1/schedules/", json={"title": "11월 말 일정", "date": "2025-11-29", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    await client.post("/api/v1/schedules/", json={"title": "12월 초 일정", "date": "2025-12-02", "start_time":"09:00", "end_time":"10:00"}, cookies=authenticated_user_cookie)
+    await client.post("/api/v1/schedules/", json={"title": "범위 밖 일정", "date": "2025-12-05", "start_time":"09:00", "end_time":"10:00"}, cookies=authenticated_user_cookie)
+    
+    response = await client.get("/api/v1/schedules/range", params={"from": "2025-11-28", "to": "2025-12-05"}, cookies=authenticated_user_cookie)
+    
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert [s["title"] for s in response_data["items"]] == ["11월 말 일정", "12월 초 일정"]
+    assert response_data["next_cursor"] is None
+
+@pytest.mark.asyncio
+async def test_get_schedules_by_range_pagination(client: AsyncClient, authenticated_user_cookie: dict[str, str]):
+    """limit보다 결과가 많으면 next_cursor로 다음 페이지를 이어서 조회하는 경우"""
+    for day in range(1, 6):
+        await client.post("/api/v1/schedules/", json={"title": f"일정 {day}", "date": f"2025-12-0{day}", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    
+    params = {"from": "2025-12-01", "to": "2026-01-01", "limit": 2}
+    titles = []
+    while True:
+        response = await client.get("/api/v1/schedules/range", params=params, cookies=authenticated_user_cookie)
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        titles += [s["title"] for s in response_data["items"]]
+        if response_data["next_cursor"] is None:
+            break
+        params["cursor"] = response_data["next_cursor"]
+    
+    assert titles == [f"일정 {day}" for day in range(1, 6)]
+
+@pytest.mark.asyncio
+async def test_get_schedules_by_range_invalid(client: AsyncClient, authenticated_user_cookie: dict[str, str]):
+    """기간이 잘못되었거나 커서가 잘못된 경우 400 Bad Request"""
+    response = await client.get("/api/v1/schedules/range", params={"from": "2025-12-05", "to": "2025-12-01"}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    response = await client.get("/api/v1/schedules/range", params={"from": "2020-01-01", "to": "2025-01-01"}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    response = await client.get("/api/v1/schedules/range", params={"from": "2025-12-01", "to": "2025-12-31", "cursor": "invalid"}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+#========================= 월별 조회 조건부 요청(ETag) 테스트 ==================================================
+@pytest.mark.asyncio
+async def test_get_schedules_month_etag_not_modified(client: AsyncClient, authenticated_user_cookie: dict[str, str]):
+    """같은 ETag로 다시 요청하면 본문 없이 304, 일정이 바뀌면 새 ETag와 200을 반환"""
+    await client.post("/api/v1/schedules/", json={"title": "ETag 일정 1", "date": "2025-11-10", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    params = {"year": 2025, "month": 11}
+    
+    first = await client.get("/api/v1/schedules/", params=params, cookies=authenticated_user_cookie)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first.headers["etag"]
+    
+    not_modified = await client.get("/api/v1/schedules/", params=params, cookies=authenticated_user_cookie, headers={"If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    
+    # 다른 달의 일정은 ETag에 영향 없음
+    await client.post("/api/v1/schedules/", json={"title": "12월 일정", "date": "2025-12-10", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    still_same = await client.get("/api/v1/schedules/", params=params, cookies=authenticated_user_cookie, headers={"If-None-Match": etag})
+    assert still_same.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    await client.post("/api/v1/schedules/", json={"title": "ETag 일정 2", "date": "2025-11-11", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    modified = await client.get("/api/v1/schedules/", params=params, cookies=authenticated_user_cookie, headers={"If-None-Match": etag})
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.headers["etag"] != etag
+    assert len(modified.json()) == 2
+
+@pytest.mark.asyncio
+async def test_get_schedules_invalid_month(client: AsyncClient, authenticated_user_cookie: dict[str, str]):
+    """존재하지 않는 월로 요청하는 경우 422"""
+    response = await client.get("/api/v1/schedules/", params={"year": 2025, "month": 13}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+#========================= 엔드포인트별 쿼리 수 예산 테스트 ==================================================
+# 인증(get_current_user)은 로그인 후 첫 요청에서만 사용자를 조회하고 이후에는 사용자 캐시를 사용
+@pytest.mark.asyncio
+async def test_schedule_read_endpoints_query_budget(client: AsyncClient, db_session: AsyncSession, authenticated_user_cookie: dict[str, str], count_queries):
+    """일정 조회 엔드포인트가 users 테이블을 추가로 조회하지 않고 정해진 쿼리 수 안에서 처리되는지 확인"""
+    # 테스트 클라이언트는 하나의 세션을 공유하므로 Identity Map을 비워 실제 요청과 같은 조건으로 만듦
+    db_session.expunge_all()
+    
+    # 첫 요청: 인증 1 + 일정 INSERT 1
+    with count_queries() as statements:
+        created = await client.post("/api/v1/schedules/", json={"title": "쿼리 예산 일정", "date": "2025-11-10", "start_time":"10:00", "end_time":"11:00"}, cookies=authenticated_user_cookie)
+    schedule_id = created.json()["id"]
+    assert sum("FROM users" in s for s in statements) == 1
+    
+    # 단건 조회: 일정 1
+    with count_queries() as statements:
+        response = await client.get(f"/api/v1/schedules/{schedule_id}", cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+    
+    # 월별 조회(캐시 미스): 버전 집계 1 + 목록 1
+    with count_queries() as statements:
+        response = await client.get("/api/v1/schedules/", params={"year": 2025, "month": 11}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 2
+    
+    # 월별 조회(프로세스 내 캐시 적중): 버전 집계 1 (다른 워커의 변경 확인), 목록 조회 없음
+    with count_queries() as statements:
+        response = await client.get("/api/v1/schedules/", params={"year": 2025, "month": 11}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+    assert "count(schedules.id)" in statements[0]
+    
+    # 기간 조회: 목록 1
+    with count_queries() as statements:
+        response = await client.get("/api/v1/schedules/range", params={"from": "2025-11-01", "to": "2025-12-01"}, cookies=authenticated_user_cookie)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.chat_repo import ChatRepository
 from app.models.chat import ChatRole
 from app.models.user import User
+from app.core.chat_history_cache import get_chat_history_cache
 
 @pytest.mark.asyncio
 async def test_create_chat_history(db_session: AsyncSession, test_user: User):
@@ -49,4 +50,32 @@ async def test_delete_old_chat(db_session: AsyncSession, test_user: User):
     chat = await repo.create(test_user.id, ChatRole.USER, "to be deleted")
     
     delete_chat = await repo.delete(chat)
-    assert delete_chat.is_deleted == True
\ No newline at end of file
+    assert delete_chat.is_deleted == True
+@pytest.mark.asyncio
+async def test_delete_chat_invalidates_history_cache(db_session: AsyncSession, test_user: User):
+    """소프트 삭제 시 해당 사용자의 대화 캐시가 무효화되는지 테스트"""
+    repo = ChatRepository(db_session)
+    cache = get_chat_history_cache()
+    chat = await repo.create(test_user.id, ChatRole.USER, "to be deleted")
+    await cache.set(test_user.id, [{"role": "user", "content": "to be deleted"}])
+    
+    await repo.delete(chat)
+    
+    assert await cache.get(test_user.id) is None
+
+@pytest.mark.asyncio
+async def test_bulk_append(db_session: AsyncSession, test_user: User):
+    """질문/응답 한 쌍이 한 번의 INSERT로 저장되고 순서대로 조회되는지 테스트"""
+    repo = ChatRepository(db_session)
+    
+    count = await repo.bulk_append(
+        test_user.id,
+        [(ChatRole.USER, "내일 일정 알려줘"), (ChatRole.ASSISTANT, "내일은 일정이 없습니다.")]
+    )
+    
+    assert count == 2
+    recent_chats = await repo.get_recent_chats(test_user.id, limit=2)
+    assert [(c.role, c.content) for c in recent_chats] == [
+        ("assistant", "내일은 일정이 없습니다."),
+        ("user", "내일 일정 알려줘")
+    ]
@@ -45,4 +45,15 @@ async def test_exists_successful_job_today(db_session):
     assert await repo.exists_successful_job_today(job_name) is False
     # 4. 오늘 성공 기록 있을 때 -> True
     await repo.create_log(job_name, "SUCCESS", "Done")
-    assert await repo.exists_successful_job_today(job_name) is True
\ No newline at end of file
+    assert await repo.exists_successful_job_today(job_name) is True
+@pytest.mark.asyncio
+async def test_exists_successful_job_today_ignores_tomorrow(db_session):
+    """내일(미래) 성공 기록은 오늘 기록으로 판단하지 않아야 한다 (반열린 구간 [오늘, 내일))"""
+    repo = JobHistoryRepository(db_session)
+    job_name = "morning_briefing"
+    
+    tomorrow = datetime.combine(datetime.now().date() + timedelta(days=1), datetime.min.time())
+    db_session.add(JobHistory(job_name=job_name, status="SUCCESS", created_at=tomorrow))
+    await db_session.commit()
+    
+    assert await repo.exists_successful_job_today(job_name) is False
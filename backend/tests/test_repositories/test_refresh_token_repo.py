@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from app.core.refresh_token_cache import InMemoryRefreshTokenStateCache
 from app.repositories.refresh_token_repo import RefreshTokenRepository
 from app.models.user import User  # test_user fixture의 타입 힌트를 위해 import
 
@@ -59,4 +60,59 @@ async def test_get_and_revoke_token(db_session: AsyncSession, test_user: User):
     # 2-3. 다시 조회하여 무효화 확인
     found_token_after_revoke = await repo.get_by_jti(jti)
     assert found_token_after_revoke is not None
-    assert found_token_after_revoke.is_revoked is True
\ No newline at end of file
+    assert found_token_after_revoke.is_revoked is True
+
+@pytest.mark.asyncio
+async def test_token_state_cache_write_through(db_session: AsyncSession, test_user: User, count_queries):
+    """
+    무효화 시 상태 캐시에 함께 기록되어 DB 조회 없이 상태를 판단하고,
+    무효화는 UPDATE ... RETURNING 쿼리 1개로 처리되는지 테스트
+    (프로세스 내 캐시는 유효한 상태를 저장하지 않으므로 유효한 토큰은 DB에서 확인)
+    """
+    repo = RefreshTokenRepository(db_session)
+    jti = str(uuid4())
+    expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+    await repo.create(user_id=test_user.id, jti=jti, expires_at=expires_at)
+
+    with count_queries() as statements:
+        assert await repo.get_state(jti) == (test_user.id, False)
+        assert await repo.get_state(jti) == (test_user.id, False)
+    assert len(statements) == 2
+
+    with count_queries() as statements:
+        await repo.revoke(jti)
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    assert "RETURNING" in statements[0].upper()
+
+    with count_queries() as statements:
+        state = await repo.get_state(jti)
+    assert state == (test_user.id, True)
+    assert statements == []
+
+    # 캐시에 없으면 DB에서 다시 채움
+    await repo.state_cache.clear()
+    with count_queries() as statements:
+        assert await repo.get_state(jti) == (test_user.id, True)
+        assert await repo.get_state(jti) == (test_user.id, True)
+    assert len(statements) == 1
+    assert await repo.get_state("unknown-jti") is None
+
+
+@pytest.mark.asyncio
+async def test_revocation_on_other_worker_is_seen_immediately(db_session: AsyncSession, test_user: User):
+    """
+    워커마다 별도의 프로세스 내 캐시를 사용할 때, 다른 워커에서 무효화한 토큰을
+    유효한 것으로 판단하지 않아야 한다.
+    """
+    def _worker_repo() -> RefreshTokenRepository:
+        return RefreshTokenRepository(db_session, state_cache=InMemoryRefreshTokenStateCache(maxsize=100, ttl=60))
+
+    worker_a, worker_b = _worker_repo(), _worker_repo()
+    jti = str(uuid4())
+    await worker_a.create(user_id=test_user.id, jti=jti, expires_at=datetime.now(timezone.utc) + timedelta(days=7))
+    assert await worker_a.get_state(jti) == (test_user.id, False)
+
+    await worker_b.revoke(jti)
+
+    assert await worker_a.get_state(jti) == (test_user.id, True)
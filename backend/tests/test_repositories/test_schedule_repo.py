@@ -1,6 +1,8 @@
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import time
+from datetime import time, date
 
 from app.repositories.schedule_repo import ScheduleRepository
 from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
@@ -84,6 +86,87 @@ async def test_get_schedules_by_user_and_month(db_session: AsyncSession, test_us
     assert "Dec" in schedules[0].title
     assert "Dec" in schedules[1].title
 
+@pytest.mark.asyncio
+async def test_get_schedules_by_user_and_month_boundaries(db_session: AsyncSession, test_user: User):
+    """월의 첫날/마지막 날은 포함하고, 다음 달 1일(연도 경계 포함)은 제외하는지 테스트"""
+    repo = ScheduleRepository(db_session)
+
+    await repo.create(ScheduleCreate(title="Dec first", date="2025-12-01", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Dec last", date="2025-12-31", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Jan first", date="2026-01-01", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+
+    december = await repo.get_schedules_by_user_and_month(test_user.id, year=2025, month=12)
+    january = await repo.get_schedules_by_user_and_month(test_user.id, year=2026, month=1)
+
+    assert [s.title for s in december] == ["Dec first", "Dec last"]
+    assert [s.title for s in january] == ["Jan first"]
+
+@pytest.mark.asyncio
+async def test_get_schedule_rows_by_user_and_range_keyset(db_session: AsyncSession, test_user: User):
+    """월 경계를 넘는 기간 조회와 Keyset 페이지네이션(after) 테스트"""
+    repo = ScheduleRepository(db_session)
+
+    await repo.create(ScheduleCreate(title="Nov 30", date="2025-11-30", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Dec 1 am", date="2025-12-01", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Dec 1 pm", date="2025-12-01", start_time=time(14,0), end_time=time(15,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Dec 7", date="2025-12-07", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+
+    first_page = await repo.get_schedule_rows_by_user_and_range(test_user.id, date(2025, 11, 30), date(2025, 12, 7), limit=2)
+    assert [s.title for s in first_page] == ["Nov 30", "Dec 1 am"]
+
+    last = first_page[-1]
+    second_page = await repo.get_schedule_rows_by_user_and_range(
+        test_user.id, date(2025, 11, 30), date(2025, 12, 7), limit=2, after=(last.date, last.start_time, last.id)
+    )
+    assert [s.title for s in second_page] == ["Dec 1 pm"]
+
+@pytest.mark.asyncio
+async def test_user_relationship_loading_is_opt_in(db_session: AsyncSession, test_user: User, count_queries):
+    """기본 조회는 users를 조회하지 않고, load_user=True일 때만 관계를 함께 로딩하는지 테스트"""
+    repo = ScheduleRepository(db_session)
+    created = await repo.create(ScheduleCreate(title="관계 로딩", date="2025-12-01", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    db_session.expunge_all()
+
+    with count_queries() as statements:
+        schedule = await repo.get_schedule_by_id_and_user_id(created.id, test_user.id)
+    assert len(statements) == 1
+    with pytest.raises(InvalidRequestError):
+        schedule.user
+    db_session.expunge_all()
+
+    with count_queries() as statements:
+        schedule = await repo.get_schedule_by_id_and_user_id(created.id, test_user.id, load_user=True)
+    assert len(statements) == 2
+    assert schedule.user.id == test_user.id
+
+@pytest.mark.asyncio
+async def test_month_query_uses_date_index(db_session: AsyncSession, test_user: User):
+    """
+    [회귀 테스트] 월 조회 쿼리가 (user_id, date, start_time) 부분 인덱스를 탐색(SEARCH)하는지 EXPLAIN으로 확인
+    (date에 extract() 같은 함수를 씌우면 인덱스 범위 탐색을 할 수 없음)
+    """
+    repo = ScheduleRepository(db_session)
+    sync_engine = db_session.bind.sync_engine
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM schedules" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await repo.get_schedules_by_user_and_month(test_user.id, year=2025, month=12)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[0]
+    conn = await db_session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    plan = " ".join(row[-1] for row in result.fetchall())
+
+    assert "USING INDEX ix_schedules_user_id_date_start_time_active" in plan
+    assert "date>? AND date<?" in plan
+
 @pytest.mark.asyncio
 async def test_update_schedule(db_session: AsyncSession, test_user: User):
     """일정 정보가 올바르게 수정되는지 테스트"""
@@ -117,4 +200,19 @@ async def test_delete_schedule(db_session: AsyncSession, test_user: User):
     deleted_schedule = await repo.delete(created_schedule)
 
     assert deleted_schedule.is_deleted is True
-    assert deleted_schedule.deleted_at is not None
\ No newline at end of file
+    assert deleted_schedule.deleted_at is not None
+@pytest.mark.asyncio
+async def test_get_schedules_by_users_and_date(db_session: AsyncSession, test_user: User):
+    """여러 사용자의 특정 날짜 일정을 한 번에 조회하는지 테스트 (다른 날짜와 삭제된 일정 제외)"""
+    repo = ScheduleRepository(db_session)
+    
+    await repo.create(ScheduleCreate(title="Late", date="2025-12-01", start_time=time(15,0), end_time=time(16,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Early", date="2025-12-01", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    await repo.create(ScheduleCreate(title="Other Day", date="2025-12-02", start_time=time(9,0), end_time=time(10,0)), user_id=test_user.id)
+    deleted = await repo.create(ScheduleCreate(title="Deleted", date="2025-12-01", start_time=time(11,0), end_time=time(12,0)), user_id=test_user.id)
+    await repo.delete(deleted)
+    
+    schedules = await repo.get_schedules_by_users_and_date([test_user.id, 9999], date(2025, 12, 1))
+    
+    assert [s.title for s in schedules] == ["Early", "Late"]
+    assert await repo.get_schedules_by_users_and_date([], date(2025, 12, 1)) == []
@@ -44,4 +44,40 @@ async def test_get_by_email(db_session: AsyncSession):
     # 3. 단언 (Assert)
     assert found_user is not None
     assert found_user.email == email
-    assert not_found_user is None
\ No newline at end of file
+    assert not_found_user is None
+
+@pytest.mark.asyncio
+async def test_iter_user_ids_in_chunks(db_session: AsyncSession):
+    """
+    UserRepository.iter_user_ids_in_chunks가 id 순서대로 청크를 나눠 모든 사용자 ID를 반환하는지 테스트
+    """
+    # 1. 준비 (Arrange)
+    repo = UserRepository(db_session)
+    for i in range(5):
+        await repo.create(UserCreate(email=f"chunk{i}@example.com", password="testpassword123@"))
+    # 2. 실행 (Act)
+    chunks = [chunk async for chunk in repo.iter_user_ids_in_chunks(chunk_size=2)]
+    # 3. 단언 (Assert)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    user_ids = [user_id for chunk in chunks for user_id in chunk]
+    assert all(isinstance(user_id, int) for user_id in user_ids)
+    assert user_ids == sorted(user_ids)
+    assert len(set(user_ids)) == 5
+
+@pytest.mark.asyncio
+async def test_get_cached_and_invalidate_on_delete(db_session: AsyncSession, test_user, count_queries):
+    """
+    get_cached는 두 번째 조회부터 DB를 조회하지 않고, delete 후에는 캐시된 사용자를 반환하지 않아야 한다.
+    """
+    repo = UserRepository(db_session)
+    
+    with count_queries() as statements:
+        first = await repo.get_cached(test_user.id)
+        second = await repo.get_cached(test_user.id)
+    assert first.email == second.email == test_user.email
+    assert first is not second  # 요청마다 별도의 스냅샷 객체
+    assert len(statements) == 0  # test_user가 이미 세션(Identity Map)에 있으므로 SELECT 없음
+    
+    await repo.delete(test_user)
+    db_session.expunge_all()
+    assert await repo.get_cached(test_user.id) is None
@@ -8,6 +8,8 @@ from app.core.scheduler import run_cleanup_job, run_morning_briefing_job
 from app.models.schedule import Schedule
 from app.models.user import User
 from app.models.notification import Notification
+from app.repositories.notification_repo import NotificationRepository
+from app.services.ai_service import BriefingResult
 
 @pytest.mark.asyncio
 async def test_run_cleanup_job_intergration(db_session: AsyncSession, test_user: User) -> None:
@@ -74,7 +76,7 @@ async def test_run_morning_briefing_job_intergration(db_session: AsyncSession, t
         patch("app.core.scheduler.AIService") as mock_ai_service_cls:
             
         mock_ai_instance = mock_ai_service_cls.return_value
-        mock_ai_instance.generate_briefing = AsyncMock(return_value = "Intergration Test Briefing Content")
+        mock_ai_instance.generate_briefing = AsyncMock(return_value = BriefingResult("Intergration Test Briefing Content"))
         
         await run_morning_briefing_job()
         
@@ -83,4 +85,159 @@ async def test_run_morning_briefing_job_intergration(db_session: AsyncSession, t
     
     assert notification is not None
     assert notification.type == "morning_briefing"
-    assert notification.content == "Intergration Test Briefing Content"
\ No newline at end of file
+    assert notification.content == "Intergration Test Briefing Content"
+
+
+@pytest.mark.asyncio
+async def test_briefing_logic_runs_users_concurrently_with_limit(db_session: AsyncSession) -> None:
+    """
+    모닝 브리핑 병렬 처리 테스트
+    - 동시 AI 호출 수가 BRIEFING_CONCURRENCY를 넘지 않는지 확인
+    - 일부 사용자가 실패해도 나머지는 처리되고, 실패/대체 문구 건수가 따로 집계되는지 확인
+    """
+    import asyncio
+    from app.core.scheduler import _briefing_logic
+    
+    users = [User(email=f"user{i}@example.com", password_hash="hashed") for i in range(6)]
+    db_session.add_all(users)
+    await db_session.commit()
+    
+    today = datetime.now()
+    for i, user in enumerate(users):
+        db_session.add(Schedule(
+            user_id=user.id,
+            title="Fail" if i == 0 else f"Meeting {i}",
+            date=today.date(),
+            start_time=today.time(),
+            end_time=(today + timedelta(hours=1)).time(),
+            is_deleted=False
+        ))
+    await db_session.commit()
+    
+    running = 0
+    max_running = 0
+    
+    async def fake_generate_briefing(schedules: list[Schedule]) -> BriefingResult:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if schedules[0].title == "Fail":
+            raise RuntimeError("AI Error")
+        if schedules[0].title == "Meeting 1":
+            return BriefingResult("오늘 총 1개의 일정이 있습니다.", used_fallback=True)
+        return BriefingResult(f"Briefing: {schedules[0].title}")
+    
+    mock_session_factory = MagicMock()
+    mock_session_factory.return_value = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = db_session
+    
+    with patch("app.core.scheduler.AsyncSessionFactory", mock_session_factory), \
+        patch("app.core.scheduler.AIService") as mock_ai_service_cls, \
+        patch("app.core.scheduler.settings.BRIEFING_CONCURRENCY", 2):
+        
+        mock_ai_service_cls.return_value.generate_briefing = fake_generate_briefing
+        result = await _briefing_logic(db_session)
+    
+    assert max_running == 2
+    assert result.startswith("Total Users: 6, Success: 4, Failed: 1, Fallback: 1")
+    assert "Avg Latency:" in result
+    
+    notifications = (await db_session.execute(select(Notification))).scalars().all()
+    assert len(notifications) == 5
+
+@pytest.mark.asyncio
+async def test_briefing_logic_keeps_slots_busy_across_chunks(db_session: AsyncSession) -> None:
+    """
+    청크 경계에서 동시 실행 자리가 비지 않아야 한다.
+    앞 청크의 느린 사용자를 기다리는 동안 다음 청크 사용자의 생성이 먼저 시작되어야 한다.
+    """
+    import asyncio
+    from app.core.scheduler import _briefing_logic
+    
+    users = [User(email=f"chunk{i}@example.com", password_hash="hashed") for i in range(4)]
+    db_session.add_all(users)
+    await db_session.commit()
+    
+    today = datetime.now()
+    for i, user in enumerate(users):
+        db_session.add(Schedule(
+            user_id=user.id,
+            title="Slow" if i == 0 else f"Meeting {i}",
+            date=today.date(),
+            start_time=today.time(),
+            end_time=(today + timedelta(hours=1)).time(),
+            is_deleted=False
+        ))
+    await db_session.commit()
+    
+    events: list[str] = []
+    running = 0
+    max_running = 0
+    
+    async def fake_generate_briefing(schedules: list[Schedule]) -> BriefingResult:
+        nonlocal running, max_running
+        title = schedules[0].title
+        running += 1
+        max_running = max(max_running, running)
+        events.append(f"start {title}")
+        await asyncio.sleep(0.2 if title == "Slow" else 0.01)
+        events.append(f"end {title}")
+        running -= 1
+        return BriefingResult(f"Briefing: {title}")
+    
+    mock_session_factory = MagicMock()
+    mock_session_factory.return_value = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = db_session
+    
+    with patch("app.core.scheduler.AsyncSessionFactory", mock_session_factory), \
+        patch("app.core.scheduler.AIService") as mock_ai_service_cls, \
+        patch("app.core.scheduler.settings.BRIEFING_CONCURRENCY", 2), \
+        patch("app.core.scheduler.settings.BATCH_CHUNK_SIZE", 2):
+        
+        mock_ai_service_cls.return_value.generate_briefing = fake_generate_briefing
+        result = await _briefing_logic(db_session)
+    
+    # 두 번째 청크(Meeting 2, 3)는 첫 청크의 Slow가 끝나기 전에 시작
+    slow_end = events.index("end Slow")
+    assert events.index("start Meeting 2") < slow_end
+    assert events.index("start Meeting 3") < slow_end
+    assert max_running == 2
+    assert result.startswith("Total Users: 4, Success: 4, Failed: 0")
+    notifications = (await db_session.execute(select(Notification))).scalars().all()
+    assert len(notifications) == 4
+
+@pytest.mark.asyncio
+async def test_briefing_chunk_save_is_retried(db_session: AsyncSession, test_user: User) -> None:
+    """
+    알림 저장(bulk INSERT)이 일시적으로 실패해도 생성한 브리핑을 버리지 않고 저장을 재시도해야 한다.
+    """
+    from app.core.scheduler import _briefing_logic
+    
+    original_bulk_create = NotificationRepository.bulk_create
+    calls = 0
+    
+    async def flaky_bulk_create(self, notifications):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("DB Error")
+        return await original_bulk_create(self, notifications)
+    
+    mock_session_factory = MagicMock()
+    mock_session_factory.return_value = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = db_session
+    
+    with patch("app.core.scheduler.AsyncSessionFactory", mock_session_factory), \
+        patch("app.core.scheduler.AIService") as mock_ai_service_cls, \
+        patch.object(NotificationRepository, "bulk_create", flaky_bulk_create), \
+        patch("app.core.scheduler.settings.BRIEFING_SAVE_RETRY_DELAY_SECONDS", 0):
+        
+        mock_ai_service_cls.return_value.generate_briefing = AsyncMock(return_value=BriefingResult("Briefing"))
+        result = await _briefing_logic(db_session)
+    
+    assert calls == 2
+    assert result.startswith("Total Users: 1, Success: 1, Failed: 0")
+    notifications = (await db_session.execute(select(Notification))).scalars().all()
+    assert [n.user_id for n in notifications] == [test_user.id]
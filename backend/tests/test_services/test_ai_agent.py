@@ -46,4 +46,32 @@ async def test_ai_agent_run_flow():
             user_id = user_id,
             inputs = {"input": user_message},
             outputs = {"output": "AI 응답입니다."}
-        )
\ No newline at end of file
+        )
+@pytest.mark.asyncio
+async def test_ai_agent_stream_flow():
+    """
+        AIAgent.stream() 메서드가 토큰을 순서대로 전달하고,
+        스트림이 끝나면 전체 응답을 MemoryService에 저장하는지 검증합니다.
+    """
+    mock_memory_service = AsyncMock()
+    mock_memory_obj = MagicMock()
+    mock_memory_obj.aload_memory_variables = AsyncMock(return_value = {"history": []})
+    mock_memory_service.get_memory.return_value = mock_memory_obj
+    
+    async def fake_astream(inputs):
+        for chunk in ["AI ", "응답", "입니다."]:
+            yield chunk
+    
+    with patch("app.services.ai_agent.ChatOllama"):
+        agent = AIAgent(mock_memory_service)
+        agent.chain = MagicMock()
+        agent.chain.astream = fake_astream
+        
+        tokens = [token async for token in agent.stream(1, "안녕하세요")]
+        
+        assert tokens == ["AI ", "응답", "입니다."]
+        mock_memory_service.save_context.assert_called_once_with(
+            user_id = 1,
+            inputs = {"input": "안녕하세요"},
+            outputs = {"output": "AI 응답입니다."}
+        )
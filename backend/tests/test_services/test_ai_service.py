@@ -0,0 +1,147 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+from datetime import time
+
+from app.services.ai_service import AIService, BriefingResult, briefing_cache, make_briefing_cache_key
+from app.models.schedule import Schedule
+
+@pytest.fixture(autouse=True)
+def clear_briefing_cache():
+    briefing_cache.clear()
+    yield
+    briefing_cache.clear()
+
+def test_briefing_cache_key_is_normalized():
+    """
+    일정 순서나 제목 앞뒤 공백이 달라도 같은 일정 구성이면 같은 캐시 키가 나와야 한다.
+    """
+    a = [
+        Schedule(title="팀 회의", start_time=time(9, 0), end_time=time(10, 0)),
+        Schedule(title="점심", start_time=time(12, 0), end_time=time(13, 0)),
+    ]
+    b = [
+        Schedule(title="점심 ", start_time=time(12, 0), end_time=time(13, 0)),
+        Schedule(title="팀 회의", start_time=time(9, 0), end_time=time(10, 0)),
+    ]
+    c = [Schedule(title="팀 회의", start_time=time(9, 0), end_time=time(11, 0))]
+    
+    assert make_briefing_cache_key(a) == make_briefing_cache_key(b)
+    assert make_briefing_cache_key(a) != make_briefing_cache_key(c)
+
+@pytest.mark.asyncio
+async def test_generate_briefing_uses_cache():
+    """
+    같은 일정 구성으로 브리핑을 다시 요청하면 LLM을 호출하지 않고 캐시된 문구를 반환해야 한다.
+    동시에 들어온 같은 요청도 LLM은 한 번만 호출되어야 한다.
+    """
+    service = AIService()
+    
+    async def slow_chat(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"message": {"content": "좋은 아침입니다!"}}
+    
+    service._send_chat_request = AsyncMock(side_effect=slow_chat)
+    schedules = [Schedule(title="팀 회의", start_time=time(9, 0), end_time=time(10, 0))]
+    
+    results = await asyncio.gather(
+        service.generate_briefing(schedules),
+        service.generate_briefing(schedules),
+    )
+    cached = await service.generate_briefing(schedules)
+    
+    assert results == [BriefingResult("좋은 아침입니다!")] * 2
+    assert cached == BriefingResult("좋은 아침입니다!")
+    assert service._send_chat_request.call_count == 1
+    assert briefing_cache.hits >= 1
+
+@pytest.mark.asyncio
+async def test_generate_briefing_does_not_cache_fallback():
+    """
+    LLM 호출에 실패한 경우의 대체 문구는 used_fallback으로 표시하고, 캐시에 저장하지 않아야 한다.
+    """
+    service = AIService()
+    service._send_chat_request = AsyncMock(side_effect=Exception("Connection Error"))
+    schedules = [Schedule(title="팀 회의", start_time=time(9, 0), end_time=time(10, 0))]
+    
+    result = await service.generate_briefing(schedules)
+    
+    assert "1개의 일정" in result.content
+    assert result.used_fallback is True
+    assert len(briefing_cache) == 0
+
+@pytest.mark.asyncio
+async def test_process_chat_small_talk_skips_router():
+    """
+    명백한 잡담은 LLM 라우터를 호출하지 않고 AIAgent가 바로 응답해야 한다.
+    """
+    with patch("app.services.ai_service.AIRouter"), patch("app.services.ai_agent.ChatOllama"):
+        service = AIService(chat_repo=AsyncMock())
+    service.ai_router.route_request = AsyncMock()
+    service.ai_agent.run = AsyncMock(return_value="안녕하세요!")
+    
+    result = await service.process_chat(1, "안녕")
+    
+    assert result == "안녕하세요!"
+    service.ai_router.route_request.assert_not_called()
+    service.ai_agent.run.assert_called_once_with(1, "안녕")
+
+@pytest.mark.asyncio
+async def test_process_chat_single_pass_uses_router_reply():
+    """
+    single-pass 모드에서는 GeneralChatTool의 response를 그대로 반환하고 저장하며, AIAgent를 호출하지 않아야 한다.
+    """
+    from langchain_core.messages import AIMessage
+    
+    with patch("app.services.ai_service.AIRouter"), patch("app.services.ai_agent.ChatOllama"):
+        service = AIService(chat_repo=AsyncMock())
+    history = [AIMessage(content="이전 답변")]
+    service.ai_agent.load_history = AsyncMock(return_value=history)
+    service.ai_agent.run = AsyncMock()
+    service.memory_service.save_context = AsyncMock()
+    service.ai_router.route_request = AsyncMock(return_value=AIMessage(
+        content="",
+        tool_calls=[{"name": "GeneralChatTool", "args": {"response": "오늘 날씨는 맑아요."}, "id": "1"}]
+    ))
+    
+    with patch("app.services.ai_service.settings.AI_CHAT_MODE", "single_pass"):
+        result = await service.process_chat(1, "날씨 어때?")
+    
+    assert result == "오늘 날씨는 맑아요."
+    service.ai_router.route_request.assert_called_once_with("날씨 어때?", history=history)
+    service.ai_agent.run.assert_not_called()
+    service.memory_service.save_context.assert_called_once_with(
+        user_id = 1,
+        inputs = {"input": "날씨 어때?"},
+        outputs = {"output": "오늘 날씨는 맑아요."}
+    )
+
+@pytest.mark.asyncio
+async def test_process_chat_two_pass_calls_agent():
+    """
+    two-pass 모드에서는 라우터의 답변을 버리고 AIAgent가 다시 답변해야 한다.
+    """
+    from langchain_core.messages import AIMessage
+    
+    with patch("app.services.ai_service.AIRouter"), patch("app.services.ai_agent.ChatOllama"):
+        service = AIService(chat_repo=AsyncMock())
+    service.ai_agent.run = AsyncMock(return_value="에이전트 답변")
+    service.ai_router.route_request = AsyncMock(return_value=AIMessage(content="라우터 답변"))
+    
+    with patch("app.services.ai_service.settings.AI_CHAT_MODE", "two_pass"):
+        result = await service.process_chat(1, "날씨 어때?")
+    
+    assert result == "에이전트 답변"
+    service.ai_router.route_request.assert_called_once_with("날씨 어때?", history=None)
+
+def test_ai_services_share_llm_runtime():
+    """
+    요청마다 생성되는 AIService는 LLM 클라이언트와 Chain을 새로 만들지 않고 공용 LLMRuntime을 공유해야 한다.
+    """
+    first = AIService(chat_repo=AsyncMock())
+    second = AIService(chat_repo=AsyncMock())
+    
+    assert first.pool is second.pool
+    assert first.ai_router.pool is second.ai_router.pool is first.pool
+    assert first.ai_agent.pool is second.ai_agent.pool is first.pool
+    assert first.memory_service is not second.memory_service
@@ -112,20 +112,21 @@ class TestAuthServiceRefreshToken:
     async def test_refresh_access_token_success(self, auth_service, mock_user_repo, mock_refresh_token_repo, mocker):
         """Access Token 갱신 성공 케이스"""
         mocker.patch("app.core.security.verify_token", return_value={"jti" : "test_jti", "sub" : "test@example.com"})
-        mock_refresh_token_repo.get_by_jti.return_value = MockRefreshToken()
-        mock_user_repo.get_by_email.return_value = MockUser()
+        mock_refresh_token_repo.get_state.return_value = MockRefreshToken()
+        mock_user_repo.get_cached.return_value = MockUser()
         mocker.patch("app.core.security.create_access_token", return_value="new_access_token")
         
         response = await auth_service.refresh_access_token("valid_refresh_token")
         
         assert response.access_token == "new_access_token"
-        mock_refresh_token_repo.get_by_jti.assert_called_once_with("test_jti")
-        mock_user_repo.get_by_email.assert_called_once_with("test@example.com")
+        mock_refresh_token_repo.get_state.assert_called_once_with("test_jti")
+        mock_user_repo.get_cached.assert_called_once_with(1)
+        mock_user_repo.get_by_email.assert_not_called()
         
     async def test_refresh_fail_revoked_token(self, auth_service, mock_refresh_token_repo, mocker):
         """Access Token 갱신 실패 - 무효화된 토큰 사용"""
         mocker.patch("app.core.security.verify_token", return_value={"jti" : "revoked_jti", "sub" : "test@example.com"})
-        mock_refresh_token_repo.get_by_jti.return_value = MockRefreshToken(is_revoked=True)
+        mock_refresh_token_repo.get_state.return_value = MockRefreshToken(is_revoked=True)
         
         with pytest.raises(CredentialException, match="보안 위협 감지로 모든 세션이 종료되었습니다."):
             await auth_service.refresh_access_token("revoked_refresh_token")
@@ -133,7 +134,7 @@ class TestAuthServiceRefreshToken:
     async def test_refresh_fail_token_not_in_db(self, auth_service, mock_refresh_token_repo, mocker):
         """Access Token 갱신 실패 - DB에 존재하지 않는 토큰"""
         mocker.patch("app.core.security.verify_token", return_value={"jti" : "unknown_jti", "sub" : "test@example.com"})
-        mock_refresh_token_repo.get_by_jti.return_value = None
+        mock_refresh_token_repo.get_state.return_value = None
         
         with pytest.raises(CredentialException, match="토큰이 무효화되었거나 존재하지 않습니다."):
             await auth_service.refresh_access_token("unknown_refresh_token")
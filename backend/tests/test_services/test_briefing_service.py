@@ -5,7 +5,8 @@ from datetime import time
 
 from app.repositories.schedule_repo import ScheduleRepository
 from app.repositories.notification_repo import NotificationRepository
-from app.services.briefing_service import BriefingService
+from app.services.ai_service import BriefingResult
+from app.services.briefing_service import BriefingService, BriefingStatus
 from app.models.schedule import Schedule
 
 @pytest.fixture
@@ -44,7 +45,7 @@ async def test_create_briefing_with_schedules(
         Schedule(title="Lunch", start_time=time(12, 0), end_time=time(13, 0))
     ]
     
-    mock_ai_service.generate_briefing.return_value = "오전 미팅과 점심 약속이 있습니다."
+    mock_ai_service.generate_briefing.return_value = BriefingResult("오전 미팅과 점심 약속이 있습니다.")
     
     # 브리핑 생성
     await bridfing_service.create_daily_briefing(user_id=test_user.id)
@@ -58,4 +59,55 @@ async def test_create_briefing_with_schedules(
     
     call_args = mock_notification_repo.create.call_args
     assert call_args.kwargs['content'] == "오전 미팅과 점심 약속이 있습니다."
-    assert call_args.kwargs['type'] == "morning_briefing"
\ No newline at end of file
+    assert call_args.kwargs['type'] == "morning_briefing"
+
+@pytest.mark.asyncio
+async def test_create_daily_briefings_bulk(
+    mock_schedule_repo,
+    mock_notification_repo,
+    mock_ai_service
+):
+    """
+    [시나리오]
+
+    1. 사용자 3명 중 2명만 오늘 일정이 있다.
+    2. 일정은 쿼리 한 번으로 조회되고, AI는 일정이 있는 사용자에 대해서만 호출된다.
+    3. 알림은 bulk_create 한 번으로 3건 모두 저장된다.
+    4. LLM 실패로 대체 문구를 사용한 사용자는 FALLBACK으로 구분된다.
+    """
+    briefing_service = BriefingService(
+        schedule_repo = mock_schedule_repo,
+        notification_repo = mock_notification_repo,
+        ai_service = mock_ai_service
+    )
+    
+    mock_schedule_repo.get_schedules_by_users_and_date.return_value = [
+        Schedule(user_id=1, title="Meeting", start_time=time(10, 0), end_time=time(11, 0)),
+        Schedule(user_id=1, title="Lunch", start_time=time(12, 0), end_time=time(13, 0)),
+        Schedule(user_id=2, title="Gym", start_time=time(19, 0), end_time=time(20, 0)),
+    ]
+    mock_ai_service.generate_briefing.side_effect = [
+        BriefingResult("AI 브리핑"),
+        BriefingResult("오늘 총 1개의 일정이 있습니다.", used_fallback=True),
+    ]
+    mock_notification_repo.bulk_create.return_value = 3
+    
+    outcomes = await briefing_service.generate_daily_briefings([1, 2, 3])
+    await briefing_service.save_daily_briefings(outcomes)
+    
+    # 검증
+    assert [outcome.status for outcome in outcomes] == [
+        BriefingStatus.SUCCESS, BriefingStatus.FALLBACK, BriefingStatus.SUCCESS
+    ]
+    mock_schedule_repo.get_schedules_by_users_and_date.assert_called_once()
+    mock_schedule_repo.get_schedules_by_user_and_date.assert_not_called()
+    assert mock_ai_service.generate_briefing.call_count == 2
+    
+    first_call_schedules = mock_ai_service.generate_briefing.call_args_list[0].args[0]
+    assert [s.title for s in first_call_schedules] == ["Meeting", "Lunch"]
+    
+    mock_notification_repo.bulk_create.assert_called_once()
+    notifications = mock_notification_repo.bulk_create.call_args.args[0]
+    assert [n["user_id"] for n in notifications] == [1, 2, 3]
+    assert notifications[0]["content"] == "AI 브리핑"
+    assert all(n["type"] == "morning_briefing" for n in notifications)
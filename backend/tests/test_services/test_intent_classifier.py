@@ -0,0 +1,49 @@
+import pytest
+from app.services.intent_classifier import IntentClassifier
+
+@pytest.mark.parametrize("message", ["안녕", "고마워!", "안녕하세요~", "ㅎㅎ", "감사합니다."])
+def test_small_talk_is_classified_without_llm(message):
+    """명백한 잡담은 높은 신뢰도로 small_talk로 분류되어야 한다."""
+    decision = IntentClassifier().classify(message)
+    
+    assert decision.intent == "small_talk"
+    assert decision.needs_llm_router is False
+    assert decision.confidence >= 0.75
+
+@pytest.mark.parametrize("message", [
+    "내일 점심 약속 잡아줘",
+    "회의 취소해줘",
+    "오후 3시로 바꿔",
+    "12월 25일 파티 추가",
+    "안녕, 내일 일정 알려줘",
+])
+def test_schedule_like_text_goes_to_llm_router(message):
+    """일정 관련 동사/명사/시간 표현이 있으면 LLM 라우터로 보내야 한다."""
+    decision = IntentClassifier().classify(message)
+    
+    assert decision.intent == "schedule"
+    assert decision.needs_llm_router is True
+
+def test_ambiguous_text_goes_to_llm_router():
+    """판단이 어려운 문장은 LLM 라우터로 보내야 한다."""
+    classifier = IntentClassifier()
+    
+    assert classifier.classify("날씨 어때?").needs_llm_router is True
+    assert classifier.classify("요즘 읽을 만한 책을 하나 추천해 줄 수 있을까요?").needs_llm_router is True
+
+@pytest.mark.parametrize("message", ["응", "네!", "그래", "좋아", "알겠어", "오케이", "OK"])
+def test_confirmation_goes_to_llm_router(message):
+    """확인/동의 표현은 직전 질문에 대한 답일 수 있으므로 잡담으로 처리하지 않아야 한다."""
+    decision = IntentClassifier().classify(message)
+    
+    assert decision.intent == "ambiguous"
+    assert decision.needs_llm_router is True
+
+def test_decision_counts():
+    """분류 결과별 결정 횟수가 집계되어야 한다."""
+    classifier = IntentClassifier()
+    classifier.classify("안녕")
+    classifier.classify("고마워")
+    classifier.classify("회의 잡아줘")
+    
+    assert classifier.stats() == {"small_talk": 2, "schedule": 1}
@@ -0,0 +1,144 @@
+import asyncio
+import pytest
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock
+
+from app.config import settings
+from app.core.retry import get_retry_metrics
+from app.models.schedule import Schedule
+from app.services.ai_service import AIService, briefing_cache
+from app.services.ai_router import AIRouter
+from app.services.llm_dispatcher import LLMDispatcher, LLMPriority
+from app.services.ollama_pool import OllamaBackend, OllamaPool
+
+def _dispatcher(total: int, interactive: int | None = None, batch: int | None = None) -> LLMDispatcher:
+    return LLMDispatcher(
+        max_concurrency=total,
+        class_limits={
+            LLMPriority.INTERACTIVE: interactive or total,
+            LLMPriority.BATCH: batch or total,
+        },
+    )
+
+@pytest.mark.asyncio
+async def test_interactive_waiters_are_served_before_batch():
+    """자리가 나면 먼저 기다리던 배치보다 대화(interactive) 요청이 먼저 자리를 얻어야 한다."""
+    dispatcher = _dispatcher(total=1)
+    order: list[str] = []
+    
+    await dispatcher.acquire(LLMPriority.BATCH)
+    
+    async def _call(priority: LLMPriority):
+        async with dispatcher.slot(priority):
+            order.append(priority.value)
+    
+    batch_task = asyncio.create_task(_call(LLMPriority.BATCH))
+    await asyncio.sleep(0)
+    interactive_task = asyncio.create_task(_call(LLMPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    
+    stats = dispatcher.stats()
+    assert stats["batch"]["waiting"] == 1
+    assert stats["interactive"]["waiting"] == 1
+    
+    dispatcher.release(LLMPriority.BATCH)
+    await asyncio.gather(batch_task, interactive_task)
+    
+    assert order == ["interactive", "batch"]
+    stats = dispatcher.stats()
+    assert stats["interactive"]["admitted"] == 1
+    assert stats["batch"]["admitted"] == 2
+    assert stats["batch"]["max_wait_seconds"] > 0
+
+@pytest.mark.asyncio
+async def test_batch_cap_keeps_capacity_for_interactive():
+    """배치는 클래스 상한까지만 실행되고, 남은 자리는 대화 요청이 바로 사용할 수 있어야 한다."""
+    dispatcher = _dispatcher(total=2, batch=1)
+    
+    await dispatcher.acquire(LLMPriority.BATCH)
+    second_batch = asyncio.create_task(dispatcher.acquire(LLMPriority.BATCH))
+    await asyncio.sleep(0)
+    assert not second_batch.done()
+    
+    # 배치가 기다리고 있어도 대화 요청은 남는 자리에서 바로 시작
+    await asyncio.wait_for(dispatcher.acquire(LLMPriority.INTERACTIVE), timeout=1)
+    assert dispatcher.running == 2
+    
+    dispatcher.release(LLMPriority.BATCH)
+    await asyncio.wait_for(second_batch, timeout=1)
+    assert dispatcher.stats()["batch"]["running"] == 1
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed_from_queue():
+    """대기 중 취소된 요청은 대기열에서 제거되고 자리를 차지하지 않아야 한다."""
+    dispatcher = _dispatcher(total=1)
+    await dispatcher.acquire(LLMPriority.INTERACTIVE)
+    
+    waiter = asyncio.create_task(dispatcher.acquire(LLMPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    
+    assert dispatcher.stats()["interactive"]["waiting"] == 0
+    dispatcher.release(LLMPriority.INTERACTIVE)
+    assert dispatcher.running == 0
+
+@pytest.mark.asyncio
+async def test_call_sites_use_priority_classes():
+    """브리핑은 배치, 라우터 호출은 대화 우선순위로 스케줄러를 거쳐야 한다."""
+    briefing_cache.clear()
+    dispatcher = _dispatcher(total=2)
+    
+    service = AIService()
+    service.dispatcher = dispatcher
+    service.pool = OllamaPool([OllamaBackend(
+        "http://ollama.test",
+        client=MagicMock(chat=AsyncMock(return_value={"message": {"content": "좋은 아침입니다!"}}))
+    )])
+    schedules = [Schedule(title="스케줄러 점검", start_time=time(7, 0), end_time=time(8, 0))]
+    assert (await service.generate_briefing(schedules)).content == "좋은 아침입니다!"
+    
+    router = AIRouter(chain=MagicMock(ainvoke=AsyncMock(return_value="routed")), dispatcher=dispatcher)
+    assert await router.route_request("안녕") == "routed"
+    
+    stats = dispatcher.stats()
+    assert stats["batch"]["admitted"] == 1
+    assert stats["interactive"]["admitted"] == 1
+    assert dispatcher.running == 0
+    briefing_cache.clear()
+
+@pytest.mark.asyncio
+async def test_batch_call_timeout_excludes_slot_wait(monkeypatch):
+    """
+    배치 호출은 자리를 기다린 시간 때문에 타임아웃되지 않고,
+    자리를 얻은 뒤의 시도만 LLM_BATCH_ATTEMPT_TIMEOUT_SECONDS로 제한되어야 한다.
+    """
+    monkeypatch.setattr(settings, "LLM_BATCH_ATTEMPT_TIMEOUT_SECONDS", 0.1)
+    dispatcher = _dispatcher(total=1)
+    chat = AsyncMock(return_value={"message": {"content": "좋은 아침입니다!"}})
+    
+    service = AIService()
+    service.dispatcher = dispatcher
+    service.pool = OllamaPool([OllamaBackend("http://ollama.test", client=MagicMock(chat=chat))])
+    
+    # 대화 요청이 시도별 타임아웃보다 오래 자리를 점유
+    await dispatcher.acquire(LLMPriority.INTERACTIVE)
+    batch_call = asyncio.create_task(
+        service._send_chat_request(model="test", messages=[], priority=LLMPriority.BATCH)
+    )
+    await asyncio.sleep(0.3)
+    assert not batch_call.done()
+    dispatcher.release(LLMPriority.INTERACTIVE)
+    
+    response = await asyncio.wait_for(batch_call, timeout=1)
+    assert response["message"]["content"] == "좋은 아침입니다!"
+    assert get_retry_metrics("llm_chat_batch").stats()["deadline_exceeded"] == 0
+    
+    # 자리를 얻은 뒤 응답이 없으면 시도별 타임아웃으로 실패 (재시도 후 포기)
+    async def _hang(**kwargs):
+        await asyncio.sleep(10)
+    chat.side_effect = _hang
+    with pytest.raises(asyncio.TimeoutError):
+        await service._send_chat_request(model="test", messages=[], priority=LLMPriority.BATCH)
+    assert dispatcher.running == 0
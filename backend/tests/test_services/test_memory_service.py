@@ -1,11 +1,20 @@
 import pytest
-from unittest.mock import AsyncMock
-from app.services.memory_service import MemoryService
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import BackgroundTasks
+from app.services.memory_service import MemoryService, persist_chat_messages
+from app.repositories.chat_repo import ChatRepository
+from app.db.hooks import drain_transaction_callbacks
 from app.models.chat import ChatHistory, ChatRole
 
 # 최근 k개의 대화만 유지하는 메모리 클래스
 from langchain.memory import ConversationBufferWindowMemory
 
+def _mock_chat_repo() -> AsyncMock:
+    """커밋/롤백 콜백 등록(session.info)이 가능한 ChatRepository 모의 객체"""
+    mock_chat_repo = AsyncMock()
+    mock_chat_repo.session = MagicMock(info={})
+    return mock_chat_repo
+
 @pytest.mark.asyncio
 async def test_get_memory_loads_history():
     """
@@ -46,7 +55,7 @@ async def test_save_context_saves_to_db():
     """
     LangChain 스타일의 입/출력을 받아 DB에 저장하는 테스트
     """
-    mock_chat_repo = AsyncMock()
+    mock_chat_repo = _mock_chat_repo()
     service = MemoryService(mock_chat_repo)
     user_id = 1
     
@@ -55,16 +64,87 @@ async def test_save_context_saves_to_db():
     
     await service.save_context(user_id, inputs, outputs)
     
-    assert mock_chat_repo.create.call_count == 2
-    
-    mock_chat_repo.create.assert_any_call(
-        user_id = user_id,
-        role = ChatRole.USER,
-        content = "내일 날씨 어때?"
+    # 질문/응답 한 쌍을 한 번의 bulk INSERT로 저장
+    mock_chat_repo.create.assert_not_called()
+    mock_chat_repo.bulk_append.assert_awaited_once_with(
+        user_id,
+        [(ChatRole.USER, "내일 날씨 어때?"), (ChatRole.ASSISTANT, "맑을 예정입니다.")]
     )
+
+@pytest.mark.asyncio
+async def test_save_context_defers_to_background_tasks():
+    """
+    BackgroundTasks가 주어지면 요청 중에는 DB에 쓰지 않고 응답 이후 작업으로 등록해야 한다.
+    """
+    mock_chat_repo = AsyncMock()
+    background_tasks = BackgroundTasks()
+    service = MemoryService(mock_chat_repo, background_tasks=background_tasks)
+    
+    await service.save_context(1, {"input": "안녕"}, {"output": "안녕하세요!"})
+    
+    mock_chat_repo.bulk_append.assert_not_called()
+    assert len(background_tasks.tasks) == 1
+    task = background_tasks.tasks[0]
+    assert task.func is persist_chat_messages
+    assert task.args == (1, [(ChatRole.USER, "안녕"), (ChatRole.ASSISTANT, "안녕하세요!")])
+
+@pytest.mark.asyncio
+async def test_get_memory_uses_cache_after_first_load():
+    """
+    처음 조회 시에만 DB를 읽고, 이후 조회와 save_context로 추가된 대화는 캐시에서 제공되어야 한다.
+    """
+    mock_chat_repo = _mock_chat_repo()
+    user_id = 1
+    mock_chat_repo.get_recent_chats.return_value = [
+        ChatHistory(id=1, user_id=user_id, role=ChatRole.USER.value, content="안녕", created_at="2025-12-19 10:00:00")
+    ]
+    
+    service = MemoryService(mock_chat_repo)
+    
+    await service.get_memory(user_id)
+    await service.save_context(user_id, {"input": "내일 일정 알려줘"}, {"output": "내일은 일정이 없습니다."})
+    memory = await service.get_memory(user_id)
+    
+    # DB 조회는 첫 번째 get_memory에서 한 번만
+    assert mock_chat_repo.get_recent_chats.await_count == 1
+    
+    messages = memory.chat_memory.messages
+    assert [m.content for m in messages] == ["안녕", "내일 일정 알려줘", "내일은 일정이 없습니다."]
+    assert [m.type for m in messages] == ["human", "human", "ai"]
+
+@pytest.mark.asyncio
+async def test_get_memory_reloads_after_invalidate():
+    """
+    캐시가 무효화되면 다음 조회에서 다시 DB를 읽어야 한다.
+    """
+    mock_chat_repo = AsyncMock()
+    mock_chat_repo.get_recent_chats.return_value = []
+    service = MemoryService(mock_chat_repo)
+    
+    await service.get_memory(1)
+    await service.history_cache.invalidate(1)
+    await service.get_memory(1)
+    
+    assert mock_chat_repo.get_recent_chats.await_count == 2
+
+@pytest.mark.asyncio
+async def test_save_context_rollback_removes_cached_turn(db_session, test_user):
+    """
+    요청 트랜잭션 안에서 저장한 대화가 롤백되면 캐시에서도 제거되어야 하고,
+    커밋되면 다시 DB에서 캐시를 채울 수 있어야 한다.
+    """
+    service = MemoryService(ChatRepository(db_session))
+    await service.get_memory(test_user.id)
+    
+    await service.save_context(test_user.id, {"input": "롤백될 질문"}, {"output": "롤백될 답변"})
+    await db_session.rollback()
+    await drain_transaction_callbacks()
+    assert await service.history_cache.get(test_user.id) is None
+    
+    await service.save_context(test_user.id, {"input": "안녕"}, {"output": "안녕하세요!"})
+    await db_session.commit()
+    await drain_transaction_callbacks()
     
-    mock_chat_repo.create.assert_any_call(
-        user_id = user_id,
-        role = ChatRole.ASSISTANT,
-        content = "맑을 예정입니다."
-    )
\ No newline at end of file
+    memory = await service.get_memory(test_user.id)
+    assert [m.content for m in memory.chat_memory.messages] == ["안녕", "안녕하세요!"]
+    assert await service.history_cache.get(test_user.id) is not None
@@ -0,0 +1,207 @@
+"""
+OllamaPool 테스트 - 로컬에 띄운 가짜 Ollama HTTP 서버(/api/tags, /api/chat)를 대상으로
+헬스 체크, 최소 진행 요청 라우팅, 서킷 브레이커, 다른 서버로의 재시도/헤징을 확인
+"""
+import asyncio
+import json
+import socket
+import time
+import pytest
+import ollama
+
+from app.core.exceptions import AIConnectionError
+from app.services.ollama_pool import OllamaBackend, OllamaPool
+
+class FakeOllamaServer:
+    """요청마다 지정된 지연 후 서버 이름을 답변으로 돌려주는 최소 HTTP 서버"""
+    def __init__(self, name: str, delay: float = 0.0, healthy: bool = True):
+        self.name = name
+        self.delay = delay
+        self.healthy = healthy
+        self.chat_requests = 0
+        self._server: asyncio.base_events.Server | None = None
+        
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+    
+    async def __aenter__(self) -> "FakeOllamaServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+        
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *header_lines = head.decode().split("\r\n")
+        method, path, _ = request_line.split(" ", 2)
+        headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in header_lines if line)}
+        if int(headers.get("content-length", 0)):
+            await reader.readexactly(int(headers["content-length"]))
+        
+        if path == "/api/tags":
+            status, body = (200, {"models": []}) if self.healthy else (503, {"error": "unavailable"})
+        elif method == "POST" and path == "/api/chat":
+            self.chat_requests += 1
+            await asyncio.sleep(self.delay)
+            status, body = 200, {
+                "model": "test",
+                "created_at": "2025-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": self.name},
+                "done": True,
+            }
+        else:
+            status, body = 404, {"error": "not found"}
+        
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+        writer.close()
+
+def _dead_url() -> str:
+    """연결을 받지 않는 로컬 주소"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+def _backend(url: str) -> OllamaBackend:
+    return OllamaBackend(url, client=ollama.AsyncClient(host=url))
+
+async def _chat(backend: OllamaBackend) -> str:
+    response = await backend.client.chat(model="test", messages=[{"role": "user", "content": "hi"}])
+    return response["message"]["content"]
+
+@pytest.mark.asyncio
+async def test_failover_to_another_backend_and_circuit_breaker():
+    """
+    죽은 서버에서 연결 오류가 나면 다른 서버로 다시 요청하고,
+    연속 실패가 기준을 넘은 서버는 서킷이 열려 reset 시간 동안 요청을 받지 않아야 한다.
+    """
+    async with FakeOllamaServer("alive") as alive:
+        dead = _backend(_dead_url())
+        pool = OllamaPool([dead, _backend(alive.url)], failure_threshold=2, reset_timeout=0.2)
+        
+        for _ in range(2):
+            assert await pool.run(_chat) == "alive"
+        assert dead.failures == 2
+        assert pool.stats()[0]["circuit_open"] is True
+        
+        # 서킷이 열린 동안에는 죽은 서버를 시도하지 않음
+        await pool.run(_chat)
+        assert dead.requests == 2
+        
+        # reset 시간이 지나면 half-open 상태로 요청 하나를 다시 시도 (실패하면 다시 열림)
+        await asyncio.sleep(0.25)
+        assert await pool.run(_chat) == "alive"
+        assert dead.requests == 3
+        assert pool.stats()[0]["circuit_open"] is True
+        assert alive.chat_requests == 4
+
+@pytest.mark.asyncio
+async def test_least_outstanding_routing():
+    """동시에 들어온 요청은 진행 중인 요청이 적은 서버로 고르게 분산되어야 한다."""
+    async with FakeOllamaServer("a", delay=0.1) as a, FakeOllamaServer("b", delay=0.1) as b:
+        pool = OllamaPool([_backend(a.url), _backend(b.url)])
+        
+        results = await asyncio.gather(*(pool.run(_chat) for _ in range(4)))
+        
+        assert sorted(results) == ["a", "a", "b", "b"]
+        assert a.chat_requests == b.chat_requests == 2
+        assert all(stat["outstanding"] == 0 for stat in pool.stats())
+
+@pytest.mark.asyncio
+async def test_hedged_request_uses_faster_backend():
+    """첫 서버의 응답이 hedge_delay보다 늦으면 다른 서버에도 요청하여 먼저 온 응답을 사용해야 한다."""
+    async with FakeOllamaServer("slow", delay=2.0) as slow, FakeOllamaServer("fast") as fast:
+        pool = OllamaPool([_backend(slow.url), _backend(fast.url)], hedge_delay=0.05)
+        
+        started_at = time.perf_counter()
+        result = await pool.run(_chat)
+        
+        assert result == "fast"
+        assert time.perf_counter() - started_at < 1.0
+        assert pool.hedged == 1
+        # 진 요청은 취소되고 서버 장애로 기록되지 않음
+        assert pool.stats()[0]["failures"] == 0
+
+@pytest.mark.asyncio
+async def test_health_check_excludes_unhealthy_backends():
+    """
+    헬스 체크에 연속으로 기준 횟수만큼 실패한 서버만 라우팅에서 제외되고, 한 번 성공하면 다시 포함되어야 한다.
+    """
+    async with FakeOllamaServer("sick", healthy=False) as sick, FakeOllamaServer("ok") as ok:
+        pool = OllamaPool([_backend(sick.url), _backend(ok.url), _backend(_dead_url())], health_check_failure_threshold=2)
+        
+        # 한 번 실패한 것만으로는 제외하지 않음
+        await pool.check_health()
+        assert [stat["healthy"] for stat in pool.stats()] == [True, True, True]
+        
+        await pool.check_health()
+        assert [stat["healthy"] for stat in pool.stats()] == [False, True, False]
+        
+        assert await pool.run(_chat) == "ok"
+        assert sick.chat_requests == 0
+        
+        sick.healthy = True
+        await pool.check_health()
+        assert [stat["healthy"] for stat in pool.stats()] == [True, True, False]
+
+@pytest.mark.asyncio
+async def test_all_unhealthy_falls_back_to_least_recently_failed_backend():
+    """
+    모든 서버가 헬스 체크에서 제외되면 가장 오래 전에 실패한 서버로 요청을 보내고(fail-open),
+    실제 요청까지 실패하는 경우에만 AIConnectionError가 발생해야 한다.
+    """
+    async with FakeOllamaServer("a", healthy=False) as a, FakeOllamaServer("b") as b:
+        pool = OllamaPool([_backend(a.url), _backend(b.url)], health_check_failure_threshold=1)
+        
+        await pool.check_health()
+        b.healthy = False
+        await pool.check_health()
+        assert [stat["healthy"] for stat in pool.stats()] == [False, False]
+        
+        # 같은 회차에 실패했으면 연속 실패 횟수가 적은(더 최근까지 정상이던) 서버를 선택
+        assert await pool.run(_chat) == "b"
+        
+        # 서버가 하나뿐이면 헬스 체크 결과와 관계없이 요청을 보냄
+        single = OllamaPool([_backend(a.url)], health_check_failure_threshold=1)
+        await single.check_health()
+        assert single.stats()[0]["healthy"] is False
+        assert await single.run(_chat) == "a"
+    
+    dead = OllamaPool([_backend(_dead_url())], health_check_failure_threshold=1)
+    await dead.check_health()
+    with pytest.raises(AIConnectionError):
+        await dead.run(_chat)
+
+@pytest.mark.asyncio
+async def test_stream_fails_over_only_before_first_chunk():
+    """스트리밍은 첫 조각을 받기 전에 실패한 경우에만 다른 서버로 다시 요청해야 한다."""
+    first, second = OllamaBackend("http://first", client=None), OllamaBackend("http://second", client=None)
+    pool = OllamaPool([first, second])
+    
+    async def _fail_before_start(backend: OllamaBackend):
+        if backend is first:
+            raise ConnectionError("refused")
+        for token in ("안녕", "하세요"):
+            yield token
+    
+    assert [chunk async for chunk in pool.stream(_fail_before_start)] == ["안녕", "하세요"]
+    assert first.failures == 1
+    
+    async def _fail_mid_stream(backend: OllamaBackend):
+        yield backend.url
+        raise ConnectionError("reset")
+    
+    received = []
+    with pytest.raises(ConnectionError):
+        async for chunk in pool.stream(_fail_mid_stream):
+            received.append(chunk)
+    assert len(received) == 1
@@ -0,0 +1,121 @@
+"""
+월별 목록 직렬화 경로 비교 (300개 일정)
+- ORM: Schedule 객체 조회(Identity Map) -> ScheduleResponse 검증/직렬화
+- Projection: 응답 컬럼만 Row로 조회 -> orjson 일괄 직렬화
+- 결과 JSON이 같은지는 항상 확인
+- CPU 시간/메모리 할당 비교는 실행 환경에 따라 흔들리므로 benchmark 마커로 분리 (pytest -m benchmark로 실행)
+"""
+import json
+import time as timer
+import tracemalloc
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.schedule import Schedule
+from app.models.user import User
+from app.repositories.schedule_repo import ScheduleRepository
+from app.schemas.schedule import SCHEDULE_RESPONSE_FIELDS, ScheduleResponse, schedule_rows_to_dicts, dumps_json
+
+EVENT_COUNT = 300
+ROUNDS = 5
+
+_schedule_list_adapter = TypeAdapter(list[ScheduleResponse])
+
+async def _orm_path(session: AsyncSession, repo: ScheduleRepository, user_id: int) -> bytes:
+    session.expunge_all()
+    schedules = await repo.get_schedules_by_user_and_month(user_id, 2025, 12)
+    # FastAPI response_model과 같은 처리: ORM 객체 검증 -> 직렬화
+    return _schedule_list_adapter.dump_json(_schedule_list_adapter.validate_python(schedules))
+
+async def _projection_path(session: AsyncSession, repo: ScheduleRepository, user_id: int) -> bytes:
+    session.expunge_all()
+    rows = await repo.get_schedule_rows_by_user_and_month(user_id, 2025, 12)
+    return dumps_json(schedule_rows_to_dicts(rows))
+
+async def _measure(path, *args) -> tuple[float, int]:
+    """(ROUNDS회 CPU 시간, 1회 최대 메모리 할당량)"""
+    started_at = timer.process_time()
+    for _ in range(ROUNDS):
+        await path(*args)
+    cpu = timer.process_time() - started_at
+    
+    tracemalloc.start()
+    await path(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+async def _seed_schedules(db_session: AsyncSession, user: User) -> None:
+    db_session.add_all([
+        Schedule(
+            user_id=user.id,
+            title=f"일정 {i}",
+            content="벤치마크용 일정",
+            date=date(2025, 12, 1) + timedelta(days=i % 31),
+            start_time=time(i % 24, 0),
+            end_time=time(i % 24, 30),
+        )
+        for i in range(EVENT_COUNT)
+    ])
+    await db_session.commit()
+
+@pytest.mark.asyncio
+async def test_month_projection_matches_orm_response(db_session: AsyncSession, test_user: User):
+    await _seed_schedules(db_session, test_user)
+    repo = ScheduleRepository(db_session)
+    
+    orm_body = await _orm_path(db_session, repo, test_user.id)
+    projection_body = await _projection_path(db_session, repo, test_user.id)
+    
+    # 같은 응답 (키 순서와 값 형식까지 동일)
+    assert projection_body == orm_body
+    assert len(json.loads(projection_body)) == EVENT_COUNT
+
+def test_projection_serializer_matches_schema_for_edge_values():
+    """
+    Projection 직렬화 결과는 ScheduleResponse.model_dump_json()과 바이트 단위로 같아야 한다.
+    (제목 공백 정규화, 마이크로초, UTC/다른 시간대/naive datetime, 유니코드/제어 문자, content 없음)
+    """
+    ScheduleRow = namedtuple("ScheduleRow", SCHEDULE_RESPONSE_FIELDS)
+    base = dict(
+        id=1,
+        user_id=7,
+        title="회의",
+        date=date(2025, 12, 31),
+        content="내용",
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        created_at=datetime(2025, 12, 1, 8, 30),
+        updated_at=datetime(2025, 12, 1, 8, 30),
+    )
+    edge_cases = [
+        {},
+        {"title": "  앞뒤 공백 제목 \t"},
+        {"content": None},
+        {"title": "이모지 🎉 \"따옴표\" \\ 역슬래시", "content": "줄바꿈\n탭\t제어\x01 \u2028 </script>"},
+        {"start_time": time(0, 0, 0, 1), "end_time": time(23, 59, 59, 999999)},
+        {"created_at": datetime(2025, 12, 1, 8, 30, 0, 123456, tzinfo=timezone.utc),
+         "updated_at": datetime(2025, 12, 1, 17, 30, 0, 500, tzinfo=timezone(timedelta(hours=9)))},
+        {"created_at": datetime(2025, 1, 1, tzinfo=timezone.utc), "updated_at": datetime(2025, 1, 1, 0, 0, 0, 1)},
+    ]
+    
+    for overrides in edge_cases:
+        row = ScheduleRow(**{**base, **overrides})
+        expected = ScheduleResponse.model_validate(row).model_dump_json().encode()
+        assert dumps_json(schedule_rows_to_dicts([row])[0]) == expected, overrides
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_month_projection_benchmark(db_session: AsyncSession, test_user: User):
+    await _seed_schedules(db_session, test_user)
+    repo = ScheduleRepository(db_session)
+    
+    orm_cpu, orm_peak = await _measure(_orm_path, db_session, repo, test_user.id)
+    projection_cpu, projection_peak = await _measure(_projection_path, db_session, repo, test_user.id)
+    
+    assert projection_cpu < orm_cpu
+    assert projection_peak < orm_peak
@@ -1,16 +1,22 @@
 import pytest
-from unittest.mock import AsyncMock
+from datetime import date, datetime, time
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 
 from app.services.schedule_service import ScheduleService
+from app.repositories.schedule_repo import ScheduleRepository
+from app.db.hooks import drain_transaction_callbacks
+from app.core.month_view_cache import InMemoryMonthViewCache, MonthView
 from app.models.user import User
 from app.models.schedule import Schedule
 from app.schemas.schedule import ScheduleUpdate, ScheduleCreate
 
 @pytest.fixture
 def mock_schedule_repo():
-    """가짜 ScheduleRepository 객체 생성"""
-    return AsyncMock()
+    """가짜 ScheduleRepository 객체 생성 (커밋 후 무효화 등록을 위한 session.info 포함)"""
+    mock_repo = AsyncMock()
+    mock_repo.session = MagicMock(info={})
+    return mock_repo
 
 @pytest.fixture
 def schedule_service(mock_schedule_repo):
@@ -134,4 +140,90 @@ async def test_get_schedule_by_id_not_found(mocker):
     with pytest.raises(HTTPException) as exc_info:
         await service.get_schedule_by_id(schedule_id=1, user=user)
 
-    assert exc_info.value.status_code == 404
\ No newline at end of file
+    assert exc_info.value.status_code == 404
+@pytest.mark.asyncio
+async def test_get_month_view_uses_cache(mock_schedule_repo, test_user):
+    """
+    월별 조회는 두 번째부터 캐시에서 반환되어 목록 조회/직렬화를 하지 않아야 한다.
+    프로세스 내 캐시는 적중해도 버전 조회로 ETag를 확인한다.
+    """
+    service = ScheduleService(mock_schedule_repo, month_view_cache=InMemoryMonthViewCache(maxsize=10, ttl=60))
+    mock_schedule_repo.get_month_version.return_value = (0, None)
+    mock_schedule_repo.get_schedule_rows_by_user_and_month.return_value = []
+    
+    first = await service.get_month_view(test_user, 2025, 12)
+    second = await service.get_month_view(test_user, 2025, 12)
+    
+    assert first == second
+    assert first.body == b"[]"
+    mock_schedule_repo.get_schedule_rows_by_user_and_month.assert_awaited_once()
+    assert mock_schedule_repo.get_month_version.await_count == 2
+
+@pytest.mark.asyncio
+async def test_get_month_view_rebuilds_stale_in_process_entry(mock_schedule_repo, test_user):
+    """다른 워커에서 일정이 바뀌어 버전이 달라지면 프로세스 내 캐시 항목을 버리고 다시 만들어야 한다."""
+    cache = InMemoryMonthViewCache(maxsize=10, ttl=60)
+    service = ScheduleService(mock_schedule_repo, month_view_cache=cache)
+    mock_schedule_repo.get_month_version.return_value = (0, None)
+    mock_schedule_repo.get_schedule_rows_by_user_and_month.return_value = []
+    stale = await service.get_month_view(test_user, 2025, 12)
+    
+    mock_schedule_repo.get_month_version.return_value = (1, datetime(2025, 12, 1, 9, 0))
+    fresh = await service.get_month_view(test_user, 2025, 12)
+    
+    assert fresh.etag != stale.etag
+    assert mock_schedule_repo.get_schedule_rows_by_user_and_month.await_count == 2
+    assert await cache.get(test_user.id, 2025, 12) == fresh
+
+@pytest.mark.asyncio
+async def test_schedule_change_invalidates_month_again_after_commit(db_session, test_user):
+    """커밋 전에 변경 전 응답으로 다시 채워진 캐시도 커밋 후에 무효화되어야 한다."""
+    cache = InMemoryMonthViewCache(maxsize=10, ttl=60)
+    service = ScheduleService(ScheduleRepository(db_session), month_view_cache=cache)
+    
+    await service.create_schedule(
+        ScheduleCreate(title="새 일정", date=date(2025, 12, 24), start_time=time(9, 0), end_time=time(10, 0)), test_user
+    )
+    # 커밋 전에 다른 요청이 변경 전 응답을 캐시에 넣은 상황
+    await cache.set(test_user.id, 2025, 12, MonthView(etag="stale", body=b"[]"))
+    
+    await db_session.commit()
+    await drain_transaction_callbacks()
+    assert await cache.get(test_user.id, 2025, 12) is None
+
+@pytest.mark.asyncio
+async def test_update_schedule_invalidates_old_and_new_month(mock_schedule_repo, test_user):
+    """일정 날짜를 다른 달로 옮기면 이전 달과 새 달의 캐시만 무효화되어야 한다."""
+    cache = InMemoryMonthViewCache(maxsize=10, ttl=60)
+    service = ScheduleService(mock_schedule_repo, month_view_cache=cache)
+    for month in (11, 12, 10):
+        await cache.set(test_user.id, 2025, month, MonthView(etag="e", body=b"[]"))
+    
+    schedule = Schedule(id=1, title="이동할 일정", user_id=test_user.id, date=date(2025, 11, 30))
+    mock_schedule_repo.get_schedule_by_id_and_user_id.return_value = schedule
+    mock_schedule_repo.update.return_value = schedule
+    
+    await service.update_schedule(1, ScheduleUpdate(date=date(2025, 12, 1)), test_user)
+    
+    assert await cache.get(test_user.id, 2025, 11) is None
+    assert await cache.get(test_user.id, 2025, 12) is None
+    assert await cache.get(test_user.id, 2025, 10) is not None
+
+@pytest.mark.asyncio
+async def test_create_and_delete_schedule_invalidate_month(mock_schedule_repo, test_user):
+    """생성/삭제 시 해당 일정이 속한 달의 캐시가 무효화되어야 한다."""
+    cache = InMemoryMonthViewCache(maxsize=10, ttl=60)
+    service = ScheduleService(mock_schedule_repo, month_view_cache=cache)
+    
+    await cache.set(test_user.id, 2025, 12, MonthView(etag="e", body=b"[]"))
+    await service.create_schedule(
+        ScheduleCreate(title="새 일정", date=date(2025, 12, 24), start_time=time(9, 0), end_time=time(10, 0)), test_user
+    )
+    assert await cache.get(test_user.id, 2025, 12) is None
+    
+    await cache.set(test_user.id, 2025, 12, MonthView(etag="e", body=b"[]"))
+    mock_schedule_repo.get_schedule_by_id_and_user_id.return_value = Schedule(
+        id=1, title="삭제할 일정", user_id=test_user.id, date=date(2025, 12, 24)
+    )
+    await service.delete_schedule(1, test_user)
+    assert await cache.get(test_user.id, 2025, 12) is None